@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+
+#   Benchmarks the File Copy Paths of the FileCopyWorker in MB/s.
+#
+#   Copies a Generated Source File into each Target Directory with a
+#   Serial read() / write() Loop, the Overlapped Ring Buffer Pipeline
+#   (with and without Inline Hashing) and the Kernel Copy Methods
+#   (copy_file_range / sendfile, Linux Only).
+#   Pass a Local Disk and a tmpfs Directory (/dev/shm) to Compare them.
+#
+#   Run with the Prism Python Interpreter (PRISM_ROOT set):
+#       python Benchmarks/bench_copyPaths.py /mnt/scratch /dev/shm > bench_output.txt
+
+
+import os
+import sys
+import errno
+import tempfile
+import argparse
+from time import perf_counter
+
+
+pluginPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SourceTab")
+sys.path.append(os.path.join(pluginPath, "Libs"))
+sys.path.insert(0, os.path.join(pluginPath, "PythonLibs"))
+sys.path.append(os.path.join(pluginPath, "PythonLibs", f"Python3{sys.version_info.minor}"))
+
+import SourceTab_Utils as Utils
+from CopyPipeline import CopyPipeline
+
+
+def copyBuffered(sourcePath:str, destPath:str, chunkSize:int, algorithm:str=None) -> None:
+    '''Serial Read then Write Loop (no Overlap)'''
+
+    hashObject = Utils.getHashObject(algorithm) if algorithm else None
+
+    with open(sourcePath, "rb") as fsrc, open(destPath, "wb") as fdst:
+        while chunk := fsrc.read(chunkSize):
+            fdst.write(chunk)
+            if hashObject:
+                hashObject.update(chunk)
+
+        fdst.flush()
+        os.fsync(fdst.fileno())
+
+
+def copyPipelined(sourcePath:str, destPath:str, pipeline:CopyPipeline, algorithm:str=None) -> None:
+    '''Same Ring Buffer Pipeline as the FileCopyWorker Buffered Copy'''
+
+    hashObject = Utils.getHashObject(algorithm) if algorithm else None
+
+    with open(sourcePath, "rb") as fsrc, open(destPath, "wb") as fdst:
+        pipeline.copy(fsrc, fdst, lambda: True, lambda size: None,
+                      hashObject=hashObject, fileSize=os.path.getsize(sourcePath))
+
+        fdst.flush()
+        os.fsync(fdst.fileno())
+
+
+def copyKernel(sourcePath:str, destPath:str, rangeSize:int, method:str) -> None:
+    '''Same Ranges as the FileCopyWorker Kernel Copy'''
+
+    with open(sourcePath, "rb") as fsrc, open(destPath, "wb") as fdst:
+        offset = 0
+        while copied := Utils.copyFileRange(fsrc.fileno(), fdst.fileno(), offset, rangeSize, method):
+            offset += copied
+
+        os.fsync(fdst.fileno())
+
+
+def makeSourceFile(sourceDir:str, sizeMB:int) -> str:
+    fd, sourcePath = tempfile.mkstemp(prefix="bench_copySource_", dir=sourceDir)
+
+    block = os.urandom(1024 * 1024)
+    with os.fdopen(fd, "wb") as f:
+        for _ in range(sizeMB):
+            f.write(block)
+
+    return sourcePath
+
+
+def dropSourceCache(sourcePath:str) -> None:
+    '''Cold Reads (Page Cache Dropped) where posix_fadvise is Available'''
+
+    with open(sourcePath, "rb") as f:
+        Utils.dropFileCache(f.fileno(), flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="File Copy Path Benchmark")
+    parser.add_argument("targets", nargs="*", help="Destination Directories (default: Temp Dir and /dev/shm)")
+    parser.add_argument("--source", default=tempfile.gettempdir(), help="Directory for the Generated Source File")
+    parser.add_argument("--size", type=int, default=512, help="Source File Size in MB")
+    parser.add_argument("--chunk", type=int, default=2, help="Buffered Chunk Size in MB (Transfer Chunk Size Setting)")
+    parser.add_argument("--buffers", type=int, default=4, help="Pipeline Buffer Count (Transfer Buffer Count Setting)")
+    parser.add_argument("--range", type=int, default=64, help="Kernel Copy Range Size in MB")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per Method (Best is Reported)")
+    parser.add_argument("--cold", action="store_true", help="Drop the Source from the Page Cache Before each Run")
+    args = parser.parse_args()
+
+    targets = args.targets or [tempfile.gettempdir()]
+    if not args.targets and os.path.isdir("/dev/shm"):
+        targets.append("/dev/shm")
+
+    #   Fastest Installed Algorithm (xxHash64 is Only Listed if Installed)
+    algorithm = Utils.HASH_ALGORITHMS[0]
+    chunkSize = args.chunk * 1024 * 1024
+    rangeSize = args.range * 1024 * 1024
+
+    pipeline = CopyPipeline(args.buffers, chunkSize)
+
+    methods = [("Buffered", lambda s, d: copyBuffered(s, d, chunkSize)),
+               (f"Buffered+{algorithm}", lambda s, d: copyBuffered(s, d, chunkSize, algorithm)),
+               ("Pipelined", lambda s, d: copyPipelined(s, d, pipeline)),
+               (f"Pipelined+{algorithm}", lambda s, d: copyPipelined(s, d, pipeline, algorithm))]
+    for method in Utils.KERNEL_COPY_METHODS:
+        methods.append((method, lambda s, d, m=method: copyKernel(s, d, rangeSize, m)))
+
+    if not Utils.hasKernelCopy():
+        print("Kernel Copy is not Available on this Platform: Only the Buffered Copy will Run\n")
+
+    sourcePath = makeSourceFile(args.source, args.size)
+    print(f"Source: {sourcePath} ({args.size} MB, {args.buffers} x {args.chunk} MB Buffers){'  (Cold Reads)' if args.cold else ''}\n")
+
+    try:
+        for target in targets:
+            destPath = os.path.join(target, "bench_copyDest.bin")
+            print(f"Target: {target}")
+            print(f"{'Method':>20} {'Best (s)':>10} {'MB/s':>10}")
+
+            for name, copyFunc in methods:
+                times = []
+                try:
+                    for _ in range(args.repeat):
+                        if args.cold:
+                            dropSourceCache(sourcePath)
+
+                        start = perf_counter()
+                        copyFunc(sourcePath, destPath)
+                        times.append(perf_counter() - start)
+
+                except OSError as e:
+                    if e.errno not in Utils.KERNEL_COPY_UNSUPPORTED:
+                        raise
+                    print(f"{name:>20} {'Unsupported':>21}  ({errno.errorcode.get(e.errno, e.errno)})")
+                    continue
+
+                finally:
+                    if os.path.exists(destPath):
+                        os.remove(destPath)
+
+                best = min(times)
+                print(f"{name:>20} {best:10.3f} {args.size / best:10.1f}")
+
+            print()
+
+    finally:
+        pipeline.close()
+        os.remove(sourcePath)
+
+
+if __name__ == "__main__":
+    main()
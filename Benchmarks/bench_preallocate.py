@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+
+#   Benchmarks Destination Preallocation (posix_fallocate) for the FileCopyWorker.
+#
+#   Writes several Files into each Target Directory at once, Interleaving their
+#   Chunks like Concurrent Transfers to the same Drive, with and without Preallocating
+#   each File to its Final Size.  Reports the Write Speed in MB/s and the Average
+#   Extent Count per File (from filefrag, Linux Only).  Fewer Extents mean a less
+#   Fragmented Destination and Faster Reads when Verifying or Playing the Media.
+#
+#   Run with the Prism Python Interpreter (PRISM_ROOT set):
+#       python Benchmarks/bench_preallocate.py /mnt/scratch > bench_output.txt
+
+
+import os
+import re
+import sys
+import shutil
+import tempfile
+import argparse
+import subprocess
+from time import perf_counter
+
+
+pluginPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SourceTab")
+sys.path.append(os.path.join(pluginPath, "Libs"))
+sys.path.insert(0, os.path.join(pluginPath, "PythonLibs"))
+sys.path.append(os.path.join(pluginPath, "PythonLibs", f"Python3{sys.version_info.minor}"))
+
+import SourceTab_Utils as Utils
+
+
+def writeFiles(destPaths:list, fileSize:int, chunk:bytes, preallocate:bool) -> None:
+    '''Writes the Files Chunk by Chunk in Turn, as Concurrent Transfers Would'''
+
+    files = [open(destPath, "wb") for destPath in destPaths]
+    try:
+        for f in files:
+            if preallocate:
+                Utils.preallocateFile(f.fileno(), fileSize)
+            Utils.adviseSequential(f.fileno())
+
+        for _ in range(fileSize // len(chunk)):
+            for f in files:
+                f.write(chunk)
+
+        for f in files:
+            f.flush()
+            os.fsync(f.fileno())
+
+    finally:
+        for f in files:
+            f.close()
+
+
+def getExtentCount(filePath:str) -> int | None:
+    '''Extent Count from filefrag (None if not Available)'''
+
+    filefrag = shutil.which("filefrag") or ("/usr/sbin/filefrag" if os.path.isfile("/usr/sbin/filefrag") else None)
+    if not filefrag:
+        return None
+
+    try:
+        output = subprocess.run([filefrag, filePath], capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    match = re.search(r"(\d+) extents? found", output)
+    return int(match.group(1)) if match else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Destination Preallocation Benchmark")
+    parser.add_argument("targets", nargs="*", help="Destination Directories (default: Temp Dir)")
+    parser.add_argument("--size", type=int, default=256, help="Size of each File in MB")
+    parser.add_argument("--files", type=int, default=4, help="Files Written at Once")
+    parser.add_argument("--chunk", type=int, default=2, help="Write Chunk Size in MB (Transfer Chunk Size Setting)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per Mode (Best is Reported)")
+    args = parser.parse_args()
+
+    targets = args.targets or [tempfile.gettempdir()]
+    chunk = os.urandom(args.chunk * 1024 * 1024)
+    fileSize = (args.size // args.chunk) * len(chunk)
+    totalMB = fileSize * args.files / (1024 * 1024)
+
+    print(f"{args.files} Files x {fileSize // (1024 * 1024)} MB, {args.chunk} MB Chunks\n")
+
+    for target in targets:
+        supported = Utils.canPreallocate(target)
+        print(f"Target: {target}  (Native Preallocation: {'Yes' if supported else 'No'})")
+        print(f"{'Mode':>14} {'Best (s)':>10} {'MB/s':>10} {'Extents':>10}")
+
+        destPaths = [os.path.join(target, f"bench_preallocate_{idx}.bin") for idx in range(args.files)]
+
+        for name, preallocate in (("Default", False), ("Preallocated", True)):
+            times = []
+            extents = []
+            try:
+                for _ in range(args.repeat):
+                    start = perf_counter()
+                    writeFiles(destPaths, fileSize, chunk, preallocate)
+                    times.append(perf_counter() - start)
+
+                    extents = [getExtentCount(destPath) for destPath in destPaths]
+
+                    for destPath in destPaths:
+                        os.remove(destPath)
+
+            finally:
+                for destPath in destPaths:
+                    if os.path.exists(destPath):
+                        os.remove(destPath)
+
+            best = min(times)
+            if None in extents:
+                extentStr = "n/a"
+            else:
+                extentStr = f"{sum(extents) / len(extents):.1f}"
+
+            print(f"{name:>14} {best:10.3f} {totalMB / best:10.1f} {extentStr:>10}")
+
+        print()
+
+
+if __name__ == "__main__":
+    main()
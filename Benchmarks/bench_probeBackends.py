@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+#   Benchmarks the Media Probe Backends in Files/sec.
+#
+#   Compares the In-process PyAV Inspection with the FFprobe Subprocess Inspection,
+#   and Times inspectMedia() (the Inspection the Tab Runs once per File), all in
+#   SourceTab_Utils, over the Video / Audio Files in the Passed Paths.
+#   Reports any Files where the Derived Probe Results of the Backends Disagree.
+#
+#   Run with the Prism Python Interpreter (PRISM_ROOT set):
+#       python Benchmarks/bench_probeBackends.py D:/Footage/Card01 > bench_output.txt
+
+
+import os
+import sys
+import argparse
+from time import perf_counter
+
+
+pluginPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SourceTab")
+sys.path.append(os.path.join(pluginPath, "Libs"))
+sys.path.insert(0, os.path.join(pluginPath, "PythonLibs"))
+sys.path.append(os.path.join(pluginPath, "PythonLibs", f"Python3{sys.version_info.minor}"))
+
+import SourceTab_Utils as Utils
+
+
+VIDEO_EXTS = {".mov", ".mp4", ".mxf", ".avi", ".mkv", ".m4v", ".mts", ".m2ts", ".webm", ".r3d", ".braw"}
+AUDIO_EXTS = {".wav", ".mp3", ".aac", ".flac", ".m4a", ".aif", ".aiff", ".ogg"}
+
+
+def collectFiles(paths:list, limit:int) -> list:
+    '''Returns (filePath, isAudio) for Media Files in the Passed Files / Dirs'''
+
+    files = []
+    for path in paths:
+        if os.path.isfile(path):
+            candidates = [path]
+        else:
+            candidates = [os.path.join(root, name) for root, _, names in os.walk(path) for name in names]
+
+        for filePath in candidates:
+            ext = os.path.splitext(filePath)[1].lower()
+            if ext in VIDEO_EXTS or ext in AUDIO_EXTS:
+                files.append((filePath, ext in AUDIO_EXTS))
+
+    return files[:limit] if limit else files
+
+
+def runBackend(inspectFunc, files:list) -> tuple[float, list]:
+    '''Inspects each File and Derives the Probe Tuple the Tiles Use'''
+
+    results = []
+    start = perf_counter()
+
+    for filePath, isAudio in files:
+        metadata = inspectFunc(filePath)
+        results.append(Utils.getProbeResultFromFFprobe(metadata, audio=isAudio) if metadata else None)
+
+    return perf_counter() - start, results
+
+
+def isMatch(resultA:tuple, resultB:tuple) -> bool:
+    '''Compares Frames, FPS, Codec and Resolution'''
+
+    if resultA is None or resultB is None:
+        return resultA is resultB
+
+    framesA, fpsA, _, codecA, _, widthA, heightA = resultA
+    framesB, fpsB, _, codecB, _, widthB, heightB = resultB
+
+    return (framesA == framesB
+            and abs(fpsA - fpsB) < 0.01
+            and codecA == codecB
+            and (widthA, heightA) == (widthB, heightB))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Media Probe Backend Benchmark")
+    parser.add_argument("paths", nargs="+", help="Media Files or Directories to Probe")
+    parser.add_argument("--limit", type=int, default=0, help="Max Number of Files (0 = All)")
+    args = parser.parse_args()
+
+    if Utils.av is None:
+        print("PyAV is not Available: the PyAV Backend is Skipped")
+
+    files = collectFiles(args.paths, args.limit)
+    if not files:
+        print("No Media Files Found")
+        return
+
+    print(f"Probing {len(files)} Files\n")
+    print(f"{'Backend':>10} {'Total (s)':>10} {'Files/s':>10} {'Failed':>8}")
+
+    backends = [("FFprobe", Utils.getFFprobeMetadata)]
+    if Utils.av is not None:
+        backends.insert(0, ("PyAV", Utils.inspectMediaAV))
+
+    #   Uncached inspectMedia() (getMediaInspection() Serves Repeats from Memory)
+    backends.append(("Shared", lambda filePath: Utils.inspectMedia(filePath)["ffprobe"]))
+
+    allResults = {}
+    for name, inspectFunc in backends:
+        elapsed, results = runBackend(inspectFunc, files)
+        allResults[name] = results
+        failed = sum(1 for r in results if r is None)
+        rate = len(files) / elapsed if elapsed else 0
+
+        print(f"{name:>10} {elapsed:10.3f} {rate:10.1f} {failed:8}")
+
+    if "PyAV" in allResults:
+        mismatched = [files[idx][0] for idx, (a, b) in enumerate(zip(allResults["PyAV"], allResults["FFprobe"]))
+                      if not isMatch(a, b)]
+
+        print(f"\nMismatched Results: {len(mismatched)}")
+        for filePath in mismatched:
+            print(f"    {filePath}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+#   Benchmarks Image Sequence Grouping from 1k to 100k Frames.
+#
+#   Times the Legacy SourceBrowser.groupImageSequences() (a next() Search over all
+#   Entries per Sequence / Still, and a Stat of every Frame for the Sequence Size)
+#   against the Indexed Grouping that Reuses the Scanned Sizes.  Both Include
+#   Prism's detectSequences(), so a Prism Core is Required.
+#   The Frames are Written as Empty Files into a Temp Dir so the Legacy Stats are Real.
+#
+#   Run with the Prism Python Interpreter (PRISM_ROOT set):
+#       python Benchmarks/bench_sequenceGrouping.py > bench_output.txt
+
+
+import os
+import sys
+import shutil
+import tempfile
+import argparse
+from time import perf_counter
+
+
+pluginPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SourceTab")
+sys.path.append(os.path.join(pluginPath, "Libs"))
+sys.path.insert(0, os.path.join(pluginPath, "PythonLibs"))
+
+import SourceTab_Utils as Utils
+
+
+def loadPrismCore():
+    '''Creates a Headless Prism Core for detectSequences() (None if PRISM_ROOT is not Set)'''
+
+    prismRoot = os.getenv("PRISM_ROOT")
+    if not prismRoot:
+        return None
+
+    sys.path.insert(0, os.path.join(prismRoot, "Scripts"))
+    import PrismCore
+
+    return PrismCore.create(prismArgs=["noUI"])
+
+
+def makeEntries(dirPath:str, frameNum:int, stillNum:int) -> list:
+    '''Writes the Frames and Stills, and Returns Scanned Entries like the Source Scan Worker'''
+
+    names = [f"shot_010.{frame:07d}.exr" for frame in range(1001, 1001 + frameNum)]
+    names += [f"still_{idx:05d}.jpg" for idx in range(stillNum)]
+
+    for name in names:
+        open(os.path.join(dirPath, name), "wb").close()
+
+    entries = []
+    with os.scandir(dirPath) as it:
+        for entry in it:
+            entries.append({"entry": entry.name,
+                            "displayName": entry.name,
+                            "fullPath": entry.path,
+                            "fileType": "Images",
+                            "seqFiles": None,
+                            "seqSize": None,
+                            "size": entry.stat().st_size,
+                            "mtime": entry.stat().st_mtime})
+
+    return entries
+
+
+def groupLegacy(core, dirPath:str, imageEntries:list) -> list:
+    '''SourceBrowser.groupImageSequences() before the Entry Index'''
+
+    groupedImages = []
+
+    #   Group Sequences
+    seqs = core.media.detectSequences([i["entry"] for i in imageEntries])
+
+    #   Parse Sequences
+    for seq_pattern, files in seqs.items():
+        if not files:
+            continue
+
+        files = sorted(files)
+        #   Sequences
+        if len(files) > 1:
+            rep = files[0]
+            #   Get Match Info for Sequence
+            repInfo = next((i for i in imageEntries if i["entry"] == rep), None)
+            if repInfo:
+                repInfo["displayName"] = seq_pattern
+                repInfo["fileType"] = "Image Sequence"
+                repInfo["seqFiles"] = [os.path.join(dirPath, f) for f in files]
+
+                seqSize = 0
+                for file in repInfo["seqFiles"]:
+                    seqSize += Utils.getFileSize(file)
+                repInfo["seqSize"] = seqSize
+
+                groupedImages.append(repInfo)
+
+        #   Single Images
+        else:
+            rep = files[0]
+            repInfo = next((i for i in imageEntries if i["entry"] == rep), None)
+            if repInfo:
+                groupedImages.append(repInfo)
+
+    return groupedImages
+
+
+def groupIndexed(core, dirPath:str, imageEntries:list) -> list:
+    '''Current SourceBrowser.groupImageSequences()'''
+
+    groupedImages = []
+
+    #   Index Entries by Filename and Reuse the Scanned Sizes
+    entryIndex = {i["entry"]: i for i in imageEntries}
+    sizes = {name: info.get("size") for name, info in entryIndex.items()}
+
+    #   Group Sequences
+    seqs = core.media.detectSequences(list(entryIndex))
+    records = Utils.buildSequenceRecords(dirPath, seqs, sizes)
+
+    for record in records:
+        repInfo = entryIndex.get(record.files[0])
+        if not repInfo:
+            continue
+
+        #   Sequences
+        if record.frameCount > 1:
+            repInfo["displayName"] = record.pattern
+            repInfo["fileType"] = "Image Sequence"
+            repInfo["seqFiles"] = record.filePaths()
+            repInfo["seqSize"] = record.totalSize
+
+        groupedImages.append(repInfo)
+
+    return groupedImages
+
+
+def timeIt(func, core, dirPath:str, entries:list) -> float:
+    #   Grouping Edits the Entries, so each Run Gets Fresh Copies
+    entries = [dict(i) for i in entries]
+
+    start = perf_counter()
+    func(core, dirPath, entries)
+    return perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Image Sequence Grouping Benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--stills", type=int, default=500, help="Single Images Next to the Sequence")
+    parser.add_argument("--dir", default=tempfile.gettempdir(), help="Directory for the Generated Frames")
+    args = parser.parse_args()
+
+    core = loadPrismCore()
+    if not core:
+        print("PRISM_ROOT is not Set: detectSequences() Needs a Prism Core")
+        sys.exit(1)
+
+    print(f"{'Frames':>10} {'Legacy (s)':>12} {'Indexed (s)':>12} {'Speedup':>9} {'Frames/s':>14}")
+
+    for frameNum in args.sizes:
+        dirPath = tempfile.mkdtemp(prefix="bench_seqGrouping_", dir=args.dir)
+        try:
+            entries = makeEntries(dirPath, frameNum, args.stills)
+
+            legacy = timeIt(groupLegacy, core, dirPath, entries)
+            indexed = timeIt(groupIndexed, core, dirPath, entries)
+            speedup = legacy / indexed if indexed else 0
+            rate = frameNum / indexed if indexed else 0
+
+            print(f"{frameNum:>10} {legacy:12.3f} {indexed:12.3f} {speedup:8.1f}x {rate:14,.0f}")
+
+        finally:
+            shutil.rmtree(dirPath, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+#   Benchmarks Re-sorting / Filtering the Tile List Model from 1k to 50k Items.
+#
+#   Times the First Sort (Builds the Cached Sort Keys), then Re-sorts by
+#   Name / Size / Date using the Cached Keys, a Type Filter, and the
+#   Incremental Re-position of a Single Changed Item.
+#
+#   Run with the Prism Python Interpreter (PRISM_ROOT set):
+#       python Benchmarks/bench_tableSorting.py > bench_output.txt
+
+
+import os
+import sys
+import random
+import argparse
+from time import perf_counter
+
+
+pluginPath = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SourceTab")
+sys.path.append(os.path.join(pluginPath, "Libs"))
+sys.path.insert(0, os.path.join(pluginPath, "PythonLibs"))
+
+from SourceTab_Models import FileTileListModel
+
+
+FILETYPES = ["Videos", "Image Sequence", "Images", "Audio", "Other"]
+
+
+def makeItems(itemNum:int) -> list:
+    '''Builds Fake Source Data Items'''
+
+    rand = random.Random(itemNum)
+    items = []
+
+    for idx in range(itemNum):
+        fileType = rand.choice(FILETYPES)
+        isFolder = idx % 50 == 0
+        items.append({"tile": None,
+                      "tileType": "folder" if isFolder else "file",
+                      "data": {"uuid": f"uuid_{idx}",
+                               "tileType": "folder" if isFolder else "file",
+                               "displayName": f"clip_{rand.randrange(1_000_000):07d}.mov",
+                               "fileType": "Folders" if isFolder else fileType,
+                               "seqSize": rand.randrange(1 << 30),
+                               "source_mainFile_size_raw": rand.randrange(1 << 30),
+                               "source_mainFile_date_raw": rand.random() * 1e9}})
+
+    return items
+
+
+def timeIt(func, *args) -> float:
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def resortBy(model:FileTileListModel, sortType:str) -> None:
+    model.setSortOptions({"sortType": sortType, "ascending": True, "groupTypes": True})
+    model.resort()
+
+
+def filterVideos(model:FileTileListModel) -> None:
+    model.setFilterStates({"Videos": True, "Sequences": False, "Images": False, "Audio": False, "Other": False})
+    model.resort()
+    model.setFilterStates(None)
+    model.resort()
+
+
+def changeOneItem(model:FileTileListModel, items:list) -> None:
+    data = items[len(items) // 2]["data"]
+    data["source_mainFile_size_raw"] = 0
+    data["seqSize"] = 0
+    model.refreshUuid(data["uuid"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tile List Sort / Filter Benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    args = parser.parse_args()
+
+    print(f"{'Items':>8} {'First (ms)':>11} {'Name (ms)':>10} {'Size (ms)':>10} "
+          f"{'Date (ms)':>10} {'Filter (ms)':>12} {'One Item (ms)':>14}")
+
+    for itemNum in args.sizes:
+        items = makeItems(itemNum)
+        model = FileTileListModel()
+
+        first = timeIt(model.setItems, items)
+        times = [timeIt(resortBy, model, sortType) for sortType in ("name", "size", "date")]
+        filt = timeIt(filterVideos, model)
+        single = timeIt(changeOneItem, model, model.items())
+
+        print(f"{itemNum:>8} {first * 1000:11.1f} {times[0] * 1000:10.1f} {times[1] * 1000:10.1f} "
+              f"{times[2] * 1000:10.1f} {filt * 1000:12.1f} {single * 1000:14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import time
+import queue
+import threading
+import logging
+from collections import deque
+from typing import Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+
+###     Fan-out Destination    ###
+
+class _FanOutTarget:
+    '''Write State of One Destination in a Fan-out Copy'''
+
+    def __init__(self, fdst):
+        self.fdst = fdst
+        self.pending = deque()
+        self.written = 0
+        self.writing = False
+        self.eof = False
+        self.detached = False
+        self.error = None
+
+
+    def isActive(self) -> bool:
+        return self.error is None and not self.detached
+
+
+
+###     Copy Pipeline    ###
+
+class CopyPipeline:
+    '''
+    Overlapped File Copy with a Ring of Reusable Buffers\n
+    A Reader Thread Fills the Free Buffers while the Calling Thread Writes the Filled Ones,
+    so the Source is Read while the Destination is Written.
+    The Buffers are Allocated Once and Reused for Every File.
+    Only the First Buffer is Allocated Up Front, the Rest of the Ring when a Copy First Overlaps,
+    so a Pipeline that only Copies Files Smaller than a Buffer Holds a Single Buffer.
+    The Reader Thread is Started on the First Overlapped Copy and Fed each File through a Queue,
+    so it Lives as Long as the Pipeline (Stopped by close())
+    '''
+
+    def __init__(self, bufferCount:int=4, bufferSize:int=2 * 1024 * 1024):
+        self.bufferCount = max(2, bufferCount)
+        self.bufferSize = bufferSize
+
+        self._views = [memoryview(bytearray(bufferSize))]
+
+        #   Files for the Reader Thread (None Stops it)
+        self._readTasks = queue.SimpleQueue()
+        self._reader = None
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, *args):
+        self.close()
+
+
+    def close(self) -> None:
+        '''Stops the Reader Thread (a Later Copy Starts a New One)'''
+
+        if self._reader is not None:
+            self._readTasks.put(None)
+            self._reader.join()
+            self._reader = None
+
+
+    def _allocateRing(self) -> None:
+        while len(self._views) < self.bufferCount:
+            self._views.append(memoryview(bytearray(self.bufferSize)))
+
+
+    #   A Destination that Starves the Others for Over Half this Many Seconds is Detached
+    DETACH_WINDOW = 10.0
+
+
+    def _readLoop(self, fsrc, freeQueue:queue.SimpleQueue, filledQueue:queue.SimpleQueue, hashObject) -> None:
+        try:
+            while True:
+                idx = freeQueue.get()
+                #   Stopped by the Writer
+                if idx is None:
+                    return
+
+                view = self._views[idx]
+                size = fsrc.readinto(view)
+                if not size:
+                    filledQueue.put(None)
+                    return
+
+                #   Hashed on the Reader so it Overlaps the Write
+                if hashObject:
+                    hashObject.update(view[:size])
+
+                filledQueue.put((idx, size))
+
+        except Exception as e:
+            filledQueue.put(e)
+
+
+    def _readerLoop(self) -> None:
+        while True:
+            task = self._readTasks.get()
+            if task is None:
+                return
+
+            fsrc, freeQueue, filledQueue, hashObject, done = task
+            try:
+                self._readLoop(fsrc, freeQueue, filledQueue, hashObject)
+            finally:
+                done.set()
+
+
+    def copy(self, fsrc, fdst, waitIfPaused:Callable[[], bool], onProgress:Callable[[int], None],
+             hashObject=None, fileSize:int=None) -> bool:
+        '''
+        Copies fsrc to fdst (Binary File Objects), Calling waitIfPaused Before each Write
+        and onProgress After it.\n
+        Returns False if Cancelled
+        '''
+
+        #   Single Buffer Files Cannot Overlap, so Skip the Reader Thread
+        if fileSize is not None and fileSize < self.bufferSize:
+            return self._copySerial(fsrc, fdst, waitIfPaused, onProgress, hashObject)
+
+        self._allocateRing()
+
+        if self._reader is None:
+            self._reader = threading.Thread(target=self._readerLoop, name="CopyPipeline-Reader", daemon=True)
+            self._reader.start()
+
+        freeQueue = queue.SimpleQueue()
+        filledQueue = queue.SimpleQueue()
+        for idx in range(self.bufferCount):
+            freeQueue.put(idx)
+
+        done = threading.Event()
+        self._readTasks.put((fsrc, freeQueue, filledQueue, hashObject, done))
+
+        try:
+            while True:
+                if not waitIfPaused():
+                    return False
+
+                item = filledQueue.get()
+                if item is None:
+                    return True
+
+                if isinstance(item, Exception):
+                    raise item
+
+                idx, size = item
+                fdst.write(self._views[idx][:size])
+                freeQueue.put(idx)
+
+                onProgress(size)
+
+        finally:
+            #   Stop the Reader on this File (it may Still be Filling Free Buffers)
+            freeQueue.put(None)
+            done.wait()
+
+
+    def _copySerial(self, fsrc, fdst, waitIfPaused:Callable[[], bool], onProgress:Callable[[int], None],
+                    hashObject=None) -> bool:
+        view = self._views[0]
+
+        while True:
+            if not waitIfPaused():
+                return False
+
+            size = fsrc.readinto(view)
+            if not size:
+                return True
+
+            if hashObject:
+                hashObject.update(view[:size])
+
+            fdst.write(view[:size])
+            onProgress(size)
+
+
+    def copyFanOut(self, fsrc, fdsts:list, waitIfPaused:Callable[[], bool], onProgress:Callable[[int], None],
+                   isPaused:Callable[[], bool]=None, hashObject=None,
+                   throttle:Callable[[int], None]=None) -> list | None:
+        '''
+        Reads fsrc Once and Writes it to Every fdst, each on its Own Writer Thread.\n
+        A Failed Destination is Dropped, and a Destination Holding the Ring while the Others Wait
+        for Over Half of DETACH_WINDOW is Detached to Finish from its Own Source Reads,
+        so Neither Stalls the Others.
+        Progress Follows the Slowest Destination that has not Failed, and throttle
+        (if Given) is Called by the Reader after each Read.\n
+        Returns the Exception (or None) for each Destination, or None if Cancelled
+        '''
+
+        self._allocateRing()
+
+        cond = threading.Condition()
+        targets = [_FanOutTarget(fdst) for fdst in fdsts]
+        freeBuffers = deque(range(self.bufferCount))
+        refCounts = [0] * self.bufferCount
+        cancelled = False
+        readError = None
+        windowStart = time.monotonic()
+        stalled = 0.0
+
+        def _proceed() -> bool:
+            nonlocal cancelled
+            if waitIfPaused():
+                return True
+
+            with cond:
+                cancelled = True
+                cond.notify_all()
+            return False
+
+        #   Callers Below Hold the Condition
+        def _release(idx):
+            refCounts[idx] -= 1
+            if refCounts[idx] == 0:
+                freeBuffers.append(idx)
+                cond.notify_all()
+
+        def _dropPending(target):
+            #   The Buffer being Written is Released by its Writer
+            keep = 1 if target.writing else 0
+            while len(target.pending) > keep:
+                idx, _ = target.pending.pop()
+                _release(idx)
+
+        def _getStallingTarget():
+            '''Returns the Destination Holding the Ring while the Others have Nothing to Write'''
+
+            active = [t for t in targets if t.isActive()]
+            if len(active) < 2:
+                return None
+
+            slowest = max(active, key=lambda t: len(t.pending))
+            if any(t.pending for t in active if t is not slowest):
+                return None
+
+            return slowest
+
+        def _waitForBuffer():
+            nonlocal windowStart, stalled
+
+            while not freeBuffers and not cancelled:
+                waitStart = time.monotonic()
+                cond.wait(0.25)
+                now = time.monotonic()
+
+                if isPaused and isPaused():
+                    windowStart, stalled = now, 0.0
+                    continue
+
+                if _getStallingTarget():
+                    stalled += now - waitStart
+
+                if now - windowStart >= self.DETACH_WINDOW:
+                    slowest = _getStallingTarget()
+                    if slowest and stalled > self.DETACH_WINDOW / 2:
+                        slowest.detached = True
+                        _dropPending(slowest)
+                        logger.warning(f"Slow Destination Detached from the Shared Read at {slowest.written} Bytes")
+
+                    windowStart, stalled = now, 0.0
+
+        def _readLoop():
+            nonlocal readError
+            try:
+                while _proceed():
+                    with cond:
+                        _waitForBuffer()
+                        if cancelled:
+                            return
+                        idx = freeBuffers.popleft()
+
+                    view = self._views[idx]
+                    size = fsrc.readinto(view)
+
+                    if size and hashObject:
+                        hashObject.update(view[:size])
+
+                    #   Bandwidth Cap: Holding Back the Read Holds Back Every Destination
+                    if size and throttle:
+                        throttle(size)
+
+                    with cond:
+                        #   Detached Destinations Still Need the Full Source Hash
+                        if not size or all(t.error for t in targets):
+                            freeBuffers.append(idx)
+                            for target in targets:
+                                target.eof = True
+                            cond.notify_all()
+                            return
+
+                        active = [t for t in targets if t.isActive()]
+                        if not active:
+                            freeBuffers.append(idx)
+                            continue
+
+                        refCounts[idx] = len(active)
+                        for target in active:
+                            target.pending.append((idx, size))
+                        cond.notify_all()
+
+            except Exception as e:
+                with cond:
+                    readError = e
+                    for target in targets:
+                        target.eof = True
+                    cond.notify_all()
+
+        def _writeLoop(target):
+            try:
+                while True:
+                    if not _proceed():
+                        return
+
+                    with cond:
+                        while not (target.pending or target.eof or target.detached or cancelled):
+                            cond.wait()
+
+                        if cancelled:
+                            return
+                        if target.detached:
+                            break
+                        if not target.pending:
+                            return
+
+                        idx, size = target.pending[0]
+                        target.writing = True
+
+                    target.fdst.write(self._views[idx][:size])
+
+                    with cond:
+                        target.writing = False
+                        target.pending.popleft()
+                        target.written += size
+                        _release(idx)
+                        cond.notify_all()
+
+                #   Detached: Finish from the Source File
+                self._catchUp(fsrc.name, target, cond, _proceed, throttle)
+
+            except Exception as e:
+                with cond:
+                    target.error = e
+                    target.writing = False
+                    _dropPending(target)
+                    cond.notify_all()
+
+        threads = [threading.Thread(target=_readLoop, name="CopyPipeline-Reader", daemon=True)]
+        for num, target in enumerate(targets):
+            threads.append(threading.Thread(target=_writeLoop, args=(target,),
+                                            name=f"CopyPipeline-Writer-{num + 1}", daemon=True))
+        for thread in threads:
+            thread.start()
+
+        #   Report the Slowest Live Destination's Progress until all Threads Finish
+        reported = 0
+        while True:
+            with cond:
+                live = [t.written for t in targets if t.error is None]
+                progress = min(live) if live else reported
+
+            if progress > reported:
+                onProgress(progress - reported)
+                reported = progress
+
+            if not any(thread.is_alive() for thread in threads):
+                break
+
+            with cond:
+                cond.wait(0.25)
+
+        if cancelled:
+            return None
+        if readError:
+            raise readError
+
+        return [target.error for target in targets]
+
+
+    def _catchUp(self, sourcePath:str, target:_FanOutTarget, cond:threading.Condition,
+                 proceed:Callable[[], bool], throttle:Callable[[int], None]=None) -> None:
+        '''Copies the Rest of the Source to a Detached Destination with its Own Reads (Throttled Like the Shared Read)'''
+
+        view = memoryview(bytearray(self.bufferSize))
+
+        with open(sourcePath, "rb") as f:
+            f.seek(target.written)
+
+            while proceed():
+                size = f.readinto(view)
+                if not size:
+                    return
+
+                if throttle:
+                    throttle(size)
+
+                target.fdst.write(view[:size])
+
+                with cond:
+                    target.written += size
+                    cond.notify_all()
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import os
+import json
+import hashlib
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+
+class DirSnapshotCache:
+    '''On-disk Snapshots of Scanned Source Directories'''
+
+    VERSION = 1
+
+    def __init__(self, cacheDir:str, maxSnapshots:int=200):
+        self.cacheDir = cacheDir
+        self.maxSnapshots = maxSnapshots
+
+
+    def _getSnapshotPath(self, dirPath:str) -> str:
+        '''Returns the Snapshot Filepath for the Directory'''
+
+        key = os.path.normcase(os.path.normpath(dirPath))
+        fileName = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json"
+
+        return os.path.join(self.cacheDir, fileName)
+
+
+    @staticmethod
+    def getDirMtime(dirPath:str) -> float:
+        '''Returns the Directory Mtime (a Single Stat, so Safe on the UI Thread)'''
+
+        return os.stat(dirPath).st_mtime
+
+
+    @staticmethod
+    def getEntryStats(entries:list) -> dict:
+        '''Returns the Stat Data of Scanned Entries by Name'''
+
+        return {e["entry"]: [e.get("size", 0), e.get("mtime", 0.0)] for e in entries}
+
+
+    def load(self, dirPath:str, combineSeqs:bool) -> dict | None:
+        '''
+        Returns the Snapshot if the Directory Mtime still Matches\n
+        The Directory is not Listed here, the Background Scan Checks the Entries with matches()
+        '''
+
+        snapshotPath = self._getSnapshotPath(dirPath)
+        if not os.path.isfile(snapshotPath):
+            return None
+
+        try:
+            with open(snapshotPath, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+
+            if snapshot.get("version") != self.VERSION or snapshot.get("combineSeqs") != combineSeqs:
+                return None
+
+            if snapshot["dirMtime"] != self.getDirMtime(dirPath):
+                logger.debug(f"Directory Snapshot is Stale: {dirPath}")
+                return None
+
+            #   Rebuild the Full Sequence Paths
+            for item in snapshot["items"]:
+                if item.get("seqFiles"):
+                    item["seqFiles"] = [os.path.join(dirPath, f) for f in item["seqFiles"]]
+
+            return snapshot
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Load Directory Snapshot for {dirPath}:\n{e}")
+            return None
+
+
+    def save(self, dirPath:str, combineSeqs:bool, dirMtime:float, entries:list, items:list) -> None:
+        '''Saves the Scanned Entries, Sequence Groupings, and Stat Data of the Directory'''
+
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+
+            #   Store Sequence Frames by Name to Keep the Snapshot Compact
+            savedItems = []
+            for item in items:
+                item = dict(item)
+                if item.get("seqFiles"):
+                    item["seqFiles"] = [os.path.basename(f) for f in item["seqFiles"]]
+                savedItems.append(item)
+
+            snapshot = {
+                "version": self.VERSION,
+                "dirPath": dirPath,
+                "combineSeqs": combineSeqs,
+                "dirMtime": dirMtime,
+                "entryCount": len(entries),
+                "stats": self.getEntryStats(entries),
+                "items": savedItems
+            }
+
+            #   Write to Temp and Replace so a Partial Write is Never Loaded
+            snapshotPath = self._getSnapshotPath(dirPath)
+            tempPath = snapshotPath + ".tmp"
+            with open(tempPath, "w", encoding="utf-8") as f:
+                json.dump(snapshot, f)
+            os.replace(tempPath, snapshotPath)
+
+            self.prune()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Save Directory Snapshot for {dirPath}:\n{e}")
+
+
+    def matches(self, snapshot:dict, entries:list) -> bool:
+        '''Returns Bool if the Scanned Entry Count and Stat Data Match the Snapshot'''
+
+        if snapshot.get("entryCount") != len(entries):
+            return False
+
+        return snapshot.get("stats") == self.getEntryStats(entries)
+
+
+    def prune(self) -> None:
+        '''Removes the Oldest Snapshots over the Max Count'''
+
+        try:
+            snapshots = [os.path.join(self.cacheDir, f) for f in os.listdir(self.cacheDir) if f.endswith(".json")]
+            if len(snapshots) <= self.maxSnapshots:
+                return
+
+            snapshots.sort(key=os.path.getmtime)
+            for snapshotPath in snapshots[:len(snapshots) - self.maxSnapshots]:
+                os.remove(snapshotPath)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Prune Directory Snapshots:\n{e}")
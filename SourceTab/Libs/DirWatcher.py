@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import logging
+
+
+from qtpy.QtCore import *
+from qtpy.QtGui import *
+from qtpy.QtWidgets import *
+
+
+from WorkerThreads import DirScanWorker
+
+
+logger = logging.getLogger(__name__)
+
+
+
+class DirWatcher(QObject):
+    '''
+    Watches a Source Directory and Emits Add/Update/Remove Deltas\n
+    Changed Entries are only Emitted once their Size and Mtime have Settled,
+    and Images are Held while any Image is still being Written (Sequences).\n
+    The Directory only Signals Added / Removed / Renamed Entries, so the Files are
+    Watched as well (up to MAX_WATCHED_FILES) to Catch Files Modified in Place.
+    Larger Directories are Polled every POLL_MS Instead
+    '''
+
+    deltasReady = Signal(list, list, list)
+
+    #   Each Watched File Uses an OS Watch Handle (inotify Watches are Limited per User)
+    MAX_WATCHED_FILES = 2000
+    POLL_MS = 10000
+
+    def __init__(self, origin, settleMs:int=1000):
+        super().__init__()
+
+        self.origin = origin
+        self.settleMs = settleMs
+
+        self.dirPath = None
+        self.known = {}
+        self.lastScan = {}
+        self.scanId = 0
+        self.scanEntries = []
+        self.scanWorker = None
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.onDirChanged)
+        self.watcher.fileChanged.connect(self.onDirChanged)
+
+        #   Debounce Timer
+        self.settleTimer = QTimer(self)
+        self.settleTimer.setSingleShot(True)
+        self.settleTimer.timeout.connect(self.rescan)
+
+        #   Catches In-place Modifications of Files that are not Watched
+        self.pollTimer = QTimer(self)
+        self.pollTimer.setInterval(self.POLL_MS)
+        self.pollTimer.timeout.connect(self.onPoll)
+
+
+    @staticmethod
+    def getSignature(entry:dict) -> tuple:
+        return entry.get("size", 0), entry.get("mtime", 0.0)
+
+
+    def isWatching(self) -> bool:
+        return self.dirPath is not None
+
+
+    def start(self, dirPath:str, entries:list) -> None:
+        '''Starts Watching the Directory from the Already Scanned Entries'''
+
+        self.stop()
+
+        self.dirPath = dirPath
+        self.known = {e["entry"]: e for e in entries}
+        self.lastScan = {name: self.getSignature(e) for name, e in self.known.items()}
+
+        if not self.watcher.addPath(dirPath):
+            logger.warning(f"ERROR:  Unable to Watch Directory: {dirPath}")
+            self.dirPath = None
+            return
+
+        self.watchFiles(entries)
+
+        logger.debug(f"Watching Source Directory: {dirPath}")
+
+
+    def stop(self) -> None:
+        '''Stops Watching and Drops any Pending Scan'''
+
+        self.settleTimer.stop()
+        self.pollTimer.stop()
+
+        if self.scanWorker:
+            self.scanWorker.cancel()
+            self.scanWorker = None
+
+        paths = self.watcher.directories() + self.watcher.files()
+        if paths:
+            self.watcher.removePaths(paths)
+
+        self.dirPath = None
+        self.known = {}
+        self.lastScan = {}
+
+
+    def watchFiles(self, entries:list) -> None:
+        '''Watches the Listed Files for In-place Changes, or Polls if there are too Many'''
+
+        filePaths = [e["fullPath"] for e in entries if e["fileType"] != "Folders"]
+
+        if len(filePaths) > self.MAX_WATCHED_FILES:
+            filePaths = []
+            if not self.pollTimer.isActive():
+                self.pollTimer.start()
+        else:
+            self.pollTimer.stop()
+
+        #   Replaced Files Drop their Watch, so they are Added Again
+        watched = set(self.watcher.files())
+        wanted = set(filePaths)
+
+        stale = list(watched - wanted)
+        if stale:
+            self.watcher.removePaths(stale)
+
+        missing = list(wanted - watched)
+        if missing:
+            self.watcher.addPaths(missing)
+
+
+    def onDirChanged(self, path:str) -> None:
+        #   Restart the Debounce on Every Event
+        self.settleTimer.start(self.settleMs)
+
+
+    def onPoll(self) -> None:
+        #   Skip while a Change is Already Settling
+        if not self.settleTimer.isActive() and not self.scanWorker:
+            self.rescan()
+
+
+    def rescan(self) -> None:
+        '''Scans the Directory in the Background to Diff Against the Known Entries'''
+
+        if not self.dirPath:
+            return
+
+        if self.scanWorker:
+            self.scanWorker.cancel()
+
+        self.scanId += 1
+        self.scanEntries = []
+
+        worker_scan = DirScanWorker(self.origin, self.dirPath, self.scanId)
+        worker_scan.batchReady.connect(self.onScanBatch)
+        worker_scan.finished.connect(self.onScanFinished)
+        self.scanWorker = worker_scan
+        self.origin.dataOps_threadpool.start(worker_scan)
+
+
+    def onScanBatch(self, scanId:int, entries:list) -> None:
+        if scanId == self.scanId:
+            self.scanEntries.extend(entries)
+
+
+    def onScanFinished(self, scanId:int, count:int) -> None:
+        if scanId != self.scanId or not self.dirPath:
+            return
+
+        self.scanWorker = None
+
+        current = {e["entry"]: e for e in self.scanEntries}
+        self.scanEntries = []
+
+        self.watchFiles(list(current.values()))
+
+        #   Entries that Match the Previous Scan have Finished Writing
+        unstable = {name for name, e in current.items()
+                    if self.lastScan.get(name) != self.getSignature(e)}
+        self.lastScan = {name: self.getSignature(e) for name, e in current.items()}
+
+        #   Hold all Image Changes while any Image is Unstable (Sequence being Written)
+        holdImages = any(current[name]["fileType"] == "Images" for name in unstable)
+
+        added = []
+        updated = []
+        removed = [self.known.pop(name) for name in list(self.known) if name not in current]
+
+        for name, entry in current.items():
+            if name in unstable:
+                continue
+            if holdImages and entry["fileType"] == "Images":
+                continue
+
+            if name not in self.known:
+                added.append(entry)
+            elif self.getSignature(self.known[name]) != self.getSignature(entry):
+                updated.append(entry)
+            else:
+                continue
+
+            self.known[name] = entry
+
+        if added or updated or removed:
+            logger.debug(f"Source Dir Changes: {len(added)} Added, {len(updated)} Updated, {len(removed)} Removed")
+            self.deltasReady.emit(added, updated, removed)
+
+        #   Poll Again until Everything has Settled
+        if unstable:
+            self.settleTimer.start(self.settleMs)
+
+
+    def getKnownEntries(self, fileType:str = None) -> list:
+        '''Returns the Known Entries (Optionally by File Type)'''
+
+        if fileType:
+            return [e for e in self.known.values() if e["fileType"] == fileType]
+
+        return list(self.known.values())
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import os
+import queue
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import exiftool
+
+
+logger = logging.getLogger(__name__)
+
+
+
+class ExifToolPool:
+    '''
+    Pool of Persistent (-stay_open) ExifTool Processes.\n
+    Each Process is Used by One Thread at a Time, and Files are Sent in Batches
+    so the Interpreter Startup is only Paid Once per Process.
+    '''
+
+    def __init__(self, executable:str, maxProcs:int=2, batchSize:int=50):
+        self.executable = executable
+        self.maxProcs = maxProcs
+        self.batchSize = batchSize
+
+        self._idle = queue.Queue()
+        self._procs = []
+        self._lock = threading.Lock()
+
+        #   Processes are Started and Used only from these Long-lived Threads
+        #   (on Linux PyExifTool Kills a Process when the Thread that Started it Exits)
+        self._executor = ThreadPoolExecutor(max_workers=maxProcs, thread_name_prefix="ExifTool")
+
+
+    def _acquire(self) -> exiftool.ExifTool:
+        '''Returns an Idle Process, Starts a New one if Under the Max, or Waits for One'''
+
+        while True:
+            try:
+                et = self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+            if et.running:
+                return et
+            self._drop(et)
+
+        with self._lock:
+            if len(self._procs) < self.maxProcs:
+                et = exiftool.ExifTool(self.executable)
+                et.run()
+                self._procs.append(et)
+                logger.debug(f"Started ExifTool Process ({len(self._procs)}/{self.maxProcs})")
+                return et
+
+        return self._idle.get()
+
+
+    def _drop(self, et:exiftool.ExifTool) -> None:
+        '''Removes an Exited Process from the Pool'''
+
+        with self._lock:
+            if et in self._procs:
+                self._procs.remove(et)
+
+
+    def _release(self, et:exiftool.ExifTool) -> None:
+        '''Returns the Process to the Pool (Dropped if it Exited)'''
+
+        if et.running:
+            self._idle.put(et)
+        else:
+            self._drop(et)
+
+
+    def _executeJson(self, *params) -> list:
+        et = self._acquire()
+        try:
+            return et.execute_json(*params)
+        finally:
+            self._release(et)
+
+
+    def executeJson(self, *params) -> list:
+        '''Runs execute_json() on a Pooled Process'''
+
+        return self._executor.submit(self._executeJson, *params).result()
+
+
+    @staticmethod
+    def _normPath(filePath:str) -> str:
+        return os.path.normcase(os.path.normpath(filePath))
+
+
+    def _getBatch(self, filePaths:list, args:tuple) -> dict:
+        '''Returns the Metadata of One Batch by Normalized Path'''
+
+        try:
+            results = self._executeJson(*args, *filePaths)
+
+        except Exception as e:
+            #   A Bad File can Fail the Whole Batch so Retry Individually
+            if len(filePaths) == 1:
+                logger.warning(f"Failed to get ExifTool metadata for {filePaths[0]}: {e}")
+                return {}
+
+            metadata = {}
+            for filePath in filePaths:
+                metadata.update(self._getBatch([filePath], args))
+            return metadata
+
+        return {self._normPath(r.get("SourceFile", "")): r for r in results or []}
+
+
+    def getMetadata(self, filePaths:list, args:tuple=("-G",)) -> dict:
+        '''Returns Dict of filePath: Metadata, Spreading the Batches Across the Pool'''
+
+        if not filePaths:
+            return {}
+
+        batches = [filePaths[i:i + self.batchSize] for i in range(0, len(filePaths), self.batchSize)]
+
+        results = self._executor.map(lambda b: self._getBatch(b, args), batches)
+
+        byPath = {}
+        for result in results:
+            byPath.update(result)
+
+        return {f: byPath.get(self._normPath(f), {}) for f in filePaths}
+
+
+    def terminate(self) -> None:
+        '''Stops all ExifTool Processes'''
+
+        with self._lock:
+            procs = self._procs
+            self._procs = []
+
+        for et in procs:
+            try:
+                et.terminate()
+            except Exception as e:
+                logger.warning(f"ERROR:  Failed to Stop ExifTool Process:\n{e}")
+
+        self._idle = queue.Queue()
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+
+class HashCache:
+    '''SQLite Cache of File Checksums Keyed by Path and Algorithm, Validated by Size, Mtime, and Inode'''
+
+    VERSION = 1
+    DB_NAME = "HashCache.db"
+
+    #   Entries are Evicted when Older than this or Beyond the Newest MAX_ENTRIES
+    MAX_AGE_DAYS = 90
+    MAX_ENTRIES = 250000
+
+    def __init__(self, cacheDir:str):
+        self.cacheDir = cacheDir
+        self.dbPath = os.path.join(cacheDir, self.DB_NAME)
+        self.enabled = True
+
+        #   Sqlite Connections cannot be Shared Between Threads
+        self._local = threading.local()
+
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+            self._getConnection()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Open Hash Cache at {self.dbPath}:\n{e}")
+            self.enabled = False
+            return
+
+        #   Evict Old Entries in the Background so the DB does not Grow without Bound
+        threading.Thread(target=self.prune, daemon=True).start()
+
+
+    def _getConnection(self) -> sqlite3.Connection:
+        '''Returns the Connection for the Current Thread'''
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.dbPath, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS hashes ("
+                "path TEXT NOT NULL, "
+                "algorithm TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "mtime INTEGER NOT NULL, "
+                "inode INTEGER NOT NULL, "
+                "version INTEGER NOT NULL, "
+                "digest TEXT NOT NULL, "
+                "stored INTEGER NOT NULL DEFAULT 0, "
+                "PRIMARY KEY (path, algorithm))"
+            )
+
+            #   DBs Created before Eviction have no Stored Time (Evicted on the Next Prune)
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(hashes)")]
+            if "stored" not in columns:
+                conn.execute("ALTER TABLE hashes ADD COLUMN stored INTEGER NOT NULL DEFAULT 0")
+
+            conn.execute("CREATE INDEX IF NOT EXISTS hashes_stored ON hashes (stored)")
+            conn.commit()
+            self._local.conn = conn
+
+        return conn
+
+
+    @staticmethod
+    def getFileIdentity(filePath:str, stat:os.stat_result=None) -> tuple[str, int, int, int]:
+        '''Returns the Normalized Path, Size, Mtime (ns), and Inode of the File'''
+
+        stat = stat or os.stat(filePath)
+        normPath = os.path.normcase(os.path.normpath(filePath))
+
+        return normPath, stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+    def get(self, filePath:str, algorithm:str, stat:os.stat_result=None) -> str | None:
+        '''Returns the Cached Digest if the File is Unchanged'''
+
+        if not self.enabled:
+            return None
+
+        try:
+            normPath, size, mtime, inode = self.getFileIdentity(filePath, stat)
+            row = self._getConnection().execute(
+                "SELECT size, mtime, inode, version, digest FROM hashes WHERE path = ? AND algorithm = ?",
+                (normPath, algorithm)
+            ).fetchone()
+
+            if row is None or row[:4] != (size, mtime, inode, self.VERSION):
+                return None
+
+            return row[4]
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Read Hash Cache for {filePath}:\n{e}")
+            return None
+
+
+    def putMany(self, entries:list) -> None:
+        '''Stores a List of (filePath, algorithm, digest, stat) in One Transaction'''
+
+        if not self.enabled or not entries:
+            return
+
+        try:
+            stored = int(time.time())
+            rows = []
+            for filePath, algorithm, digest, stat in entries:
+                normPath, size, mtime, inode = self.getFileIdentity(filePath, stat)
+                rows.append((normPath, algorithm, size, mtime, inode, self.VERSION, digest, stored))
+
+            conn = self._getConnection()
+            conn.executemany(
+                "INSERT OR REPLACE INTO hashes (path, algorithm, size, mtime, inode, version, digest, stored) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            conn.commit()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Write Hash Cache:\n{e}")
+
+
+    def put(self, filePath:str, algorithm:str, digest:str, stat:os.stat_result=None) -> None:
+        '''Stores the Digest of the File'''
+
+        self.putMany([(filePath, algorithm, digest, stat)])
+
+
+    def prune(self) -> int:
+        '''
+        Removes Entries Older than MAX_AGE_DAYS and all but the Newest MAX_ENTRIES.\n
+        Only Uses the Stored Times, so Files on Offline Drives are not Touched.
+        Returns the Number of Removed Entries
+        '''
+
+        if not self.enabled:
+            return 0
+
+        try:
+            conn = self._getConnection()
+            cutoff = int(time.time()) - self.MAX_AGE_DAYS * 86400
+
+            removed = conn.execute("DELETE FROM hashes WHERE stored < ?", (cutoff,)).rowcount
+            removed += conn.execute(
+                "DELETE FROM hashes WHERE rowid IN "
+                "(SELECT rowid FROM hashes ORDER BY stored DESC LIMIT -1 OFFSET ?)",
+                (self.MAX_ENTRIES,)
+            ).rowcount
+            conn.commit()
+
+            if removed:
+                logger.debug(f"Pruned {removed} Entries from the Hash Cache")
+
+            return removed
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Prune Hash Cache:\n{e}")
+            return 0
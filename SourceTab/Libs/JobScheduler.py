@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import logging
+
+
+from qtpy.QtCore import *
+from qtpy.QtGui import *
+from qtpy.QtWidgets import *
+
+
+logger = logging.getLogger(__name__)
+
+
+
+###     Scheduled Job Wrapper    ###
+
+class ScheduledJob(QObject, QRunnable):
+    '''Wraps a Worker so it can be Re-queued or Taken Back from its Threadpool'''
+
+    started = Signal()
+    finished = Signal(object)
+
+    def __init__(self, uuid, worker):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+
+        #   Kept Alive by the Scheduler (Needed for tryTake())
+        self.setAutoDelete(False)
+
+        self.uuid = uuid
+        self.worker = worker
+        self.state = "queued"
+
+
+    @Slot()
+    def run(self):
+        if self.state != "queued":
+            return
+
+        self.state = "running"
+        self.started.emit()
+
+        try:
+            self.worker.run()
+        finally:
+            self.state = "done"
+            self.finished.emit(self)
+
+
+
+###     Viewport Job Scheduler    ###
+
+class ViewportJobScheduler(QObject):
+    '''
+    Runs Per-item Probe / Hash / Thumbnail Workers by Viewport Priority\n
+    Visible Rows run First, then Near-visible Rows, and Everything Else at Idle Priority.
+    Queued Jobs are Re-prioritized on Scroll and Taken Back when Cancelled
+    '''
+
+    PRIORITY_VISIBLE = 2
+    PRIORITY_NEAR = 1
+    PRIORITY_IDLE = 0
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        #   Queued / Running Jobs by Item UUID
+        self.jobs = {}
+        #   Cancelled Jobs that were Already Running (Kept Alive until Done)
+        self.orphans = []
+
+        self.visible = set()
+        self.near = set()
+
+
+    def getPriority(self, uuid:str) -> int:
+        if uuid in self.visible:
+            return self.PRIORITY_VISIBLE
+        if uuid in self.near:
+            return self.PRIORITY_NEAR
+        return self.PRIORITY_IDLE
+
+
+    def submit(self, uuid:str, threadpool:QThreadPool, worker:QRunnable, onStarted:callable=None) -> ScheduledJob:
+        '''Queues a Worker for an Item at the Item's Current Priority'''
+
+        job = ScheduledJob(uuid, worker)
+        if onStarted:
+            #   Queued so the Callback Runs on the Main Thread
+            job.started.connect(onStarted, Qt.QueuedConnection)
+
+        #   Queued so the Job is Dropped on the Main Thread
+        job.finished.connect(self.onJobFinished, Qt.QueuedConnection)
+
+        self.jobs.setdefault(uuid, []).append((threadpool, job))
+        threadpool.start(job, self.getPriority(uuid))
+
+        return job
+
+
+    def onJobFinished(self, job:ScheduledJob) -> None:
+        '''Drops a Finished Job so it and its Worker are not Kept Alive'''
+
+        jobs = self.jobs.get(job.uuid)
+        if jobs:
+            jobs[:] = [entry for entry in jobs if entry[1] is not job]
+            if not jobs:
+                del self.jobs[job.uuid]
+
+        if job in self.orphans:
+            self.orphans.remove(job)
+
+
+    def setViewport(self, visibleUuids:list, nearUuids:list) -> None:
+        '''Re-prioritizes the Jobs of Items whose Viewport Tier has Changed'''
+
+        visible = set(visibleUuids)
+        near = set(nearUuids) - visible
+
+        changed = (visible ^ self.visible) | (near ^ self.near)
+        self.visible = visible
+        self.near = near
+
+        for uuid in changed:
+            self.reprioritize(uuid)
+
+
+    def reprioritize(self, uuid:str) -> None:
+        jobs = self.jobs.get(uuid)
+        if not jobs:
+            return
+
+        priority = self.getPriority(uuid)
+        remaining = []
+
+        for threadpool, job in jobs:
+            if job.state == "done":
+                continue
+
+            #   Only Queued Jobs can be Taken Back and Re-queued
+            if job.state == "queued" and threadpool.tryTake(job):
+                threadpool.start(job, priority)
+
+            remaining.append((threadpool, job))
+
+        if remaining:
+            self.jobs[uuid] = remaining
+        else:
+            self.jobs.pop(uuid, None)
+
+
+    def cancel(self, uuid:str) -> None:
+        '''Takes Back the Queued Jobs of an Item'''
+
+        for threadpool, job in self.jobs.pop(uuid, []):
+            if job.state == "queued" and threadpool.tryTake(job):
+                job.state = "done"
+            elif job.state == "running":
+                self.orphans.append(job)
+
+
+    def cancelAll(self) -> None:
+        '''Takes Back all Queued Jobs (such as when Navigating Away)'''
+
+        count = sum(len(jobs) for jobs in self.jobs.values())
+
+        for uuid in list(self.jobs):
+            self.cancel(uuid)
+
+        self.orphans = [job for job in self.orphans if job.state != "done"]
+        self.visible = set()
+        self.near = set()
+
+        if count:
+            logger.debug(f"Cancelled Scheduled Jobs: {count}")
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import os
+import threading
+import logging
+from collections import OrderedDict
+from typing import Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+
+###     Single In-flight Probe     ###
+class _ProbeJob:
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+
+class MediaProbe:
+    '''
+    Per-file Probe Results Shared by all Consumers.\n
+    Concurrent Requests for the Same File and Slice are Coalesced into One Job,
+    and Results are Served from Memory until the File Size or Mtime Changes.
+    '''
+
+    def __init__(self, maxEntries:int=1024):
+        self.maxEntries = maxEntries
+        self._results = OrderedDict()
+        self._inFlight = {}
+        self._lock = threading.Lock()
+
+
+    @staticmethod
+    def getFileKey(filePath:str) -> tuple[str, int, float]:
+        '''Returns the Normalized Path, Size, and Mtime of the File'''
+
+        stat = os.stat(filePath)
+        return os.path.normcase(os.path.normpath(filePath)), stat.st_size, stat.st_mtime
+
+
+    def peek(self, filePath:str, sliceName:str):
+        '''Returns the Slice if Already in Memory without Probing'''
+
+        try:
+            key = (self.getFileKey(filePath), sliceName)
+        except OSError:
+            return None
+
+        with self._lock:
+            return self._results.get(key)
+
+
+    def get(self, filePath:str, sliceName:str, producer:Callable):
+        '''Returns the Slice from Memory, an In-flight Job, or by Running producer(filePath)'''
+
+        try:
+            key = (self.getFileKey(filePath), sliceName)
+        except OSError:
+            return producer(filePath)
+
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key]
+
+            job = self._inFlight.get(key)
+            isOwner = job is None
+            if isOwner:
+                job = self._inFlight[key] = _ProbeJob()
+
+        #   Wait for the Thread that is Already Probing this File
+        if not isOwner:
+            job.event.wait()
+            if job.error:
+                raise job.error
+            return job.result
+
+        try:
+            job.result = producer(filePath)
+
+            with self._lock:
+                self._results[key] = job.result
+                while len(self._results) > self.maxEntries:
+                    self._results.popitem(last=False)
+
+            return job.result
+
+        except Exception as e:
+            job.error = e
+            raise
+
+        finally:
+            with self._lock:
+                self._inFlight.pop(key, None)
+            job.event.set()
+
+
+    def put(self, filePath:str, sliceName:str, result) -> None:
+        '''Stores a Slice Loaded Elsewhere (such as in a Batch)'''
+
+        try:
+            key = (self.getFileKey(filePath), sliceName)
+        except OSError:
+            return
+
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxEntries:
+                self._results.popitem(last=False)
+
+
+    def discard(self, filePath:str, sliceName:str) -> None:
+        '''Removes a Slice from Memory (such as a Failed Probe, so it is Retried)'''
+
+        try:
+            key = (self.getFileKey(filePath), sliceName)
+        except OSError:
+            return
+
+        with self._lock:
+            self._results.pop(key, None)
+
+
+    def clear(self) -> None:
+        '''Removes all Results from Memory'''
+
+        with self._lock:
+            self._results.clear()
@@ -2392,7 +2392,7 @@ class MetadataEditor(QWidget, Ui_w_metadataEditor):
     def loadFiles(self, loadFilepath=None):
         #   Get All Checked FileTiles in Dest List
         try:
-            fileTiles = self.sourceBrowser.getAllDestTiles(onlyChecked=False)
+            fileTiles = self.sourceBrowser.getAllDestItems(onlyChecked=False)
 
         except Exception as e:
             logger.warning(f"ERROR: Unable to get Destination FileTiles")
@@ -2400,6 +2400,11 @@ class MetadataEditor(QWidget, Ui_w_metadataEditor):
 
         activeFiles = []
 
+        #   Load ExifTool Metadata of New Files in Batches
+        newFiles = [ft.data.get("source_mainFile_path", "") for ft in fileTiles]
+        newFiles = [f for f in newFiles if not self.MetaFileItems.getByName(Utils.getBasename(f))]
+        Utils.prefetchExifMetadata(newFiles)
+
         #   Itterate through Files
         for fileTile in fileTiles:
             try:
@@ -1655,13 +1655,9 @@ class FrameCacheManager(QObject):
 
         else:
             mediaPath = self.mediaFiles[0]
-            container = av.open(mediaPath)
-            stream = container.streams.video[0]
-            self.totalFrames = stream.frames if stream.frames else sum(1 for _ in container.decode(stream))
+            self.totalFrames, codec = Utils.getVideoStreamInfo(mediaPath)
             if not self.codec:
-                self.codec = stream.codec_context.name.lower()
-
-            container.close()
+                self.codec = codec
 
         self.cache = {i: None for i in range(self.totalFrames)}
 
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import os
+import json
+import sqlite3
+import threading
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+
+class ProbeCache:
+    '''SQLite Cache of Media Probe Results Keyed by Path, Size, and Mtime'''
+
+    VERSION = 1
+    DB_NAME = "ProbeCache.db"
+
+    def __init__(self, cacheDir:str):
+        self.cacheDir = cacheDir
+        self.dbPath = os.path.join(cacheDir, self.DB_NAME)
+        self.enabled = True
+
+        #   Sqlite Connections cannot be Shared Between Threads
+        self._local = threading.local()
+
+        try:
+            os.makedirs(self.cacheDir, exist_ok=True)
+            self._getConnection()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Open Probe Cache at {self.dbPath}:\n{e}")
+            self.enabled = False
+
+
+    def _getConnection(self) -> sqlite3.Connection:
+        '''Returns the Connection for the Current Thread'''
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            #   Rollback Journal (not WAL) so the DB is Safe on Network Shares
+            conn = sqlite3.connect(self.dbPath, timeout=10)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS probes ("
+                "path TEXT NOT NULL, "
+                "probeType TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "mtime INTEGER NOT NULL, "
+                "version INTEGER NOT NULL, "
+                "frames INTEGER, "
+                "fps REAL, "
+                "secs REAL, "
+                "codec TEXT, "
+                "metadata TEXT, "
+                "width INTEGER, "
+                "height INTEGER, "
+                "PRIMARY KEY (path, probeType))"
+            )
+            conn.commit()
+            self._local.conn = conn
+
+        return conn
+
+
+    @staticmethod
+    def getFileKey(filePath:str) -> tuple[str, int, int]:
+        '''Returns the Normalized Path, Size, and Mtime of the File'''
+
+        stat = os.stat(filePath)
+        normPath = os.path.normcase(os.path.normpath(filePath))
+
+        #   Whole Seconds so Mtimes Match Across Filesystems and Platforms
+        return normPath, stat.st_size, int(stat.st_mtime)
+
+
+    def get(self, filePath:str, probeType:str) -> tuple | None:
+        '''Returns the Cached Probe Tuple if the File is Unchanged'''
+
+        if not self.enabled:
+            return None
+
+        try:
+            normPath, size, mtime = self.getFileKey(filePath)
+            row = self._getConnection().execute(
+                "SELECT size, mtime, version, frames, fps, secs, codec, metadata, width, height "
+                "FROM probes WHERE path = ? AND probeType = ?",
+                (normPath, probeType)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            cSize, cMtime, version, frames, fps, secs, codec, metadata, width, height = row
+            if cSize != size or cMtime != mtime or version != self.VERSION:
+                return None
+
+            return frames, fps, secs, codec, json.loads(metadata), width, height
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Read Probe Cache for {filePath}:\n{e}")
+            return None
+
+
+    def put(self, filePath:str, probeType:str, result:tuple) -> None:
+        '''Stores the Probe Tuple for the File'''
+
+        if not self.enabled:
+            return
+
+        try:
+            normPath, size, mtime = self.getFileKey(filePath)
+            frames, fps, secs, codec, metadata, width, height = result
+
+            conn = self._getConnection()
+            conn.execute(
+                "INSERT OR REPLACE INTO probes "
+                "(path, probeType, size, mtime, version, frames, fps, secs, codec, metadata, width, height) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (normPath, probeType, size, mtime, self.VERSION, int(frames), float(fps), float(secs),
+                 codec, json.dumps(metadata, default=str), int(width), int(height))
+            )
+            conn.commit()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Write Probe Cache for {filePath}:\n{e}")
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+
+import time
+import threading
+import logging
+from datetime import datetime
+from typing import Callable
+
+
+logger = logging.getLogger(__name__)
+
+
+
+def parseActiveHours(activeHours:str) -> tuple | None:
+    '''Parses "HH:MM-HH:MM" into (Start Minute, End Minute) of the Day (None = Always Active)'''
+
+    if not activeHours or not activeHours.strip():
+        return None
+
+    try:
+        start, end = (part.strip() for part in activeHours.split("-"))
+        startHour, startMin = (int(v) for v in start.split(":"))
+        endHour, endMin = (int(v) for v in end.split(":"))
+        return startHour * 60 + startMin, endHour * 60 + endMin
+
+    except ValueError:
+        logger.warning(f"ERROR:  Invalid Transfer Limit Hours '{activeHours}' (expected HH:MM-HH:MM)")
+        return None
+
+
+
+###     Token Bucket    ###
+
+class TokenBucket:
+    '''
+    Rate Limiter that Refills at rate Bytes per Second up to burst Seconds Worth.\n
+    Consuming may Overdraw the Bucket, and the Debt is Paid by Waiting (Rate 0 = Unlimited)
+    '''
+
+    def __init__(self, rate:float=0, burst:float=1.0):
+        self.burst = burst
+
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._tokens = rate * burst
+        self._last = time.monotonic()
+
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self._rate * self.burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+
+    def setRate(self, rate:float) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = rate
+            self._tokens = min(self._tokens, rate * self.burst)
+
+
+    def consume(self, size:int) -> None:
+        with self._lock:
+            if self._rate:
+                self._refill()
+                self._tokens -= size
+
+
+    def getDelay(self) -> float:
+        '''Seconds until the Bucket is out of Debt'''
+
+        with self._lock:
+            if not self._rate:
+                return 0.0
+
+            self._refill()
+            return max(0.0, -self._tokens / self._rate)
+
+
+
+###     Transfer Throttle    ###
+
+class TransferThrottle:
+    '''
+    Global and Per-destination Bandwidth Caps Shared by all Transfer Jobs\n
+    Rates are in Bytes per Second and can be Changed while Jobs are Running.
+    With activeHours ("HH:MM-HH:MM") the Caps only Apply During that Time of Day
+    '''
+
+    #   Longest Single Wait, so Rate Changes and Cancels are Picked Up
+    MAX_WAIT = 0.25
+
+    def __init__(self, globalRate:float=0, destRate:float=0, activeHours:str=""):
+        self.globalRate = globalRate
+        self.destRate = destRate
+        self.activeHours = parseActiveHours(activeHours)
+
+        self._lock = threading.Lock()
+        self._globalBucket = TokenBucket(globalRate)
+        self._destBuckets = {}
+
+
+    def setRates(self, globalRate:float, destRate:float) -> None:
+        with self._lock:
+            self.globalRate = globalRate
+            self.destRate = destRate
+
+            self._globalBucket.setRate(globalRate)
+            for bucket in self._destBuckets.values():
+                bucket.setRate(destRate)
+
+        logger.debug(f"Transfer Limits: Total {globalRate / 1024 / 1024:.0f} MB/s - Per Destination {destRate / 1024 / 1024:.0f} MB/s")
+
+
+    def setActiveHours(self, activeHours:str) -> None:
+        self.activeHours = parseActiveHours(activeHours)
+
+
+    def isActive(self) -> bool:
+        if not (self.globalRate or self.destRate):
+            return False
+
+        if self.activeHours is None:
+            return True
+
+        now = datetime.now()
+        minute = now.hour * 60 + now.minute
+        start, end = self.activeHours
+
+        #   Windows Past Midnight (22:00-06:00) Wrap Around
+        if start <= end:
+            return start <= minute < end
+        return minute >= start or minute < end
+
+
+    def getEffectiveRate(self) -> float | None:
+        '''Highest Rate a Transfer can Reach Under the Current Caps (None = Uncapped)'''
+
+        if not self.isActive():
+            return None
+
+        rates = [rate for rate in (self.globalRate, self.destRate) if rate]
+        return min(rates) if rates else None
+
+
+    def _getDestBucket(self, destKey:str) -> TokenBucket:
+        with self._lock:
+            bucket = self._destBuckets.get(destKey)
+            if bucket is None:
+                bucket = self._destBuckets[destKey] = TokenBucket(self.destRate)
+            return bucket
+
+
+    def throttle(self, size:int, destKeys:list, wait:Callable[[float], bool]) -> bool:
+        '''
+        Takes size Transferred Bytes from the Global and each Destination's Bucket, then Waits
+        (through wait(seconds), which Returns False if Cancelled) while any is in Debt.\n
+        Returns False if Cancelled
+        '''
+
+        if not self.isActive():
+            return True
+
+        buckets = [self._globalBucket] + [self._getDestBucket(destKey) for destKey in destKeys]
+        for bucket in buckets:
+            bucket.consume(size)
+
+        while True:
+            delay = max(bucket.getDelay() for bucket in buckets)
+            if delay <= 0:
+                return True
+
+            if not wait(min(delay, self.MAX_WAIT)):
+                return False
+
+            #   Caps Lifted or Outside the Active Hours
+            if not self.isActive():
+                return True
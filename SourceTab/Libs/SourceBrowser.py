@@ -87,7 +87,17 @@ import TileWidget as TileWidget
 from SourceFunctions import SourceFunctions
 from PopupWindows import DisplayPopup, WaitPopup
 from ElapsedTimer import ElapsedTimer
-from SourceTab_Models import PresetsCollection, FileTileMimeData
+from DirSnapshotCache import DirSnapshotCache
+from DirWatcher import DirWatcher
+from WorkerThreads import DirScanWorker, FileInfoWorker, FileHashWorker, FileCopyWorker
+from ProbeCache import ProbeCache
+from HashCache import HashCache
+from TransferJournal import TransferJournal
+from RateLimiter import TransferThrottle
+from TileViewLoader import TileViewLoader
+from JobScheduler import ViewportJobScheduler
+from TransferScheduler import TransferScheduler
+from SourceTab_Models import PresetsCollection, FileTileMimeData, FileTileListModel, FileTileDelegate
 import SourceTab_Utils as Utils
 
 import SourceBrowser_ui
@@ -150,8 +160,13 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         
         self.sourceDir = ""
         self.destDir = ""
+        self.backupDestDirs = []
+        self.syncTransfers = False
+        self.preallocateOverrides = {}
         self.selectedTiles = set()
         self.lastClickedTile = None
+        self.checkedTileUids = {"source": set(), "dest": set()}
+        self.tilesLocked = False
         self.resolvedProxyPaths = None
         self.proxyEnabled = False
         self.proxyMode = None
@@ -159,11 +174,24 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         self.nameMods = []
         self.metaEditor = None
         self.transferList = []
+        self.copyList = []
+        self.activeTransferTiles = set()
+        self.pendingProbes = set()
         self.initialized = False
         self.closeParm = "closeafterload"
 
+        self.sourceDataItems = []
+        self.sourceScanId = 0
+        self.sourceScanWorker = None
+        self.sourceSnapshot = None
+        self.sourceScanEntries = []
+        self.watchSourceDir = False
+
         self.cacheEnabled = True
 
+        #   Runs Probe / Hash / Thumb Work for Visible Rows First
+        self.jobScheduler = ViewportJobScheduler(self)
+
         #   Time to Detect Stalled Worker Threads
         self.stallInterval = 30
         
@@ -192,6 +220,27 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         #   Setup Worker Threadpools and Semephore Slots
         self.setupThreadpools()
 
+        #   Per-directory Snapshots for Instant Navigation
+        snapshotDir = os.path.join(Utils.getUserDataDir(self.core), "DirSnapshots")
+        self.dirSnapshotCache = DirSnapshotCache(snapshotDir)
+
+        #   Project-wide Media Probe Cache
+        FileInfoWorker.probeCache = ProbeCache(Utils.getProjectCacheDir(self.core))
+
+        #   Local Checksum Cache (Inodes are only Valid on this Machine)
+        FileHashWorker.hashCache = HashCache(Utils.getUserDataDir(self.core))
+
+        #   Journal of Transfers in Progress (for Resuming)
+        FileCopyWorker.transferJournal = TransferJournal(Utils.getUserDataDir(self.core))
+
+        #   Bandwidth Caps Shared by all Transfers (Changed Live from the Functions Panel)
+        FileCopyWorker.transferThrottle = TransferThrottle(activeHours=self.throttleHours)
+        self.setTransferThrottle()
+
+        #   Source Dir Change Watcher
+        self.sourceWatcher = DirWatcher(self)
+        self.sourceWatcher.deltasReady.connect(self.onSourceDirDeltas)
+
         #   Refreshes and Initializes
         self.refreshSourceItems()
         self.refreshDestItems()
@@ -244,6 +293,10 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         if hasattr(self, "PreviewPlayer"):
             self.PreviewPlayer.setTimelinePaused(True)
 
+        #   Cancel Queued and Running Transfers and Stop the Transfer Threads
+        if hasattr(self, "transferScheduler"):
+            self.transferScheduler.shutdown()
+
 
 ##########################
 ########    UI   #########
@@ -300,6 +353,19 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         self.lw_source.dragLeaveEvent = partial(self.onDragLeaveEvent, self.lw_source)
         self.lw_source.dropEvent = partial(self.onDropEvent, self.lw_source, "source")
 
+        #   Source Model with Tile Widgets Created only for Visible Rows
+        self.sourceModel = FileTileListModel(self, rowHeights={"folder": SOURCE_DIR_HEIGHT,
+                                                             "file": SOURCE_ITEM_HEIGHT})
+        self.lw_source.setModel(self.sourceModel)
+        self.lw_source.setItemDelegate(FileTileDelegate(self, self.lw_source, isPinned=self.isTilePinned))
+        self.lw_source.setLayoutMode(QListView.Batched)
+        self.sourceTileLoader = TileViewLoader(self.lw_source,
+                                               self.sourceModel,
+                                               createTile=self.createSourceTile,
+                                               releaseTile=self.releaseTile,
+                                               isPinned=self.isTilePinned)
+        self.sourceTileLoader.viewportChanged.connect(self.jobScheduler.setViewport)
+
         ##  Destination Panel
         #   Set Button Icons
         self.b_destPathUp.setIcon(upIcon)
@@ -320,6 +386,17 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         self.lw_destination.dragLeaveEvent = partial(self.onDragLeaveEvent, self.lw_destination)
         self.lw_destination.dropEvent = partial(self.onDropEvent, self.lw_destination, "dest")
 
+        #   Destination Model with Tile Widgets Created only for Visible Rows (and Running Transfers)
+        self.destModel = FileTileListModel(self, rowHeights={"file": SOURCE_ITEM_HEIGHT})
+        self.lw_destination.setModel(self.destModel)
+        self.lw_destination.setItemDelegate(FileTileDelegate(self, self.lw_destination, isPinned=self.isTilePinned))
+        self.lw_destination.setLayoutMode(QListView.Batched)
+        self.destTileLoader = TileViewLoader(self.lw_destination,
+                                             self.destModel,
+                                             createTile=self.createDestTile,
+                                             releaseTile=self.releaseTile,
+                                             isPinned=self.isTilePinned)
+
         ##  Right Side Panel
         self.lo_rightPanel = QVBoxLayout()
 
@@ -529,6 +606,9 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         self.sourceFuncts.chb_ovr_proxy.toggled.connect(self.toggleProxy)
         self.sourceFuncts.chb_ovr_fileNaming.toggled.connect(lambda: self.modifyFileNames())
         self.sourceFuncts.chb_ovr_metadata.toggled.connect(self.toggleMetadata)
+        self.sourceFuncts.chb_sync.toggled.connect(self.toggleSync)
+        self.sourceFuncts.sb_throttleRate.valueChanged.connect(self.setTransferThrottle)
+        self.sourceFuncts.sb_throttleDestRate.valueChanged.connect(self.setTransferThrottle)
 
         self.sourceFuncts.b_transfer_start.clicked.connect(self.startTransfer)
         self.sourceFuncts.b_transfer_pause.clicked.connect(self.pauseTransfer)
@@ -543,7 +623,6 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     @err_catcher(name=__name__)
     def rclList(self, pos, lw):
         cpos = QCursor.pos()
-        item = lw.itemAt(pos)
         sc = self.shortcutsByAction
 
         rcmenu = QMenu(self)
@@ -563,6 +642,12 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         if lw == self.lw_source:
             Utils.createMenuAction("Refresh List", shortcuts, rcmenu, self, self.refreshSourceItems)
 
+            watchAction = QAction("Watch Folder for Changes", self)
+            watchAction.setCheckable(True)
+            watchAction.setChecked(self.watchSourceDir)
+            watchAction.toggled.connect(self.toggleWatchSourceDir)
+            rcmenu.addAction(watchAction)
+
             funct = lambda: self.selectAll(mode="source")
             Utils.createMenuAction("Select All Tiles", shortcuts, rcmenu, self, funct)
 
@@ -580,6 +665,23 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
 
             Utils.createMenuAction("Remove All Tiles", shortcuts, rcmenu, self, self.clearTransferList)
 
+            rcmenu.addSeparator()
+            Utils.createMenuAction("Add Backup Destination", shortcuts, rcmenu, self, self.addBackupDest)
+
+            if self.backupDestDirs:
+                Utils.createMenuAction("Clear Backup Destinations", shortcuts, rcmenu, self, self.clearBackupDests)
+
+            if self.destDir and self.preallocateDest:
+                preallocMenu = QMenu("Preallocate Files", self)
+                for destDir in [self.destDir] + self.backupDestDirs:
+                    destDir = os.path.normpath(destDir)
+                    preallocAction = QAction(destDir, self)
+                    preallocAction.setCheckable(True)
+                    preallocAction.setChecked(self.isPreallocateEnabled(destDir))
+                    preallocAction.toggled.connect(lambda checked, d=destDir: self.setPreallocateEnabled(d, checked))
+                    preallocMenu.addAction(preallocAction)
+                rcmenu.addMenu(preallocMenu)
+
 
     #   Item Sorting Menu
     @err_catcher(name=__name__)
@@ -775,7 +877,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     #   Adds Dashed Outline to Table During Drag
     @err_catcher(name=__name__)
     def onDragMoveEvent(self, widget, objName, mode, e):
-        dashed = f"QListWidget#{objName} {{ border-style: dashed; border-color: rgb(100, 200, 100); border-width: 2px; }}"
+        dashed = f"QListView#{objName} {{ border-style: dashed; border-color: rgb(100, 200, 100); border-width: 2px; }}"
 
         if e.mimeData().hasUrls():
             e.acceptProposedAction()
@@ -922,8 +1024,22 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             settingData = sData["globals"]
             self.max_thumbThreads = settingData.get("max_thumbThreads", 6)
             self.max_copyThreads = settingData.get("max_copyThreads", 6)
+            self.deviceCopyThreads = {
+                "hdd": settingData.get("deviceThreads_hdd", 1),
+                "ssd": settingData.get("deviceThreads_ssd", 4),
+                "nvme": settingData.get("deviceThreads_nvme", 6),
+                "network": settingData.get("deviceThreads_network", 4),
+                }
+            self.sequenceCopyThreads = settingData.get("sequenceCopyThreads", 8)
             self.size_copyChunk = settingData.get("size_copyChunk", 2)
+            self.copyBufferCount = settingData.get("copyBufferCount", 4)
+            self.useKernelCopy = settingData.get("useKernelCopy", False)
+            self.resumeTransfers = settingData.get("resumeTransfers", True)
+            self.preallocateDest = settingData.get("preallocateDest", True)
+            self.throttleHours = settingData.get("throttleHours", "")
             self.max_proxyThreads = settingData.get("max_proxyThreads", 2)
+            self.hashAlgorithm = settingData.get("hashAlgorithm", Utils.DEFAULT_HASH_ALGORITHM)
+            self.verifyReadBack = settingData.get("verifyReadBack", True)
             self.progUpdateInterval = settingData.get("updateInterval", 1.0)
             self.useCompletePopup = settingData.get("useCompletePopup", True)
             self.useCompleteSound = settingData.get("useCompleteSound", True)
@@ -943,6 +1059,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             self.b_source_sorting_duration.setChecked(tabData.get("enable_frames", False))
             self.b_source_sorting_combineSeqs.setChecked(tabData.get("source_combineSeq", True)) 
             self.b_dest_sorting_combineSeqs.setChecked(tabData.get("dest_combineSeq", True)) 
+            self.watchSourceDir = tabData.get("source_watchDir", False)
 
             #   Media Player Enabled Button
             playerEnabled = tabData.get("playerEnabled", True)
@@ -993,8 +1110,13 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
                 saved = metadataSettings.get("sidecarStates") or {}
                 self.sidecarStates = {**self.sidecarStates, **saved}
 
-            #   Overwrite Option
+            #   Overwrite and Sync Options
             self.sourceFuncts.chb_overwrite.setChecked(tabData.get("enable_overwrite", False))
+            self.sourceFuncts.chb_sync.setChecked(tabData.get("enable_sync", False))
+
+            #   Transfer Speed Limits
+            self.sourceFuncts.sb_throttleRate.setValue(tabData.get("throttleRate", 0))
+            self.sourceFuncts.sb_throttleDestRate.setValue(tabData.get("throttleDestRate", 0))
 
             self.sourceFuncts.updateUI()
 
@@ -1179,7 +1301,6 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     def setupThreadpools(self):
         try:
             self.thumb_semaphore = QSemaphore(self.max_thumbThreads)
-            self.copy_semaphore = QSemaphore(self.max_copyThreads)
             self.proxy_semaphore = QSemaphore(self.max_proxyThreads)
 
             self.thumb_threadpool = QThreadPool()
@@ -1191,10 +1312,25 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             self.cache_threadpool = QThreadPool()
             self.cache_threadpool.setMaxThreadCount(6)
 
+            #   Fixed Pool of Transfer Threads with a Job Queue (Limited per Source / Dest Device)
+            self.transferScheduler = TransferScheduler(self.max_copyThreads, deviceLimits=self.deviceCopyThreads)
+
         except Exception as e:
             logger.warning(f"ERROR:  Failed to Set Threadpools:\n{e}")
 
 
+    #   Applies the Functions Panel Speed Limits to the Shared Throttle (Live During a Transfer)
+    @err_catcher(name=__name__)
+    def setTransferThrottle(self, *args):
+        throttle = FileCopyWorker.transferThrottle
+        if not throttle:
+            return
+
+        MB = 1024 * 1024
+        throttle.setRates(self.sourceFuncts.sb_throttleRate.value() * MB,
+                          self.sourceFuncts.sb_throttleDestRate.value() * MB)
+
+
     #   Configures the UI Buttons based on Transfer Status
     @err_catcher(name=__name__)
     def configTransUI(self, mode):
@@ -1283,6 +1419,8 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             for item in lockItems:
                 item.setEnabled(enabled)
 
+            self.tilesLocked = not enabled
+
             for fileTile in self.getAllSourceTiles():
                 fileTile.tileLocked = not enabled
 
@@ -1303,15 +1441,10 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     @err_catcher(name=__name__)
     def getTotalTransferSize(self):
         try:
-            listWidget = self.lw_destination
             total_transferSize = 0.0
 
-            for i in range(listWidget.count()):
-                listItem = listWidget.item(i)
-                fileItem = listWidget.itemWidget(listItem)
-
-                if fileItem is not None and fileItem.isChecked():
-                    total_transferSize += fileItem.getTransferSize(self.proxyEnabled, self.proxyMode)
+            for fileItem in self.getAllDestItems(onlyChecked=True):
+                total_transferSize += fileItem.getTransferSize(self.proxyEnabled, self.proxyMode)
 
             logger.debug("Fetched Total Transfer Size")
             return total_transferSize
@@ -1346,6 +1479,12 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
                 else:
                     speed_bps = 0
 
+            #   A Speed Limit Caps the Speed the Remaining Bytes will Transfer at
+            throttle = FileCopyWorker.transferThrottle
+            capRate = throttle.getEffectiveRate() if throttle else None
+            if capRate:
+                speed_bps = min(speed_bps, capRate) if speed_bps > 0 else capRate
+
             #   Estimate Remaining Time
             if speed_bps > 0:
                 remaining_bytes = totalSize - copiedSize
@@ -1399,14 +1538,13 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         self.refreshStatus = "valid"
 
 
+    #   Returns the Live (Created) Source Tiles
     @err_catcher(name=__name__)
     def getAllSourceTiles(self):
         tiles = []
 
         try:
-            for i in range(self.lw_source.count()):
-                item = self.lw_source.item(i)
-                widget = self.lw_source.itemWidget(item)
+            for widget in self.sourceTileLoader.getTiles():
                 if isinstance(widget, TileWidget.SourceFileTile):
                     tiles.append(widget)
 
@@ -1417,14 +1555,16 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             logger.warning(f"ERROR:  Failed to Fetch All Source Tiles:\n{e}")
 
 
+    #   Returns the Live Destination Tiles (Checked Rows Get Tiles Created for the Transfer)
     @err_catcher(name=__name__)
     def getAllDestTiles(self, onlyChecked=False):
         tiles = []
 
         try:
-            for i in range(self.lw_destination.count()):
-                item = self.lw_destination.item(i)
-                widget = self.lw_destination.itemWidget(item)
+            if onlyChecked:
+                self.destTileLoader.loadUuids(self.checkedTileUids["dest"])
+
+            for widget in self.destTileLoader.getTiles():
                 if isinstance(widget, TileWidget.DestFileTile):
                     if onlyChecked:
                         if widget.isChecked():
@@ -1439,32 +1579,51 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             logger.warning(f"ERROR:  Failed to Fetch All Destination Tiles:\n{e}")
 
 
+    #   Returns the Destination Data Items of the Listed Rows (Including Rows without a Live Tile)
+    @err_catcher(name=__name__)
+    def getAllDestItems(self, onlyChecked=False):
+        items = []
+
+        for dataItem in self.destModel.items():
+            if dataItem["tileType"] != "file":
+                continue
+            if onlyChecked and dataItem["data"]["uuid"] not in self.checkedTileUids["dest"]:
+                continue
+
+            items.append(dataItem["tile"])
+
+        return items
+
+
     @err_catcher(name=__name__)
     def selectAll(self, checked=True, mode=None):
         logger.debug(f"Selecting All - checked: {checked}")
 
         if mode == "source":
             listWidget = self.lw_source
+            model = self.sourceModel
+            loader = self.sourceTileLoader
         elif mode == "dest":
             listWidget = self.lw_destination
+            model = self.destModel
+            loader = self.destTileLoader
         else:
             return
 
         #   Capture Current Scroll Position
         scrollPos = listWidget.verticalScrollBar().value()
 
-        item_count = listWidget.count()
-
-        for i in range(item_count):
-            item = listWidget.item(i)
-            fileItem = listWidget.itemWidget(item)
+        #   Set the Checked State of All File Rows (Including Rows without a Live Tile)
+        fileUids = {i["data"]["uuid"] for i in model.items() if i["tileType"] == "file"}
+        if checked:
+            self.checkedTileUids[mode].update(fileUids)
+        else:
+            self.checkedTileUids[mode].difference_update(fileUids)
 
-            if (
-                fileItem is not None
-                and not item.isHidden()
-                and getattr(fileItem, "data", {}).get("tileType") == "file"
-                ):
+        for uuid in fileUids:
+            fileItem = loader.getTile(uuid)
 
+            if fileItem is not None:
                 fileItem.setSelected(checked=True, additive=True, set_focus=False)
                 fileItem.setChecked(checked, refresh=False)
 
@@ -1559,6 +1718,50 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             return selected_path
 
 
+    #   Adds a Backup Destination that Receives the Same Files from a Single Source Read
+    @err_catcher(name=__name__)
+    def addBackupDest(self):
+        selected_path = Utils.explorerDialogue(title="Select Backup Destination Directory",
+                                               dir=self.destDir, selDir=True)
+        if not selected_path:
+            return
+
+        if os.path.isfile(selected_path):
+            selected_path = os.path.dirname(selected_path)
+
+        backupDir = os.path.normpath(selected_path)
+
+        if backupDir == os.path.normpath(self.destDir) or backupDir in self.backupDestDirs:
+            self.core.popup(f"Directory is Already a Destination:\n\n{backupDir}")
+            return
+
+        self.backupDestDirs.append(backupDir)
+        logger.debug(f"Added Backup Destination: {backupDir}")
+        self.refreshDestItems()
+
+
+    @err_catcher(name=__name__)
+    def clearBackupDests(self):
+        self.backupDestDirs = []
+        self.refreshDestItems()
+
+
+    #   Returns True if Files Copied to the Destination are Preallocated
+    @err_catcher(name=__name__)
+    def isPreallocateEnabled(self, destDir):
+        if not self.preallocateDest:
+            return False
+
+        return self.preallocateOverrides.get(os.path.normpath(destDir), True)
+
+
+    #   Toggles Preallocation for a Single Destination (such as a Drive that Dislikes it)
+    @err_catcher(name=__name__)
+    def setPreallocateEnabled(self, destDir, enabled):
+        self.preallocateOverrides[os.path.normpath(destDir)] = enabled
+        logger.debug(f"Preallocation {'Enabled' if enabled else 'Disabled'} for: {destDir}")
+
+
     #   Handles Addressbar Logic
     @err_catcher(name=__name__)
     def onPasteAddress(self, mode):
@@ -1566,7 +1769,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             if mode == "source":
                 attribute = "sourceDir"
                 addrBar = self.le_sourcePath
-                refreshFunc = self.refreshSourceItems
+                refreshFunc = lambda: self.refreshSourceItems(useCache=True)
 
             elif mode == "dest":
                 attribute = "destDir"
@@ -1601,7 +1804,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     def goUpDir(self, mode):
         if mode == "source":
             attribute = "sourceDir"
-            refreshFunc = self.refreshSourceItems
+            refreshFunc = lambda: self.refreshSourceItems(useCache=True)
 
         elif mode == "dest":
             attribute = "destDir"
@@ -1682,134 +1885,41 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             return fileType
 
 
-    #   Show/Hide FileTiles Based on Table Filters
+    #   Passes the Sort Options and Filter States to the Table Model
     @err_catcher(name=__name__)
-    def applyTableFilters(self, table, sortedList):
+    def configTableModel(self, table):
         try:
-            #   Get Filter Settings
             if table == "source":
+                model = self.sourceModel
                 filterEnabled = self.b_source_sorting_filtersEnable.isChecked()
                 filterStates = self.filterStates_source
             elif table == "destination":
+                model = self.destModel
                 filterEnabled = self.b_dest_sorting_filtersEnable.isChecked()
                 filterStates = self.filterStates_dest
             else:
-                #   Fallback Return Original List
-                return sortedList
-            
-            #   If Filters Not Enabled, Skip Filtering
-            if not filterEnabled:
-                return sortedList
-
-            #   Make Filtered List
-            filteredList = []
-            for item in sortedList:
-                data = item.get("data", {})
-                fileType = data.get("fileType", "Other").capitalize()
-
-                #   Small Hack to Cover UI Naming
-                if fileType == "Image sequence":
-                    fileType = "Sequences"
+                return
 
-                if filterStates.get(fileType, True):
-                    filteredList.append(item)
+            model.setSortOptions(self.sortOptions.get(table, {}))
+            model.setFilterStates(filterStates if filterEnabled else None)
 
-            return filteredList
+            return model
 
         except Exception as e:
-            logger.warning(f"ERROR: Unable to Apply '{table}' Table Filters:\n{e}")
-
-            return sortedList
-
-
-    #   Sort Items According to User Selection
-    @err_catcher(name=__name__)
-    def applySorting(self, table, origList):
-        #   Get Selected Options
-        opts = self.sortOptions.get(table, {})
-        sortType = opts.get("sortType", "name")
-        ascending = opts.get("ascending", True)
-        groupTypes = opts.get("groupTypes", True)
-
-        #   Folder/File Separation
-        folderList = [item for item in origList if item["data"].get("tileType") == "folder"]
-        fileList = [item for item in origList if item["data"].get("tileType") != "folder"]
-
-        # Sort Folders Alphabetically
-        sortedFolders = sorted(folderList, key=lambda x: x["data"].get("displayName", "").lower())
-
-        #   Sorting Order for Tile Types
-        typePriority = {
-            "Videos": 0,
-            "Image Sequence": 1,
-            "Images": 2,
-            "Audio": 3,
-            "Other": 4
-        }
-
-        #   Sort Order
-        reverse = not ascending
-
-        #   Get Sort Key
-        def get_sort_key(item):
-            data = item["data"]
-            match sortType:
-                case "name":
-                    return data.get("displayName", "").lower()
-                case "size":
-                    if data.get("fileType", "") == "Image Sequence":
-                        return data.get("seqSize", 0)
-                    else:
-                        return data.get("source_mainFile_size_raw", 0)
-                case "date":
-                    return data.get("source_mainFile_date_raw", 0)
-                case _:
-                    return data.get("displayName", "").lower()
-
-        #   Flat Sort
-        if not groupTypes:
-            sortedFiles = sorted(fileList, key=get_sort_key, reverse=reverse)
-
-        #   Grouped Sort
-        else:
-            grouped = {}
-            for item in fileList:
-                ftype = item["data"].get("fileType", "Other")
-                grouped.setdefault(ftype, []).append(item)
-
-            #   Sort Groups by typePriority, then Sort Each Group
-            sortedFiles = []
-            for ftype in sorted(grouped.keys(), key=lambda t: typePriority.get(t, 99)):
-                groupItems = sorted(grouped[ftype], key=get_sort_key, reverse=reverse)
-                sortedFiles.extend(groupItems)
-
-        return sortedFolders + sortedFiles
-
-
-    #   Update Table using Filters and Sorting
-    @err_catcher(name=__name__)
-    def sortTable(self, table, origList):
-        #   Make Copy of Item List
-        origList_copy = origList.copy()
-
-        #   Sort the Items
-        sortedList = self.applySorting(table, origList_copy)
-
-        #   Filter the Items
-        if ((table == "source" and self.b_source_sorting_filtersEnable.isChecked()) or
-            (table == "destination" and self.b_dest_sorting_filtersEnable.isChecked())):
-
-            sortedList = self.applyTableFilters(table, sortedList)
-
-        return sortedList
+            logger.warning(f"ERROR: Unable to Configure '{table}' Table Model:\n{e}")
 
 
     #   Build List of Items in Source Directory
     @err_catcher(name=__name__)
-    def refreshSourceItems(self):
-        WaitPopup.showPopup(parent=self.projectBrowser)
-
+    def refreshSourceItems(self, useCache=False):
         try:
+            #   Cancel any Running Scan and Stop Watching the Previous Dir
+            self.cancelSourceScan()
+            self.sourceWatcher.stop()
+
+            #   Drop Queued Probe / Hash / Thumb Jobs of the Previous Items
+            self.jobScheduler.cancelAll()
+
             #   Get Dir and Set Short Name
             sourceDir = getattr(self, "sourceDir", "")
             metrics = QFontMetrics(self.le_sourcePath.font())
@@ -1825,173 +1935,411 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
                 self.le_sourcePath.setStyleSheet("")
 
             #   Capture Scrollbar Position
-            scrollPos = self.lw_destination.verticalScrollBar().value()
+            self.sourceScrollPos = self.lw_source.verticalScrollBar().value()
 
-            #   Get all Items from the Source Dir
-            allSourceDirItems = os.listdir(self.sourceDir)
-
-            #   Get File Type Info
-            allEntries = []
-            for entry in allSourceDirItems:                
-                fullPath = os.path.join(self.sourceDir, entry)
-                fileType = self.getFileType(fullPath)
-
-                allEntries.append({
-                    "entry": entry,
-                    "displayName": entry,
-                    "fullPath": fullPath,
-                    "fileType": fileType,
-                    "seqFiles": None,
-                    "seqSize": None
-                })
+            #   Reset Table and Data Items
+            self.sourceDataItems = []
+            self.sourceScanEntries = []
+            self.sourceScanItems = []
+            self.sourceScanImages = []
+            self.sourceModel.clear()
+            self.configTableModel("source")
 
-            #   Sort Files by File Type
-            imageEntries = []
-            otherEntries = []
-            for info in allEntries:
-                if os.path.isdir(info["fullPath"]):
-                    otherEntries.append(info)
+            combineSeqs = self.b_source_sorting_combineSeqs.isChecked()
+            self.sourceScanDirMtime = os.stat(self.sourceDir).st_mtime
 
-                elif info["fileType"] == "Images":
-                    imageEntries.append(info)
+            #   Render Instantly from the Snapshot Cache (Revalidated by the Scan)
+            self.sourceSnapshot = None
+            if useCache:
+                self.sourceSnapshot = self.dirSnapshotCache.load(self.sourceDir, combineSeqs)
 
-                else:
-                    otherEntries.append(info)
+                if self.sourceSnapshot:
+                    for itemData in self.sourceSnapshot["items"]:
+                        self.createSourceItem(itemData)
 
-            #   Group Image Sequences if Enabled
-            if self.b_source_sorting_combineSeqs.isChecked():
-                groupedImages = []
+                    self.refreshSourceTable()
+                    logger.debug(f"Loaded Source Items from Snapshot: {self.sourceDir}")
 
-                #   Group Sequences
-                seqs = self.core.media.detectSequences([i["entry"] for i in imageEntries])
+            #   Scan the Source Dir in the Background and Stream Results to the Table
+            self.sourceScanId += 1
+            worker_scan = DirScanWorker(self, self.sourceDir, self.sourceScanId)
+            worker_scan.batchReady.connect(self.onSourceScanBatch)
+            worker_scan.finished.connect(self.onSourceScanFinished)
+            self.sourceScanWorker = worker_scan
+            self.dataOps_threadpool.start(worker_scan)
 
-                #   Parse Sequences
-                for seq_pattern, files in seqs.items():
-                    if not files:
-                        continue
+            logger.debug(f"Started Source Scan: {self.sourceDir}")
 
-                    files = sorted(files)
-                    #   Sequences
-                    if len(files) > 1:
-                        rep = files[0]
-                        #   Get Match Info for Sequence
-                        repInfo = next((i for i in imageEntries if i["entry"] == rep), None)
-                        if repInfo:
-                            repInfo["displayName"] = seq_pattern
-                            repInfo["fileType"] = "Image Sequence"
-                            repInfo["seqFiles"] = [os.path.join(self.sourceDir, f) for f in files]
-
-                            seqSize = 0
-                            for file in repInfo["seqFiles"]:
-                                seqSize += Utils.getFileSize(file)
-                            repInfo["seqSize"] = seqSize
-
-                            groupedImages.append(repInfo)
-
-                    #   Single Images
-                    else:
-                        rep = files[0]
-                        repInfo = next((i for i in imageEntries if i["entry"] == rep), None)
-                        if repInfo:
-                            groupedImages.append(repInfo)
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Refresh Source Items:\n{e}")
 
-                imageEntries = groupedImages
 
-            #   Combine Sequences and Other Files
-            allSourceItems = imageEntries + otherEntries
+    #   Stops the Running Source Dir Scan
+    @err_catcher(name=__name__)
+    def cancelSourceScan(self):
+        if getattr(self, "sourceScanWorker", None):
+            self.sourceScanWorker.cancel()
+            self.sourceScanWorker = None
 
 
-            #   Create Data Item for Each Item in Dir
-            self.sourceDataItems = []
-            for itemData in allSourceItems:
-                self.createSourceItem(itemData)
+    #   Adds a Batch of Scanned Entries to the Source Table
+    @err_catcher(name=__name__)
+    def onSourceScanBatch(self, scanId, entries):
+        #   Ignore Batches from a Superseded Scan
+        if scanId != self.sourceScanId:
+            return
+
+        self.sourceScanEntries.extend(entries)
+
+        #   Only Collect the Entries when Revalidating a Snapshot
+        if self.sourceSnapshot:
+            return
+
+        try:
+            newItems = self.createScanItems(entries)
+            self.addSourceTableRows(newItems)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Add Source Scan Batch:\n{e}")
+
+
+    #   Creates Data Items for Scanned Entries
+    @err_catcher(name=__name__)
+    def createScanItems(self, entries):
+        combineSeqs = self.b_source_sorting_combineSeqs.isChecked()
+        newItems = []
+
+        for itemData in entries:
+            #   Hold Images Until the Scan is Complete for Sequence Grouping
+            if combineSeqs and itemData["fileType"] == "Images":
+                self.sourceScanImages.append(itemData)
+                continue
+
+            dataItem = self.createSourceItem(itemData)
+            if dataItem:
+                self.sourceScanItems.append(itemData)
+                newItems.append(dataItem)
+
+        return newItems
+
+
+    #   Groups Held Images and Sorts the Completed Source Table
+    @err_catcher(name=__name__)
+    def onSourceScanFinished(self, scanId, count):
+        if scanId != self.sourceScanId:
+            return
+
+        self.sourceScanWorker = None
+
+        try:
+            #   Keep the Snapshot Items if Nothing has Changed
+            if self.sourceSnapshot:
+                if self.dirSnapshotCache.matches(self.sourceSnapshot, self.sourceScanEntries):
+                    logger.debug(f"Source Snapshot is Current: {self.sourceDir}")
+                    self.sourceSnapshot = None
+                    self.startSourceWatcher()
+                    return
+
+                #   Otherwise Rebuild from the Scan
+                logger.debug(f"Source Snapshot Changed, Rebuilding: {self.sourceDir}")
+                self.sourceSnapshot = None
+                self.sourceDataItems = []
+                self.createScanItems(self.sourceScanEntries)
+
+            #   Group Image Sequences
+            if self.sourceScanImages:
+                for itemData in self.groupImageSequences(self.sourceScanImages):
+                    if self.createSourceItem(itemData):
+                        self.sourceScanItems.append(itemData)
+
+                self.sourceScanImages = []
 
             #   Sort / Filter / Refresh Source Table
             self.refreshSourceTable()
 
             #   Reposition Scrollbar
-            QTimer.singleShot(50, lambda: self.lw_destination.verticalScrollBar().setValue(scrollPos))
+            scrollPos = getattr(self, "sourceScrollPos", 0)
+            QTimer.singleShot(50, lambda: self.lw_source.verticalScrollBar().setValue(scrollPos))
+
+            #   Save Snapshot for Later Navigation
+            self.dirSnapshotCache.save(self.sourceDir,
+                                       self.b_source_sorting_combineSeqs.isChecked(),
+                                       self.sourceScanDirMtime,
+                                       self.sourceScanEntries,
+                                       self.sourceScanItems)
+
+            self.startSourceWatcher()
+
+            logger.debug(f"Source Scan Complete: {count} Items")
 
         except Exception as e:
-            logger.warning(f"ERROR:  Failed to Refresh Source Items:\n{e}")
+            logger.warning(f"ERROR:  Failed to Complete Source Scan:\n{e}")
 
-        finally:
-            QTimer.singleShot(0, WaitPopup.closePopup)
 
+    #   Toggles Watching the Source Dir for Changes
+    @err_catcher(name=__name__)
+    def toggleWatchSourceDir(self, checked):
+        self.watchSourceDir = checked
+
+        if not checked:
+            self.sourceWatcher.stop()
 
-    #   Sort / Filter / Refresh Source Table
+        #   If a Scan is Running the Watcher will Start when it Completes
+        elif not self.sourceScanWorker:
+            self.startSourceWatcher()
+
+
+    #   Starts the Watcher from the Last Completed Scan
     @err_catcher(name=__name__)
-    def refreshSourceTable(self, restoreSelection=False):
-        WaitPopup.showPopup(parent=self.projectBrowser)
+    def startSourceWatcher(self):
+        if self.watchSourceDir and os.path.isdir(self.sourceDir):
+            self.sourceWatcher.start(self.sourceDir, self.sourceScanEntries)
+
+
+    #   Returns Comparable Signature of a Source Item's Files
+    @err_catcher(name=__name__)
+    def getSourceItemSignature(self, data):
+        if data.get("seqFiles"):
+            return tuple(data["seqFiles"]), data.get("seqSize")
+
+        return (data.get("source_mainFile_path"),
+                data.get("source_mainFile_size_raw"),
+                data.get("source_mainFile_date_raw"))
 
+
+    #   Applies Watcher Add/Update/Remove Deltas without Rebuilding Unchanged Items
+    @err_catcher(name=__name__)
+    def onSourceDirDeltas(self, added, updated, removed):
         try:
-            #   Save Selection State if Needed
-            if restoreSelection:
-                self.sourceSelState = {}
-                for row in range(self.lw_source.count()):
-                    item = self.lw_source.item(row)
-                    fileTile = self.lw_source.itemWidget(item)
-                    if fileTile and isinstance(fileTile, TileWidget.SourceFileTile):
-                        key = fileTile.data["uuid"]
-                        self.sourceSelState[key] = fileTile.isChecked()
-
-            #   Sort the Table Items
-            sourceDataItems_sorted = self.sortTable("source", self.sourceDataItems)
-
-            # Reset Table
-            self.lw_source.clear()
-            row = 0
-
-            #   Iterate Sorted Items and Create Tile UI Widgets
-            for dataItem in sourceDataItems_sorted:
-                data = dataItem.get("data", {})
-                tileType = dataItem["tileType"]
-                displayName = data["displayName"]
-                fileType = data["fileType"]
-                uuid = data["uuid"]
-
-                if tileType == "folder":
-                    itemTile = TileWidget.FolderItem(self, data)
-                    rowHeight = SOURCE_DIR_HEIGHT
+            combineSeqs = self.b_source_sorting_combineSeqs.isChecked()
+            itemsByPath = {item["data"].get("source_mainFile_path") or item["data"].get("dirPath"): item
+                           for item in self.sourceDataItems}
+
+            removeUids = set()
+            newEntries = []
+            imagesChanged = False
+
+            #   Removed or Modified Items
+            for entry in removed + updated:
+                if combineSeqs and entry["fileType"] == "Images":
+                    imagesChanged = True
+                    continue
 
-                else:
-                    fileItem = dataItem["tile"]
-
-                    itemTile = TileWidget.SourceFileTile(fileItem, fileType)
-                    rowHeight = SOURCE_ITEM_HEIGHT
-
-                #   Set Row Size and Add File Tile widget and Data to Row
-                list_item = QListWidgetItem()
-                list_item.setSizeHint(QSize(0, rowHeight))
-                list_item.setData(Qt.UserRole, {
-                    "displayName": displayName,
-                    "tileType": tileType,
-                    "fileType": fileType,
-                    "uuid": uuid
-                })
+                item = itemsByPath.get(entry["fullPath"])
+                if item:
+                    removeUids.add(item["data"]["uuid"])
+
+            #   New or Modified Items
+            for entry in added + updated:
+                if combineSeqs and entry["fileType"] == "Images":
+                    imagesChanged = True
+                    continue
+
+                newEntries.append(entry)
+
+            #   Regroup Images and Only Replace Sequences that Changed
+            if imagesChanged:
+                images = [dict(e) for e in self.sourceWatcher.getKnownEntries("Images")]
+                groups = {g["displayName"]: g for g in self.groupImageSequences(images)}
+
+                for item in self.sourceDataItems:
+                    data = item["data"]
+                    if data.get("fileType") not in ("Images", "Image Sequence"):
+                        continue
+
+                    group = groups.get(data["displayName"])
+                    if group:
+                        groupData = {"seqFiles": group["seqFiles"],
+                                     "seqSize": group["seqSize"],
+                                     "source_mainFile_path": group["fullPath"],
+                                     "source_mainFile_size_raw": group["size"],
+                                     "source_mainFile_date_raw": group["mtime"]}
+
+                        if self.getSourceItemSignature(data) == self.getSourceItemSignature(groupData):
+                            groups.pop(data["displayName"])
+                            continue
+
+                    removeUids.add(data["uuid"])
+
+                newEntries.extend(groups.values())
+
+            #   Remove Items and their Rows
+            if removeUids:
+                self.sourceDataItems = [i for i in self.sourceDataItems if i["data"]["uuid"] not in removeUids]
+                self.checkedTileUids["source"].difference_update(removeUids)
+                self.sourceModel.removeUuids(removeUids)
+
+                for uuid in removeUids:
+                    self.jobScheduler.cancel(uuid)
 
-                self.lw_source.addItem(list_item)
-                self.lw_source.setItemWidget(list_item, itemTile)
+            #   Create only the New Items (Existing Items Keep their Probe Data)
+            for itemData in newEntries:
+                self.createSourceItem(itemData)
+
+            if newEntries:
+                self.refreshSourceTable(restoreSelection=True)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Apply Source Dir Changes:\n{e}")
+
+
+    #   Groups Image Entries into Image Sequences
+    @err_catcher(name=__name__)
+    def groupImageSequences(self, imageEntries):
+        groupedImages = []
+
+        #   Index Entries by Filename and Reuse the Scanned Sizes
+        entryIndex = {i["entry"]: i for i in imageEntries}
+        sizes = {name: info.get("size") for name, info in entryIndex.items()}
 
-                row += 1
+        #   Group Sequences
+        seqs = self.core.media.detectSequences(list(entryIndex))
+        records = Utils.buildSequenceRecords(self.sourceDir, seqs, sizes)
+
+        for record in records:
+            repInfo = entryIndex.get(record.files[0])
+            if not repInfo:
+                continue
+
+            #   Sequences
+            if record.frameCount > 1:
+                repInfo["displayName"] = record.pattern
+                repInfo["fileType"] = "Image Sequence"
+                repInfo["seqFiles"] = record.filePaths()
+                repInfo["seqSize"] = record.totalSize
+
+            groupedImages.append(repInfo)
+
+        return groupedImages
+
+
+    #   Sort / Filter / Refresh Source Table
+    @err_catcher(name=__name__)
+    def refreshSourceTable(self, restoreSelection=False):
+        try:
+            #   Rows that Stay Keep their Tiles, so Checked States are Only Cleared if not Restoring
+            if not restoreSelection:
+                self.clearCheckedTiles("source")
 
-            #   Restore Checked Status
-            if restoreSelection:
-                for row in range(self.lw_source.count()):
-                    item = self.lw_source.item(row)
-                    fileTile = self.lw_source.itemWidget(item)
-                    if fileTile and isinstance(fileTile, TileWidget.SourceFileTile):
-                        uuid = fileTile.data.get("uuid")
-                        if uuid in self.sourceSelState:
-                            fileTile.setChecked(self.sourceSelState[uuid])
+            #   Sort and Filter in the Model (Existing Rows Keep their Tiles)
+            model = self.configTableModel("source")
+            model.updateItems(self.sourceDataItems)
 
         except Exception as e:
             logger.warning(f"ERROR:  Failed to Refresh Source Table:\n{e}")
 
-        finally:
-            QTimer.singleShot(0, WaitPopup.closePopup)
 
 
+    #   Creates the Tile UI Widget for a Source Row when it Enters the Viewport
+    @err_catcher(name=__name__)
+    def createSourceTile(self, dataItem):
+        data = dataItem.get("data", {})
+
+        if dataItem["tileType"] == "folder":
+            return TileWidget.FolderItem(self, data)
+
+        itemTile = TileWidget.SourceFileTile(dataItem["tile"], data["fileType"])
+        self.restoreTileState(itemTile, "source")
+
+        return itemTile
+
+
+    #   Creates the Tile UI Widget for a Destination Row
+    @err_catcher(name=__name__)
+    def createDestTile(self, dataItem):
+        itemTile = TileWidget.DestFileTile(dataItem["tile"], dataItem["data"]["fileType"])
+        self.restoreTileState(itemTile, "dest")
+
+        return itemTile
+
+
+    #   Applies the Stored Checked and Locked State to a New Tile
+    @err_catcher(name=__name__)
+    def restoreTileState(self, fileTile, table):
+        fileTile.tileLocked = self.tilesLocked
+
+        if fileTile.getUid() in self.checkedTileUids[table]:
+            fileTile.chb_selected.blockSignals(True)
+            fileTile.chb_selected.setChecked(True)
+            fileTile.chb_selected.blockSignals(False)
+
+
+    #   Detaches a Tile Scrolled out of Range (or Removed)
+    @err_catcher(name=__name__)
+    def releaseTile(self, fileTile):
+        self.selectedTiles.discard(fileTile)
+
+        if isinstance(fileTile, (TileWidget.SourceFileTile, TileWidget.DestFileTile)):
+            fileTile.item.unregisterTile(fileTile)
+
+
+    #   Selected Tiles and Tiles in a Running Transfer Stay Alive when Scrolled out of View
+    @err_catcher(name=__name__)
+    def isTilePinned(self, fileTile):
+        return fileTile in self.selectedTiles or fileTile in self.activeTransferTiles
+
+
+    #   Clears the Stored and Live Checked States of a Table
+    @err_catcher(name=__name__)
+    def clearCheckedTiles(self, table):
+        self.checkedTileUids[table].clear()
+
+        tiles = self.getAllSourceTiles() if table == "source" else self.getAllDestTiles()
+        for fileTile in tiles:
+            fileTile.chb_selected.blockSignals(True)
+            fileTile.chb_selected.setChecked(False)
+            fileTile.chb_selected.blockSignals(False)
+
+
+    #   Stores the Checked State of a Tile by UUID
+    @err_catcher(name=__name__)
+    def setTileChecked(self, fileTile, checked):
+        table = "dest" if fileTile.tileType == "destTile" else "source"
+
+        if checked:
+            self.checkedTileUids[table].add(fileTile.getUid())
+        else:
+            self.checkedTileUids[table].discard(fileTile.getUid())
+
+
+    #   Repaints a Source Row when its Data Item has Updated
+    @err_catcher(name=__name__)
+    def refreshSourceRow(self, uuid):
+        if uuid:
+            self.sourceModel.refreshUuid(uuid)
+
+
+    #   Returns the Tiles Between Two Tiles (Creating any Off-screen Tiles)
+    @err_catcher(name=__name__)
+    def getTileRange(self, table, fromTile, toTile):
+        if fromTile is None or toTile is None:
+            return []
+
+        if table == "source":
+            model, loader = self.sourceModel, self.sourceTileLoader
+        else:
+            model, loader = self.destModel, self.destTileLoader
+
+        start = model.rowForUuid(fromTile.getUid())
+        end = model.rowForUuid(toTile.getUid())
+        if start < 0 or end < 0:
+            return []
+
+        if start > end:
+            start, end = end, start
+
+        return [t for t in loader.loadRows(start, end) if t.tileType == toTile.tileType]
+
+
+    #   Appends Streamed Items to the Source Table (Sorted once the Scan Completes)
+    @err_catcher(name=__name__)
+    def addSourceTableRows(self, dataItems):
+        try:
+            self.sourceModel.appendItems(dataItems)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Add Source Table Rows:\n{e}")
+
 
     #   Build List of Items in Destination Directory
     @err_catcher(name=__name__)
@@ -2009,13 +2357,17 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             if not os.path.exists(destDir):
                 self.le_destPath.setStyleSheet("QLineEdit { border: 1px solid #cc6666; }")
             else:
-                self.le_destPath.setToolTip(destDir)
+                tip = destDir
+                if self.backupDestDirs:
+                    tip += "\n\nBackup Destinations:\n" + "\n".join(self.backupDestDirs)
+                self.le_destPath.setToolTip(tip)
                 self.le_destPath.setStyleSheet("")
 
             #   Capture Scrollbar Position
             scrollPos = self.lw_destination.verticalScrollBar().value()
 
             self.destDataItems = []
+            self.destModel.clear()
 
             #   Create Data Item for Each Item in Dir
             for iData in self.transferList:
@@ -2040,70 +2392,17 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     #   Sort / Filter / Refresh Destination Table
     @err_catcher(name=__name__)
     def refreshDestTable(self, restoreSelection=False):
-        WaitPopup.showPopup(parent=self.projectBrowser)
-
         try:
-            #   Save Selection State if Needed
-            if restoreSelection:
-                self.destSelState = {}
-                for row in range(self.lw_destination.count()):
-                    item = self.lw_destination.item(row)
-                    fileTile = self.lw_destination.itemWidget(item)
-                    if fileTile and isinstance(fileTile, TileWidget.DestFileTile):
-                        key = fileTile.data["uuid"]
-                        self.destSelState[key] = fileTile.isChecked()
-
-            #   Sort the Table Items
-            destDataItems_sorted = self.sortTable("destination", self.destDataItems)
-
-            # Reset Table
-            self.lw_destination.clear()
-            row = 0
-
-            #   Iterate Sorted Items and Create Tile UI Widgets
-            for dataItem in destDataItems_sorted:
-                fileItem = dataItem["tile"]
-                tileType = dataItem["tileType"]
-                data = dataItem["data"]
-                displayName = data["displayName"]
-                fileType = data["fileType"]
-                uuid = data["uuid"]
-
-                if "sequenceItems" in data:
-                    uuid = data["uuid"] = Utils.createUUID()
-                    data["hasProxy"] = False
-                    fileItem = TileWidget.DestFileItem(self, passedData=data)
+            #   Rows that Stay Keep their Tiles, so Checked States are Only Cleared if not Restoring
+            if not restoreSelection:
+                self.clearCheckedTiles("dest")
 
-                else:
-                    fileItem = dataItem["tile"]
-
-                itemTile = TileWidget.DestFileTile(fileItem, fileType)
-                rowHeight = SOURCE_ITEM_HEIGHT
-
-                #   Set Row Size and Add File Tile widget and Data to Row
-                list_item = QListWidgetItem()
-                list_item.setSizeHint(QSize(0, rowHeight))
-                list_item.setData(Qt.UserRole, {
-                    "displayName": displayName,
-                    "tileType": tileType,
-                    "fileType": fileType,
-                    "uuid": uuid
-                })
+            #   Sort and Filter in the Model (Existing Rows Keep their Tiles)
+            model = self.configTableModel("destination")
+            model.updateItems(self.destDataItems)
 
-                self.lw_destination.addItem(list_item)
-                self.lw_destination.setItemWidget(list_item, itemTile)
-
-                row += 1
-
-            #   Restore Checked Status
-            if restoreSelection:
-                for row in range(self.lw_destination.count()):
-                    item = self.lw_destination.item(row)
-                    fileTile = self.lw_destination.itemWidget(item)
-                    if fileTile and isinstance(fileTile, TileWidget.DestFileTile):
-                        uuid = fileTile.data.get("uuid")
-                        if uuid in self.destSelState:
-                            fileTile.setChecked(self.destSelState[uuid])
+            #   Create the Tiles now so the Transfer Size is Current
+            self.destTileLoader.updateTiles()
 
             #   Refresh Transfer Size UI
             self.refreshTotalTransSize()
@@ -2111,9 +2410,6 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         except Exception as e:
             logger.warning(f"ERROR:  Failed to Refresh Destination Table:\n{e}")
 
-        finally:
-            QTimer.singleShot(0, WaitPopup.closePopup)
-
 
 
     #   Create Source Data Item (this is the class that will calculate and hold all the data)
@@ -2133,6 +2429,12 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             data["seqSize"] = itemData["seqSize"]
             data["uuid"] = Utils.createUUID()
 
+            #   Pass Stat Data from the Scan so the Item does not Re-Stat
+            if itemData.get("mtime"):
+                data["source_mainFile_date_raw"] = itemData["mtime"]
+            if itemData.get("size") is not None:
+                data["source_mainFile_size_raw"] = itemData["size"]
+
             if fileType == "Folders":
                 #    Create Folder Data Item
                 data["dirPath"] = itemData["fullPath"]
@@ -2145,9 +2447,12 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
 
             #   Get Item Data and Add to the List
             fData = dataItem.getData()
-            self.sourceDataItems.append({"tile": dataItem, "tileType": tileType, "data": fData})
+            sourceItem = {"tile": dataItem, "tileType": tileType, "data": fData}
+            self.sourceDataItems.append(sourceItem)
 
             logger.debug(f"Created Source Data Item for: {itemData['displayName']}")
+
+            return sourceItem
         
         except Exception as e:
             logger.warning(f"ERROR:  Failed to Create Source Data Item\n{e}")
@@ -2157,6 +2462,15 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     @err_catcher(name=__name__)
     def createDestItem(self, data):
         try:
+            #   Combined Sequence Items get their own UUID
+            if "sequenceItems" in data:
+                data["uuid"] = Utils.createUUID()
+                data["hasProxy"] = False
+
+            #   Rebuilt Rows Start without the Previous Transfer State
+            for key in ("transfer_status", "transfer_progress", "proxy_status", "proxy_progress"):
+                data.pop(key, None)
+
             #    Create File Data Item
             dataItem = TileWidget.DestFileItem(self, data)
 
@@ -2185,12 +2499,8 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     @err_catcher(name=__name__)
     def modifyFileNames(self):
         try:
-            # Iterate through all QListWidgetItems and call setModifiedName on each widget
-            count = self.lw_destination.count()
-            for i in range(count):
-                item = self.lw_destination.item(i)
-                widget = self.lw_destination.itemWidget(item)
-
+            #   Iterate through all Destination Tiles and call setModifiedName on each widget
+            for widget in self.getAllDestTiles():
                 if widget and hasattr(widget, "setModifiedName"):
                     widget.setModifiedName()
 
@@ -2230,6 +2540,11 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         self.sourceFuncts.updateUI()
 
 
+    @err_catcher(name=__name__)
+    def toggleSync(self, checked):
+        self.syncTransfers = checked
+
+
 
     @err_catcher(name=__name__)
     def refreshTotalTransSize(self):
@@ -2257,7 +2572,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     def doubleClickFolder(self, filepath, mode):
         if mode == "source":
             self.sourceDir = filepath
-            self.refreshSourceItems()
+            self.refreshSourceItems(useCache=True)
 
 
     #   Opens File in External System Default App
@@ -2334,15 +2649,11 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     @err_catcher(name=__name__)
     def addSelected(self):
         try:
-            row_count = self.lw_source.count()
+            checkedUids = self.checkedTileUids["source"]
 
-            for row in range(row_count):
-                listItem = self.lw_source.item(row)
-                fileItem = self.lw_source.itemWidget(listItem)
-                
-                if fileItem is not None and fileItem.objectName() == "FileTile":
-                    if fileItem.isChecked():
-                        self.addToDestList(fileItem.getData())
+            for dataItem in self.sourceModel.items():
+                if dataItem["tileType"] == "file" and dataItem["data"]["uuid"] in checkedUids:
+                    self.addToDestList(dataItem["data"])
 
             self.refreshDestItems()
 
@@ -2371,15 +2682,8 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
                 self.transferList = []
 
             else:
-                row_count = self.lw_destination.count()
-
-                for row in range(row_count):
-                    listItem = self.lw_destination.item(row)
-                    fileItem = self.lw_destination.itemWidget(listItem)
-
-                    if fileItem is not None:
-                        if fileItem.isChecked():
-                            self.transferList.remove(fileItem.getData())
+                for fileItem in self.getAllDestItems(onlyChecked=True):
+                    self.transferList.remove(fileItem.getData())
 
             self.refreshDestItems()
 
@@ -2411,16 +2715,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
     #   Return List of Checked Dest File Tiles
     @err_catcher(name=__name__)
     def getCopyList(self):
-        row_count = self.lw_destination.count()
-        self.copyList = []
-
-        for row in range(row_count):
-            listItem = self.lw_destination.item(row)
-            fileItem = self.lw_destination.itemWidget(listItem)
-
-            if fileItem is not None:
-                if fileItem.isChecked():
-                    self.copyList.append(fileItem)
+        self.copyList = self.getAllDestTiles(onlyChecked=True)
 
         return self.copyList
 
@@ -2456,22 +2751,30 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         return errors, warnings, hasErrors
 
 
-    #   Check if Available Space Exists or Close to Max
+    #   Check if Available Space Exists or Close to Max (on Every Destination)
     @err_catcher(name=__name__)
     def _checkDriveSpace(self, errors_list, warnings_list):
-        spaceAvail = Utils.getDriveSpace(os.path.normpath(self.destDir))
         transferSize = self.getTotalTransferSize()
 
-        if transferSize >= spaceAvail:
-            errors_list["Not Enough Storage Space:"].append(
-                f"Transfer: {Utils.getFileSizeStr(transferSize)} - "
-                f"Available: {Utils.getFileSizeStr(spaceAvail)}"
-            )
-        elif (spaceAvail - transferSize) < 100 * 1024 * 1024:  # 100 MB
-            warnings_list["Storage Space Low:"].append(
-                f"Transfer: {Utils.getFileSizeStr(transferSize)} - "
-                f"Available: {Utils.getFileSizeStr(spaceAvail)}"
-            )
+        for destDir in [self.destDir] + self.backupDestDirs:
+            #   Primary Destination is Checked Before the Transfer Popup
+            if not os.path.isdir(destDir):
+                errors_list["Backup Destination Missing:"].append(destDir)
+                continue
+
+            spaceAvail = Utils.getDriveSpace(os.path.normpath(destDir))
+            label = "" if destDir == self.destDir else f"{destDir}: "
+
+            if transferSize >= spaceAvail:
+                errors_list["Not Enough Storage Space:"].append(
+                    f"{label}Transfer: {Utils.getFileSizeStr(transferSize)} - "
+                    f"Available: {Utils.getFileSizeStr(spaceAvail)}"
+                )
+            elif (spaceAvail - transferSize) < 100 * 1024 * 1024:  # 100 MB
+                warnings_list["Storage Space Low:"].append(
+                    f"{label}Transfer: {Utils.getFileSizeStr(transferSize)} - "
+                    f"Available: {Utils.getFileSizeStr(spaceAvail)}"
+                )
 
 
     #   Check is File Exists in Destination
@@ -2480,11 +2783,34 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         for fileTile in self.copyList:
             basename = Utils.getBasename(fileTile.getDestMainPath())
             if fileTile.destFileExists():
-                if self.sourceFuncts.chb_overwrite.isChecked():
+                #   Completed by an Earlier Run of a Resumed Transfer
+                if fileTile.isTransferJournaled():
+                    warnings_list[basename].append("Already Transferred (Skipped)")
+                elif self.syncTransfers:
+                    match = fileTile.isDestInSync()
+                    if match == FileCopyWorker.MATCH_CHECKSUM:
+                        warnings_list[basename].append("Already Verified (Skipped)")
+                    elif match == FileCopyWorker.MATCH_JOURNAL:
+                        warnings_list[basename].append("Already Transferred (Skipped)")
+                    elif match:
+                        warnings_list[basename].append("Unchanged in Destination (Skipped, Not Verified)")
+                    else:
+                        warnings_list[basename].append("Changed in Destination (Will be Synced)")
+                elif self.sourceFuncts.chb_overwrite.isChecked():
                     warnings_list[basename].append("File Exists in Destination")
                 else:
                     errors_list[basename].append("File Exists in Destination")
 
+            for backupDir in self.backupDestDirs:
+                _, backupFiles = fileTile.getMainTransferPaths(backupDir)
+                if os.path.exists(backupFiles[0]):
+                    if fileTile.isTransferJournaled(backupDir) or self.syncTransfers:
+                        continue
+                    if self.sourceFuncts.chb_overwrite.isChecked():
+                        warnings_list[basename].append(f"File Exists in Backup Destination: {backupDir}")
+                    else:
+                        errors_list[basename].append(f"File Exists in Backup Destination: {backupDir}")
+
 
     #   Check if Transfer Names will Collide (for example if Name Modded)
     @err_catcher(name=__name__)
@@ -2526,6 +2852,37 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
                         )
 
 
+    #   Fills the Tile Codec Info from the ProbeCache (Never Probes on the UI Thread)
+    #   Returns False on a Miss, which is Probed in the Background for the Next Check
+    @err_catcher(name=__name__)
+    def _ensureProbeData(self, fileTile):
+        if fileTile.data.get("source_mainFile_codec") is not None:
+            return True
+
+        filePath = fileTile.getSource_mainfilePath()
+        result = FileInfoWorker.getCachedProbe(filePath, fileTile.fileType)
+
+        if result is None:
+            if filePath not in self.pendingProbes:
+                self.pendingProbes.add(filePath)
+                fileTile.getFileInfo(filePath, partial(self._onProbeDataReady, fileTile.data, filePath))
+            return False
+
+        self._onProbeDataReady(fileTile.data, None, *result)
+        return True
+
+
+    #   Stores the Codec Info Used by the Transfer Checks
+    @err_catcher(name=__name__)
+    def _onProbeDataReady(self, data, filePath, frames, fps, secs, codec, codecMetadata, xRez, yRez):
+        self.pendingProbes.discard(filePath)
+
+        data["source_mainFile_codec"] = codec
+        data["source_mainFile_codecMetadata"] = codecMetadata
+        data["source_mainFile_xRez"] = xRez
+        data["source_mainFile_yRez"] = yRez
+
+
     #   Check if a Proxy can be Generated from the Codec Type (FFmpeg limitations)
     @err_catcher(name=__name__)
     def _checkProxySupport(self, errors_list, warnings_list):
@@ -2533,6 +2890,15 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
             for fileTile in (ft for ft in self.copyList if ft.isVideo()):
                 basename = Utils.getBasename(fileTile.getDestMainPath())
 
+                if not self._ensureProbeData(fileTile):
+                    msg = "Media Info is still Loading (Try Again in a Moment)"
+                    #   The DNxHD Checks Need the Resolution
+                    if "dnxhd" in self.proxySettings.get("proxyPreset", "").lower():
+                        errors_list[basename].append(msg)
+                    else:
+                        warnings_list[basename].append(f"{msg}: Proxy Support not Checked")
+                    continue
+
                 #   Unsupported Codec
                 if not fileTile.isCodecSupported():
                     codec = fileTile.data.get("source_mainFile_codec", "unknown")
@@ -2578,6 +2944,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
 
             header = {
                 "Destination Path": self.destDir,
+                "Backup Destinations": "\n".join(self.backupDestDirs) if self.backupDestDirs else "None",
                 "Available Drive Space": availSpace_str,
                 "Number of Files": len(self.copyList),
                 "Total Transfer Size": Utils.getFileSizeStr(self.total_transferSize),
@@ -2703,6 +3070,9 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         if not os.path.isdir(self.destDir):
             self.core.popup("YOU FORGOT TO SELECT DEST DIR")
             return False
+
+        #   Keep the Transfer Tiles Alive (they Own the Workers) until the Transfer Completes
+        self.activeTransferTiles = set(self.copyList)
         
         WaitPopup.showPopup(parent=self.projectBrowser)
 
@@ -2739,6 +3109,11 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
         #   Call Transfer Popup
         result = DisplayPopup.display(popupData, title="Transfer", buttons=buttons)
 
+        #   Release the Tiles if the Transfer is not Started
+        if result != "Start Transfer" or hasErrors:
+            self.activeTransferTiles = set()
+            self.destTileLoader.scheduleUpdate()
+
         #   If User Selects Transfer
         if result == "Start Transfer":
             #   Abort if there are Any Errors
@@ -2831,6 +3206,7 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
 
     @err_catcher(name=__name__)
     def resetTransfer(self):
+        self.activeTransferTiles = set()
         self.progressTimer.stop()
         self.totalTransferTimer.stop()
         self.totalTransferTimer.reset()
@@ -2920,6 +3296,10 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
 
         self.configTransUI("complete")
 
+        #   Finished Tiles can be Released (the Delegate Paints their Progress)
+        self.activeTransferTiles = set()
+        self.destTileLoader.scheduleUpdate()
+
         #   Create Report ID Data
         report_uuid     = Utils.createUUID()
         timestamp  = datetime.now()
@@ -3159,9 +3539,12 @@ class SourceBrowser(QWidget, SourceBrowser_ui.Ui_w_sourceBrowser):
                         ("Date:",               iData['source_mainFile_date']),
                         ("Main File:",          iData['mainFile_result']),
                         ("    Source:",         sourceName),
+                        ("    Hash Type:",      iData.get('hashAlgorithm', '')),
                         ("    Hash:",           iData['source_mainFile_hash']),
                         ("    Destination:",    iData['dest_mainFile_path']),
                         ("    Hash:",           iData['dest_mainFile_hash']),
+                        *[("    Backup:",       f"{backupDir}   ({backupResult})")
+                          for backupDir, backupResult in iData.get('backup_results', {}).items()],
                         ("    Size:",           mainSize),
                         ("    Proxy present:",  str(hasProxy)),
                         *([("Proxy File:",      iData.get('proxyFile_result', ""))] if proxyAction else []),
@@ -90,6 +90,8 @@ class SourceFunctions(QWidget, Ui_w_sourceFunctions):
 
         #   Setup UI from Ui_w_sourceFunctions
         self.setupUi(self)
+        self.setupSyncUI()
+        self.setupThrottleUI()
         
         self.setToolTips()
         self.configureUI()
@@ -100,6 +102,33 @@ class SourceFunctions(QWidget, Ui_w_sourceFunctions):
         logger.debug("Loaded Functions Panel")
 
 
+    #   Sync Option Beside Overwrite
+    @err_catcher(name=__name__)
+    def setupSyncUI(self):
+        self.chb_sync = QCheckBox("Sync (Skip Unchanged)", self.gb_functions)
+        self.lo_options.insertWidget(self.lo_options.indexOf(self.chb_overwrite) + 1, self.chb_sync)
+
+
+    #   Transfer Speed Limits (Outside the Functions Group so they Stay Live During a Transfer)
+    @err_catcher(name=__name__)
+    def setupThrottleUI(self):
+        self.l_throttle = QLabel("Limit:", self.w_functions)
+
+        self.sb_throttleRate = QSpinBox(self.w_functions)
+        self.sb_throttleDestRate = QSpinBox(self.w_functions)
+
+        for spinBox, prefix in [(self.sb_throttleRate, "Total "), (self.sb_throttleDestRate, "Per Dest ")]:
+            spinBox.setRange(0, 10000)
+            spinBox.setSingleStep(10)
+            spinBox.setPrefix(prefix)
+            spinBox.setSuffix(" MB/s")
+            spinBox.setSpecialValueText(f"{prefix}No Limit")
+
+        self.lo_transferButtons.addWidget(self.l_throttle)
+        self.lo_transferButtons.addWidget(self.sb_throttleRate)
+        self.lo_transferButtons.addWidget(self.sb_throttleDestRate)
+
+
     @err_catcher(name=__name__)
     def setToolTips(self):
         tip = ("Enable/Disable Proxy Handling\n"
@@ -127,6 +156,15 @@ class SourceFunctions(QWidget, Ui_w_sourceFunctions):
                "(files with the same name in the Destination will be overwritten)")
         self.chb_overwrite.setToolTip(tip)
 
+        tip = ("Enable/Disable Sync Mode\n\n"
+               "Files already in the Destination that match the Source\n"
+               "(same size, and matching cached Checksums or the same\n"
+               "Modification Time) are skipped. Only Checksum matches are\n"
+               "reported as 'Already Verified' (unless Read-back is enabled).\n"
+               "Transferred Files keep the Source Modification Time.\n"
+               "Missing or changed Files are transferred.")
+        self.chb_sync.setToolTip(tip)
+
         tip = "Open Destination Directory in the os File Explorer"
         self.b_openDestDir.setToolTip(tip)
 
@@ -152,6 +190,15 @@ class SourceFunctions(QWidget, Ui_w_sourceFunctions):
                "(resets all Progress)")
         self.b_transfer_reset.setToolTip(tip)
 
+        tip = ("Transfer Speed Limits, to leave Bandwidth for others on shared Storage.\n\n"
+               "Total:  combined speed of all running Transfers\n"
+               "Per Dest:  speed written to each Destination Drive / Share\n\n"
+               "These can be changed during a Transfer.\n"
+               "The Hours they apply are set in the SourceTab Settings.")
+        self.l_throttle.setToolTip(tip)
+        self.sb_throttleRate.setToolTip(tip)
+        self.sb_throttleDestRate.setToolTip(tip)
+
 
     @err_catcher(name=__name__)
     def connectEvents(self):
@@ -295,17 +342,15 @@ class SourceFunctions(QWidget, Ui_w_sourceFunctions):
     #   Opens File Naming Window to Configure
     @err_catcher(name=__name__)
     def configFileNaming(self):
-        destList = self.sourceBrowser.lw_destination
-        row_count = destList.count()
+        destTiles = self.sourceBrowser.getAllDestItems()
 
         #   If there is only the Blank Entry Use EXAMPLE
-        if row_count < 1:
+        if not destTiles:
             fileName = "EXAMPLEFILENAME"
         
         #   Get the First File's Basename
         else:
-            listItem = self.sourceBrowser.lw_destination.item(0)
-            fileItem = self.sourceBrowser.lw_destination.itemWidget(listItem)
+            fileItem = destTiles[0]
             
             filePath = fileItem.getSource_mainfilePath()
             fileName = Utils.getBasename(filePath)
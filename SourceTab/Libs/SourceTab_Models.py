@@ -52,6 +52,7 @@ import os
 import sys
 import logging
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import Optional
 
 
@@ -84,6 +85,499 @@ class FileTileMimeData(QMimeData):
 
 
 
+class FileTileListModel(QAbstractListModel):
+    '''
+    Holds the Source / Destination Data Items for the Tile List Views\n
+    Sorting and Filtering is done in the Model using Sort Keys Cached per Item,
+    and Re-orders are Emitted as Layout Changes so Live Tiles are Kept
+    '''
+
+    DataItemRole = Qt.UserRole
+    UuidRole = Qt.UserRole + 1
+
+    #   Row Heights by Tile Type
+    ROW_HEIGHTS = {"folder": 30, "file": 70}
+
+    #   Sorting Order for Tile Types
+    TYPE_PRIORITY = {
+        "Videos": 0,
+        "Image Sequence": 1,
+        "Images": 2,
+        "Audio": 3,
+        "Other": 4
+    }
+
+    #   Sort Key Tuple Indexes
+    KEY_FOLDER, KEY_NAME, KEY_SIZE, KEY_DATE, KEY_TYPE, KEY_FILTER = range(6)
+    SORT_KEYS = {"name": KEY_NAME, "size": KEY_SIZE, "date": KEY_DATE}
+
+    def __init__(self, parent: QObject = None, rowHeights: dict = None) -> None:
+        super().__init__(parent)
+        self.rowHeights = rowHeights or self.ROW_HEIGHTS
+
+        self._allItems = []
+        self._items = []
+        self._rowIndex = {}
+        self._sortKeys = {}
+
+        self.sortOptions = {}
+        self.filterStates = None
+
+        #   Set when the Visible Row Set may Change on the Next resort()
+        self._rowsDirty = False
+
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> any:
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+
+        dataItem = self._items[index.row()]
+
+        if role == Qt.DisplayRole:
+            return dataItem["data"].get("displayName", "")
+
+        if role == self.DataItemRole:
+            return dataItem
+
+        if role == self.UuidRole:
+            return dataItem["data"].get("uuid")
+
+        if role == Qt.SizeHintRole:
+            return QSize(0, self.rowHeights.get(dataItem["tileType"], 70))
+
+        return None
+
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled
+
+
+    @staticmethod
+    def _uuid(dataItem: dict) -> str:
+        return dataItem["data"].get("uuid")
+
+
+    def _reindex(self, first: int = 0, last: int = None) -> None:
+        if first == 0 and last is None:
+            self._rowIndex = {item["data"].get("uuid"): row for row, item in enumerate(self._items)}
+            return
+
+        for row in range(first, len(self._items) if last is None else last + 1):
+            self._rowIndex[self._uuid(self._items[row])] = row
+
+
+    ####    Sorting / Filtering    ####
+
+    def setSortOptions(self, sortOptions: dict) -> None:
+        self.sortOptions = sortOptions or {}
+
+
+    def setFilterStates(self, filterStates: Optional[dict]) -> None:
+        '''Sets the Type Filter States (None Disables Filtering)'''
+        if filterStates != self.filterStates:
+            self._rowsDirty = True
+
+        self.filterStates = dict(filterStates) if filterStates is not None else None
+
+
+    def getSortKey(self, dataItem: dict) -> tuple:
+        '''Returns the Cached Sort Key Tuple of an Item'''
+        uuid = self._uuid(dataItem)
+        key = self._sortKeys.get(uuid)
+
+        if key is None:
+            data = dataItem["data"]
+            fileType = data.get("fileType") or "Other"
+
+            if fileType == "Image Sequence":
+                size = data.get("seqSize") or 0
+            else:
+                size = data.get("source_mainFile_size_raw") or 0
+
+            #   Small Hack to Cover UI Naming
+            filterType = fileType.capitalize()
+            if filterType == "Image sequence":
+                filterType = "Sequences"
+
+            key = (data.get("tileType") == "folder",
+                   data.get("displayName", "").lower(),
+                   size,
+                   data.get("source_mainFile_date_raw") or 0,
+                   self.TYPE_PRIORITY.get(fileType, 99),
+                   filterType)
+
+            self._sortKeys[uuid] = key
+
+        return key
+
+
+    def acceptsItem(self, dataItem: dict) -> bool:
+        if self.filterStates is None:
+            return True
+        return self.filterStates.get(self.getSortKey(dataItem)[self.KEY_FILTER], True)
+
+
+    def sortItems(self, dataItems: list) -> list:
+        '''Returns the Items Ordered by Folders, Type Group, then the Sort Type'''
+        keyIdx = self.SORT_KEYS.get(self.sortOptions.get("sortType", "name"), self.KEY_NAME)
+        reverse = not self.sortOptions.get("ascending", True)
+
+        #   Decorate with the Cached Keys (C-level itemgetter Sorts)
+        keys = self._sortKeys
+        decorated = [(keys.get(i["data"].get("uuid")) or self.getSortKey(i), i) for i in dataItems]
+
+        folders = [(k[self.KEY_NAME], i) for k, i in decorated if k[self.KEY_FOLDER]]
+        files = [(k[keyIdx], k[self.KEY_TYPE], i) for k, i in decorated if not k[self.KEY_FOLDER]]
+
+        #   Folders are Always Alphabetical
+        folders.sort(key=itemgetter(0))
+
+        #   Stable Sorts: Sort Type First, then Group by Type Priority
+        files.sort(key=itemgetter(0), reverse=reverse)
+        if self.sortOptions.get("groupTypes", True):
+            files.sort(key=itemgetter(1))
+
+        return [f[1] for f in folders] + [f[2] for f in files]
+
+
+    def lessThan(self, itemA: dict, itemB: dict) -> bool:
+        '''Single Item Comparison Matching sortItems()'''
+        keyA = self.getSortKey(itemA)
+        keyB = self.getSortKey(itemB)
+
+        if keyA[self.KEY_FOLDER] != keyB[self.KEY_FOLDER]:
+            return keyA[self.KEY_FOLDER]
+        if keyA[self.KEY_FOLDER]:
+            return keyA[self.KEY_NAME] < keyB[self.KEY_NAME]
+
+        if self.sortOptions.get("groupTypes", True) and keyA[self.KEY_TYPE] != keyB[self.KEY_TYPE]:
+            return keyA[self.KEY_TYPE] < keyB[self.KEY_TYPE]
+
+        keyIdx = self.SORT_KEYS.get(self.sortOptions.get("sortType", "name"), self.KEY_NAME)
+        if self.sortOptions.get("ascending", True):
+            return keyA[keyIdx] < keyB[keyIdx]
+        return keyA[keyIdx] > keyB[keyIdx]
+
+
+    def resort(self) -> None:
+        '''Re-applies the Filters and Sorting without Resetting the Model'''
+        if self.filterStates is None:
+            visible = self.sortItems(self._allItems)
+        else:
+            visible = self.sortItems([i for i in self._allItems if self.acceptsItem(i)])
+
+        #   Only Diff the Rows if the Items or Filters have Changed
+        if self._rowsDirty or len(visible) != len(self._items):
+            self._rowsDirty = False
+            visibleUids = {i["data"].get("uuid") for i in visible}
+
+            #   Remove Rows that are Filtered Out
+            self._removeRows([row for uuid, row in self._rowIndex.items() if uuid not in visibleUids])
+
+            #   Append Rows that are Filtered In (Ordered Below)
+            rowIndex = self._rowIndex
+            self._insertRows([i for i in visible if i["data"].get("uuid") not in rowIndex])
+
+        #   Re-order the Rows
+        if len(self._items) != len(visible) or any(a is not b for a, b in zip(self._items, visible)):
+            self._applyOrder(visible)
+
+
+    def _applyOrder(self, orderedItems: list) -> None:
+        self.layoutAboutToBeChanged.emit()
+
+        newRows = {item["data"].get("uuid"): row for row, item in enumerate(orderedItems)}
+        oldIndexes = self.persistentIndexList()
+        newIndexes = []
+        for index in oldIndexes:
+            row = newRows.get(self._uuid(self._items[index.row()]), -1)
+            newIndexes.append(self.index(row) if row >= 0 else QModelIndex())
+
+        self._items = orderedItems
+        self._rowIndex = newRows
+
+        self.changePersistentIndexList(oldIndexes, newIndexes)
+        self.layoutChanged.emit()
+
+
+    def _removeRows(self, rows: list) -> None:
+        if not rows:
+            return
+
+        #   Remove Contiguous Ranges from the Bottom Up
+        rows = sorted(rows, reverse=True)
+        ranges = []
+        first = last = rows[0]
+        for row in rows[1:]:
+            if row == first - 1:
+                first = row
+            else:
+                ranges.append((first, last))
+                first = last = row
+        ranges.append((first, last))
+
+        for first, last in ranges:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._items[first:last + 1]
+            self.endRemoveRows()
+
+        self._reindex()
+
+
+    def _insertRows(self, dataItems: list) -> None:
+        if not dataItems:
+            return
+
+        first = len(self._items)
+        self.beginInsertRows(QModelIndex(), first, first + len(dataItems) - 1)
+        self._items.extend(dataItems)
+        self._reindex(first)
+        self.endInsertRows()
+
+
+    def _moveToSortedRow(self, row: int) -> None:
+        '''Moves a Single Row to its Sorted Position (Binary Search)'''
+        dataItem = self._items.pop(row)
+
+        lo, hi = 0, len(self._items)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.lessThan(self._items[mid], dataItem):
+                lo = mid + 1
+            else:
+                hi = mid
+
+        self._items.insert(row, dataItem)
+        if lo == row:
+            return
+
+        destChild = lo if lo < row else lo + 1
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destChild)
+        self._items.insert(lo, self._items.pop(row))
+        self._reindex(min(row, lo), max(row, lo))
+        self.endMoveRows()
+
+
+    ####    Items    ####
+
+    def setItems(self, dataItems: list) -> None:
+        '''Replaces all Rows'''
+        self.beginResetModel()
+        self._allItems = list(dataItems)
+        self._sortKeys = {}
+        self._items = self.sortItems([i for i in self._allItems if self.acceptsItem(i)])
+        self._reindex()
+        self.endResetModel()
+
+
+    def updateItems(self, dataItems: list) -> None:
+        '''Replaces the Items and Re-sorts, Keeping Rows (and Tiles) that Remain'''
+        self._allItems = list(dataItems)
+
+        uuids = {self._uuid(i) for i in self._allItems}
+        self._sortKeys = {u: k for u, k in self._sortKeys.items() if u in uuids}
+        self._rowsDirty = True
+
+        self.resort()
+
+
+    def appendItems(self, dataItems: list) -> None:
+        '''Appends Streamed Rows to the End of the List (Sorted by the Next resort())'''
+        if not dataItems:
+            return
+
+        self._allItems.extend(dataItems)
+        self._insertRows([i for i in dataItems if self.acceptsItem(i)])
+
+
+    def removeUuids(self, uuids: set) -> None:
+        '''Removes the Items and Rows of the Passed UUIDs'''
+        self._allItems = [i for i in self._allItems if self._uuid(i) not in uuids]
+        for uuid in uuids:
+            self._sortKeys.pop(uuid, None)
+
+        self._removeRows([self._rowIndex[u] for u in uuids if u in self._rowIndex])
+
+
+    def clear(self) -> None:
+        self.setItems([])
+
+
+    def items(self) -> list:
+        '''Returns the Visible (Filtered) Items in Row Order'''
+        return list(self._items)
+
+
+    def itemAt(self, row: int) -> Optional[dict]:
+        if 0 <= row < len(self._items):
+            return self._items[row]
+        return None
+
+
+    def rowForUuid(self, uuid: str) -> int:
+        return self._rowIndex.get(uuid, -1)
+
+
+    def refreshUuid(self, uuid: str) -> None:
+        '''Repaints the Row when its Data has Changed, and Re-positions it if its Sort Key Changed'''
+        row = self._rowIndex.get(uuid, -1)
+        if row < 0:
+            self._sortKeys.pop(uuid, None)
+            return
+
+        oldKey = self._sortKeys.pop(uuid, None)
+        if oldKey is not None and self.getSortKey(self._items[row]) != oldKey:
+            self._moveToSortedRow(row)
+            row = self._rowIndex[uuid]
+
+        idx = self.index(row)
+        self.dataChanged.emit(idx, idx)
+
+
+
+class FileTileDelegate(QStyledItemDelegate):
+    '''Paints Lightweight Tile Content for Rows without a Live Tile Widget'''
+
+    def __init__(self, browser: any, parent: QWidget = None, isPinned: Optional[callable] = None) -> None:
+        super().__init__(parent)
+        self.browser = browser
+        self.isPinned = isPinned
+
+
+    def destroyEditor(self, editor: QWidget, index: QModelIndex) -> None:
+        '''The View Releases the Tile of a Removed Row here, but Pinned Tiles are Kept by the TileViewLoader'''
+        if self.isPinned and self.isPinned(editor):
+            return
+        super().destroyEditor(editor, index)
+
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        size = index.data(Qt.SizeHintRole)
+        if size:
+            return size
+        return super().sizeHint(option, index)
+
+
+    def getIcon(self, dataItem: dict) -> QIcon:
+        data = dataItem["data"]
+
+        if dataItem["tileType"] == "folder":
+            return QIcon(self.browser.icon_folder)
+        if data.get("fileType") == "Image Sequence":
+            return QIcon(self.browser.icon_sequence)
+        if data.get("icon"):
+            return QIcon(data["icon"])
+        return QIcon(self.browser.icon_file)
+
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        #   Live Tile Widgets Paint Themselves
+        view = option.widget
+        if view is not None and view.indexWidget(index) is not None:
+            return
+
+        dataItem = index.data(FileTileListModel.DataItemRole)
+        if not dataItem:
+            super().paint(painter, option, index)
+            return
+
+        data = dataItem["data"]
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        textColor = option.palette.color(QPalette.Text)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        try:
+            #   Folders: Icon and Name
+            if dataItem["tileType"] == "folder":
+                iconRect = QRect(rect.left() + 4, rect.top() + (rect.height() - 24) // 2, 24, 24)
+                self.getIcon(dataItem).paint(painter, iconRect)
+
+                painter.setPen(textColor)
+                textRect = rect.adjusted(iconRect.width() + 10, 0, 0, 0)
+                painter.drawText(textRect, Qt.AlignVCenter | Qt.AlignLeft, data.get("displayName", ""))
+                return
+
+            #   Tile Background
+            painter.setPen(QPen(QColor(115, 175, 215, 60), 1))
+            painter.setBrush(QColor(255, 255, 255, 8))
+            painter.drawRoundedRect(rect, 6, 6)
+
+            #   Thumbnail or Filetype Icon
+            thumbRect = QRect(rect.left(), rect.top(), 120, min(69, rect.height()))
+            thumb = data.get("source_mainFile_thumbnail")
+            if isinstance(thumb, QPixmap) and not thumb.isNull():
+                target = QRect(QPoint(0, 0), thumb.size().scaled(thumbRect.size(), Qt.KeepAspectRatio))
+                target.moveCenter(thumbRect.center())
+                painter.drawPixmap(target, thumb)
+            else:
+                iconRect = QRect(0, 0, 32, 32)
+                iconRect.moveCenter(thumbRect.center())
+                self.getIcon(dataItem).paint(painter, iconRect)
+
+            #   File Name
+            metrics = QFontMetrics(option.font)
+            detailsRect = rect.adjusted(thumbRect.width() + 30, 4, -8, -4)
+            name = metrics.elidedText(data.get("displayName", ""), Qt.ElideMiddle, detailsRect.width())
+            painter.setPen(textColor)
+            painter.drawText(detailsRect, Qt.AlignTop | Qt.AlignLeft, name)
+
+            #   Size and Duration
+            if data.get("fileType") == "Image Sequence":
+                duration = str(len(data.get("seqFiles") or []))
+            else:
+                duration = data.get("source_mainFile_time") or ""
+            size = data.get("source_mainFile_size") or ""
+
+            painter.setPen(option.palette.color(QPalette.Disabled, QPalette.Text))
+            painter.drawText(detailsRect, Qt.AlignBottom | Qt.AlignLeft, str(duration))
+            painter.drawText(detailsRect, Qt.AlignBottom | Qt.AlignRight, str(size))
+
+            #   Transfer Progress
+            progress = data.get("transfer_progress")
+            if progress is not None:
+                barRect = QRect(detailsRect.left(), detailsRect.center().y() - 2, detailsRect.width(), 4)
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(QColor(255, 255, 255, 30))
+                painter.drawRect(barRect)
+                barRect.setWidth(int(barRect.width() * max(0, min(progress, 100)) / 100))
+                painter.setBrush(QColor(115, 175, 215))
+                painter.drawRect(barRect)
+
+        finally:
+            painter.restore()
+
+
+
+@dataclass
+class SequenceRecord:
+    '''Compact Image Sequence Record'''
+    pattern: str
+    dirPath: str
+    files: list[str]
+    frameStart: Optional[int]
+    frameEnd: Optional[int]
+    totalSize: int
+
+    @property
+    def frameCount(self) -> int:
+        return len(self.files)
+
+    def filePaths(self) -> list[str]:
+        '''Returns the Full Path of Each Frame'''
+        return [os.path.join(self.dirPath, f) for f in self.files]
+
+
+
 @dataclass
 class PresetModel:
     '''Holds Preset Data'''
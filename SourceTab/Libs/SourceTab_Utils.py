@@ -56,9 +56,14 @@ import logging
 import uuid
 import datetime
 import hashlib
+import errno
 import shutil
 import numpy
 import re
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Callable
 
 
@@ -74,11 +79,24 @@ uiPath = os.path.join(pluginPath, "Libs", "UserInterfaces")
 iconDir = os.path.join(uiPath, "Icons")
 
 
-import exiftool
 import simpleaudio as sa
 
+#   PyAV for In-process Probing (FFprobe is used if Unavailable)
+try:
+    import av
+except ImportError:
+    av = None
+
+#   Optional xxHash for Fast Checksums (Only Offered if Installed)
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
 from PopupWindows import DisplayPopup
-from SourceTab_Models import PresetsCollection
+from SourceTab_Models import PresetsCollection, SequenceRecord
+from MediaProbe import MediaProbe
+from ExifToolPool import ExifToolPool
 
 
 logger = logging.getLogger(__name__)
@@ -391,6 +409,366 @@ def getFileSize(filePath:str) -> int:
     return os.stat(filePath).st_size
 
 
+def getResolvedHashAlgorithm(algorithm:str) -> str:
+    '''Returns the Algorithm that will Actually be Used (xxHash64 Falls Back to BLAKE2b)'''
+
+    #   Saved Settings may Still Name xxHash64 after xxhash is Removed
+    if algorithm == "xxHash64" and xxhash is None:
+        return DEFAULT_HASH_ALGORITHM
+
+    if algorithm not in HASH_ALGORITHMS:
+        logger.warning(f"ERROR:  Unknown Hash Algorithm '{algorithm}' - Using {DEFAULT_HASH_ALGORITHM}")
+        return DEFAULT_HASH_ALGORITHM
+
+    return algorithm
+
+
+def getHashObject(algorithm:str):
+    '''Returns a New Streaming Hash Object for the Algorithm'''
+
+    match getResolvedHashAlgorithm(algorithm):
+        case "xxHash64":
+            return xxhash.xxh64()
+        case "MD5":
+            return hashlib.md5()
+        case "SHA-256":
+            return hashlib.sha256()
+        case _:
+            return hashlib.blake2b()
+
+
+def dropFileCache(fd:int, offset:int=0, length:int=0, flush:bool=False) -> bool:
+    '''
+    Drops the File's Pages from the OS Page Cache (posix_fadvise DONTNEED, Linux Only).\n
+    Dirty Pages are not Dropped, so flush Writes them to Disk First
+    '''
+
+    if not hasattr(os, "posix_fadvise"):
+        return False
+
+    try:
+        if flush:
+            os.fsync(fd)
+        os.posix_fadvise(fd, offset, length, os.POSIX_FADV_DONTNEED)
+        return True
+
+    except OSError as e:
+        logger.debug(f"Unable to Drop the File Cache: {e}")
+        return False
+
+
+def adviseSequential(fd:int) -> bool:
+    '''Hints the OS that the File will be Read / Written Sequentially (posix_fadvise, Linux Only)'''
+
+    if not hasattr(os, "posix_fadvise"):
+        return False
+
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return True
+
+    except OSError as e:
+        logger.debug(f"Unable to set Sequential Access: {e}")
+        return False
+
+
+def canPreallocate(path:str) -> bool:
+    '''
+    Returns True if the Path's Filesystem Reserves Space Natively (Linux Only).\n
+    Elsewhere posix_fallocate Falls Back to Writing Zeros, Doubling the Writes
+    '''
+
+    if not sys.platform.startswith("linux") or not hasattr(os, "posix_fallocate"):
+        return False
+
+    fsType = _getLinuxMountTypes().get(getMountPoint(path))
+    return fsType in PREALLOCATE_FS_TYPES
+
+
+def preallocateFile(fd:int, size:int) -> bool:
+    '''Reserves size Bytes for the File so it is Written in Few Extents (posix_fallocate)'''
+
+    if size <= 0 or not hasattr(os, "posix_fallocate"):
+        return False
+
+    try:
+        os.posix_fallocate(fd, 0, size)
+        return True
+
+    except OSError as e:
+        if e.errno not in PREALLOCATE_UNSUPPORTED:
+            logger.warning(f"Unable to Preallocate the File: {e}")
+        return False
+
+
+def isSubPath(path:str, root:str) -> bool:
+    '''Returns True if the Path is the Root or Inside it'''
+
+    try:
+        path = os.path.normcase(os.path.abspath(path))
+        root = os.path.normcase(os.path.abspath(root))
+        return os.path.commonpath([path, root]) == root
+
+    #   Different Drives on Windows
+    except ValueError:
+        return False
+
+
+def hasKernelCopy() -> bool:
+    '''Returns True if File Data can be Copied Inside the Kernel (Linux Only)'''
+    return sys.platform.startswith("linux") and bool(KERNEL_COPY_METHODS)
+
+
+def copyFileRange(fdSrc:int, fdDst:int, offset:int, count:int, method:str) -> int:
+    '''
+    Copies up to count Bytes at offset Inside the Kernel with "copy_file_range" or "sendfile".\n
+    Returns the Number of Bytes Copied (0 at End of File)
+    '''
+
+    if method == "copy_file_range":
+        return os.copy_file_range(fdSrc, fdDst, count, offset, offset)
+
+    #   sendfile Writes at the Destination's Current Position
+    os.lseek(fdDst, offset, os.SEEK_SET)
+    return os.sendfile(fdDst, fdSrc, offset, count)
+
+
+def getMountPoint(path:str) -> str:
+    '''Returns the Mount Point of the Path (or of its Nearest Existing Parent)'''
+
+    path = os.path.abspath(path)
+    while not os.path.exists(path) and os.path.dirname(path) != path:
+        path = os.path.dirname(path)
+
+    while not os.path.ismount(path) and os.path.dirname(path) != path:
+        path = os.path.dirname(path)
+
+    return path
+
+
+def _getLinuxMountTypes() -> dict:
+    '''Returns {Mount Point: Filesystem Type} from /proc/mounts'''
+
+    mountTypes = {}
+    try:
+        with open("/proc/mounts", "r") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) >= 3:
+                    #   Spaces in Mount Points are Escaped as Octal
+                    mountTypes[fields[1].replace("\\040", " ")] = fields[2]
+    except OSError:
+        pass
+
+    return mountTypes
+
+
+@lru_cache(maxsize=None)
+def _getLinuxBlockDevice(stDev:int) -> tuple[str, str] | None:
+    '''Returns (Disk Key, Device Type) of the Physical Disk Holding a Block Device from sysfs'''
+
+    sysPath = f"/sys/dev/block/{os.major(stDev)}:{os.minor(stDev)}"
+    if not os.path.exists(sysPath):
+        return None
+
+    #   Partitions Share the Queue (and Seeks) of their Parent Disk
+    devPath = os.path.realpath(sysPath)
+    if os.path.exists(os.path.join(devPath, "partition")):
+        devPath = os.path.dirname(devPath)
+
+    try:
+        with open(os.path.join(devPath, "dev"), "r") as f:
+            diskKey = f"disk:{f.read().strip()}"
+        with open(os.path.join(devPath, "queue", "rotational"), "r") as f:
+            rotational = f.read().strip() == "1"
+    except OSError:
+        return None
+
+    if os.path.basename(devPath).startswith("nvme"):
+        return diskKey, "nvme"
+
+    return diskKey, "hdd" if rotational else "ssd"
+
+
+def getDeviceInfo(path:str) -> tuple[str, str, str]:
+    '''
+    Returns (Device Key, Device Type, Mount Point) to Group Transfers by Device.\n
+    Device Type is one of DEVICE_TYPES, or "unknown" where it cannot be Detected
+    '''
+
+    mountPoint = getMountPoint(path)
+    try:
+        stDev = os.stat(mountPoint).st_dev
+    except OSError:
+        return f"mount:{mountPoint}", "unknown", mountPoint
+
+    deviceKey = f"dev:{stDev}"
+    deviceType = "unknown"
+
+    try:
+        if sys.platform.startswith("linux"):
+            if _getLinuxMountTypes().get(mountPoint) in NETWORK_FS_TYPES:
+                deviceType = "network"
+            else:
+                blockDevice = _getLinuxBlockDevice(stDev)
+                if blockDevice:
+                    deviceKey, deviceType = blockDevice
+
+        elif sys.platform == "win32":
+            import ctypes
+            DRIVE_REMOTE = 4
+            if mountPoint.startswith("\\\\") or ctypes.windll.kernel32.GetDriveTypeW(mountPoint) == DRIVE_REMOTE:
+                deviceType = "network"
+
+    except Exception as e:
+        logger.debug(f"Could not Detect the Device Type of {mountPoint}: {e}")
+
+    return deviceKey, deviceType, mountPoint
+
+
+def getTransferDevices(filePaths:list) -> dict:
+    '''Returns {Device Key: Device Type} for all the Devices the Files are On'''
+
+    devices = {}
+    for dirPath in {os.path.dirname(os.path.abspath(p)) for p in filePaths}:
+        deviceKey, deviceType, _ = getDeviceInfo(dirPath)
+        devices[deviceKey] = deviceType
+
+    return devices
+
+
+def getFileChecksum(filePath:str, algorithm:str, chunkSize:int=4 * 1024 * 1024, uncached:bool=False) -> str:
+    '''
+    Returns the Full-content Checksum of the File\n
+    uncached Reads the Data from Disk Instead of the Page Cache, and Drops it Behind the Read
+    '''
+
+    hashObject = getHashObject(algorithm)
+
+    with open(filePath, "rb", buffering=0) as f:
+        fd = f.fileno()
+        if uncached:
+            uncached = dropFileCache(fd, flush=True)
+
+        offset = 0
+        while chunk := f.read(chunkSize):
+            hashObject.update(chunk)
+
+            if uncached:
+                dropFileCache(fd, offset, len(chunk))
+                offset += len(chunk)
+
+    return hashObject.hexdigest()
+
+
+def getFileChecksums(filePaths:list, algorithm:str, hashCache=None, maxWorkers:int=None, uncached:bool=False) -> dict:
+    '''
+    Returns Dict of filePath: (size, mtime, checksum) with the Files Hashed in Parallel.\n
+    Unchanged Files Found in the hashCache are not Read Again, unless uncached is Set
+    (Destination Read-back), where Every File is Read from the Disk
+    '''
+
+    algorithm = getResolvedHashAlgorithm(algorithm)
+    maxWorkers = maxWorkers or min(8, os.cpu_count() or 4)
+    newEntries = []
+
+    def _hashFile(filePath):
+        try:
+            stat = os.stat(filePath)
+            checksum = hashCache.get(filePath, algorithm, stat=stat) if hashCache and not uncached else None
+
+            if checksum is None:
+                checksum = getFileChecksum(filePath, algorithm, uncached=uncached)
+                newEntries.append((filePath, algorithm, checksum, stat))
+
+            return stat.st_size, stat.st_mtime, checksum
+
+        except OSError as e:
+            logger.warning(f"ERROR:  Failed to Hash {filePath}: {e}")
+            return 0, 0.0, "Error"
+
+    if len(filePaths) == 1:
+        fileHashes = {filePaths[0]: _hashFile(filePaths[0])}
+    else:
+        with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+            fileHashes = dict(zip(filePaths, executor.map(_hashFile, filePaths)))
+
+    if hashCache:
+        hashCache.putMany(newEntries)
+
+    return fileHashes
+
+
+def getMerkleRoot(checksums:list, algorithm:str) -> str:
+    '''Returns the Merkle Tree Root of Ordered Per-file Checksums (Image Sequences)'''
+
+    level = list(checksums)
+    if not level:
+        return getHashObject(algorithm).hexdigest()
+
+    #   Hash Pairs until One Node is Left (an Odd Node is Hashed Alone)
+    while len(level) > 1:
+        nextLevel = []
+        for i in range(0, len(level), 2):
+            hashObject = getHashObject(algorithm)
+            for checksum in level[i:i + 2]:
+                hashObject.update(checksum.encode())
+            nextLevel.append(hashObject.hexdigest())
+        level = nextLevel
+
+    return level[0]
+
+
+def getMismatchedFiles(sourceHashes:dict, destHashes:dict) -> list:
+    '''Returns the Files whose Destination Checksum Differs from the Source (filePath: checksum)'''
+
+    return [f for f, checksum in sourceHashes.items() if destHashes.get(f) != checksum]
+
+
+def getFrameNumber(fileName:str) -> int | None:
+    '''Returns the Trailing Frame Number of a Sequence Filename'''
+
+    match = re.search(r"(\d+)\D*$", os.path.splitext(fileName)[0])
+    return int(match.group(1)) if match else None
+
+
+def buildSequenceRecords(dirPath:str, seqs:dict, sizes:dict) -> list[SequenceRecord]:
+    '''
+    Builds Compact Records from Detected Sequences\n
+    Uses the Scanned Sizes (Filename: Size) and only Stats Frames that are Missing
+    '''
+
+    records = []
+
+    for pattern, files in seqs.items():
+        if not files:
+            continue
+
+        files = sorted(files)
+
+        #   Frame Range
+        frames = [num for num in map(getFrameNumber, files) if num is not None]
+        frameStart = min(frames) if frames else None
+        frameEnd = max(frames) if frames else None
+
+        #   Total Size
+        totalSize = 0
+        for fileName in files:
+            size = sizes.get(fileName)
+            if size is None:
+                size = getFileSize(os.path.join(dirPath, fileName))
+            totalSize += size
+
+        records.append(SequenceRecord(pattern=pattern,
+                                      dirPath=dirPath,
+                                      files=files,
+                                      frameStart=frameStart,
+                                      frameEnd=frameEnd,
+                                      totalSize=totalSize))
+
+    return records
+
+
 def getFileSizeStr(size_bytes:int) -> str:
     '''Returns a UI Friendly Size String from Raw Size'''
 
@@ -588,31 +966,14 @@ def getThumbFromVideoPath(
     thumbTempPath = None
     try:
         ffmpegPath = os.path.normpath(core.media.getFFmpeg(validate=True))
-        ffprobePath = getFFprobePath()
 
         #   Determine fps
         fps = 24.0
         creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
-        probe = subprocess.run(
-            [
-                ffprobePath,
-                "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "stream=r_frame_rate",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                path,
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            creationflags=creationflags,
-        )
-        if probe.returncode == 0:
-            fps_str = probe.stdout.strip()
-            if "/" in fps_str:
-                num, denom = fps_str.split("/", 1)
-                fps = float(num) / float(denom) if float(denom) > 0 else fps
+        probe = probeMedia(path)
+        if probe and probe[1] > 0:
+            fps = probe[1]
 
         timestamp = imgNum / fps
 
@@ -864,8 +1225,41 @@ def createStackedDragPixmap(widgets: list) -> QPixmap:
 #################################################
 #################    METADATA    ################
 
+#   xxHash64 is Only Listed when the xxhash Module can be Imported
+HASH_ALGORITHMS = (["xxHash64"] if xxhash else []) + ["BLAKE2b", "MD5", "SHA-256"]
+DEFAULT_HASH_ALGORITHM = "BLAKE2b"
+
+#   Kernel Copy Methods in Order of Preference
+KERNEL_COPY_METHODS = [m for m in ("copy_file_range", "sendfile") if hasattr(os, m)]
+
+#   Errors where the Filesystem Pair does not Support the Kernel Copy Method
+KERNEL_COPY_UNSUPPORTED = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+#   Filesystems with Native Preallocation (Others are Emulated by Writing Zeros)
+PREALLOCATE_FS_TYPES = {"ext4", "xfs", "btrfs", "f2fs", "ocfs2", "gfs2", "bcachefs"}
+
+#   Errors Meaning the Filesystem Cannot Preallocate (the Copy Continues Without it)
+PREALLOCATE_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOSYS, errno.EINVAL}
+
+#   Device Types with their own Parallel Transfer Limit
+DEVICE_TYPES = ["hdd", "ssd", "nvme", "network"]
+
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smb3", "smbfs", "afpfs", "sshfs", "fuse.sshfs", "davfs", "9p"}
+
 EXIFTOOL_BLOCKED_GROUPS = {"QuickTime", "SourceFile", "File", "Composite"}
 
+#   FFprobe Names of the Libav Color Space Values (Unspecified is Omitted like FFprobe)
+AV_COLOR_SPACES = {0: "gbr", 1: "bt709", 4: "fcc", 5: "bt470bg", 6: "smpte170m", 7: "smpte240m",
+                   8: "ycgco", 9: "bt2020nc", 10: "bt2020c", 11: "smpte2085",
+                   12: "chroma-derived-nc", 13: "chroma-derived-c", 14: "ictcp"}
+
+#   Shared Per-file Probe Results (ffprobe, ExifTool, PyAV, and OIIO)
+mediaProbe = MediaProbe()
+
+#   Persistent ExifTool Processes (Created on First Use)
+_exifToolPool = None
+_exifToolPoolLock = threading.Lock()
+
 
 def formatCodecMetadata(metadata:dict) -> str:
     '''Returns String from Metadata Dict'''
@@ -889,8 +1283,240 @@ def getFFprobePath() -> str | None:
     return None
 
 
+def _getProbeResult(values:dict) -> tuple:
+    '''Converts FFprobe-style Values to (frames, fps, secs, codec, metadata, width, height)'''
+
+    frames = 1
+    fps = 0.0
+    secs = 0.0
+    width = 0
+    height = 0
+
+    frames_str = values.get("nb_frames", "1")
+    fps_str = values.get("r_frame_rate", "0/1")
+    sec_str = values.get("duration", "0")
+    codec = values.get("codec_name")
+
+    try:
+        width = int(values.get("width", "0"))
+        height = int(values.get("height", "0"))
+    except Exception:
+        pass
+
+    if '/' in fps_str:
+        try:
+            num, denom = map(int, fps_str.split('/'))
+            fps = num / denom if denom else 0.0
+        except Exception:
+            fps = 0.0
+
+    try:
+        secs = float(sec_str)
+    except Exception:
+        secs = 0.0
+
+    if frames_str == 'N/A' or not frames_str.isdigit():
+        frames = int(round(secs * fps)) if fps > 0 and secs > 0 else 1
+    else:
+        frames = int(frames_str)
+
+    return frames, fps, secs, codec, values, width, height
+
+
+def getProbeResultFromFFprobe(metadata:dict, audio:bool=False) -> tuple | None:
+    '''Returns the Probe Tuple from Full FFprobe Metadata (see getFFprobeMetadata()), or None'''
+
+    streamType = "audio" if audio else "video"
+    streams = [s for s in metadata.get("streams", []) if s.get("codec_type") == streamType]
+    if not streams:
+        return None
+
+    stream = streams[0]
+    keys = ["nb_frames", "r_frame_rate", "codec_name", "profile", "codec_tag_string", "codec_long_name"]
+    if not audio:
+        keys += ["width", "height"]
+
+    values = {k: str(stream[k]) for k in keys if k in stream}
+    if "duration" in metadata.get("format", {}):
+        values["duration"] = str(metadata["format"]["duration"])
+
+    return _getProbeResult(values)
+
+
+def _getAVStreamInfo(stream) -> dict:
+    '''Returns FFprobe-style Keys of a PyAV Stream'''
+
+    info = {
+        "index": stream.index,
+        "codec_type": stream.type,
+    }
+
+    if stream.time_base is not None:
+        info["time_base"] = f"{stream.time_base.numerator}/{stream.time_base.denominator}"
+    if stream.duration is not None and stream.time_base is not None:
+        info["duration"] = f"{float(stream.duration * stream.time_base):.6f}"
+    info["nb_frames"] = str(stream.frames) if stream.frames else "N/A"
+
+    ctx = stream.codec_context
+    if ctx is not None:
+        info["codec_name"] = ctx.name
+        info["codec_long_name"] = ctx.codec.long_name
+        info["profile"] = ctx.profile or "unknown"
+        info["codec_tag_string"] = str(ctx.codec_tag or "")
+        if ctx.bit_rate:
+            info["bit_rate"] = str(ctx.bit_rate)
+
+        if stream.type == "video":
+            rate = stream.base_rate or stream.average_rate
+            info["width"] = ctx.width or 0
+            info["height"] = ctx.height or 0
+            info["pix_fmt"] = ctx.pix_fmt or "unknown"
+            info["r_frame_rate"] = f"{rate.numerator}/{rate.denominator}" if rate else "0/0"
+            if stream.average_rate:
+                info["avg_frame_rate"] = f"{stream.average_rate.numerator}/{stream.average_rate.denominator}"
+
+            #   Keys Read by the Metadata Presets
+            if ctx.sample_aspect_ratio:
+                info["sample_aspect_ratio"] = f"{ctx.sample_aspect_ratio.numerator}:{ctx.sample_aspect_ratio.denominator}"
+            if ctx.colorspace in AV_COLOR_SPACES:
+                info["color_space"] = AV_COLOR_SPACES[ctx.colorspace]
+
+            #   Bit Depth of the Decoded Pixel Format (as FFprobe Reports for Intra Codecs such as ProRes)
+            if ctx.format is not None and ctx.format.components:
+                info["bits_per_raw_sample"] = str(ctx.format.components[0].bits)
+
+        elif stream.type == "audio":
+            info["sample_rate"] = str(ctx.sample_rate)
+            info["channels"] = ctx.channels
+            info["r_frame_rate"] = "0/0"
+            if ctx.layout is not None:
+                info["channel_layout"] = ctx.layout.name
+
+    if stream.metadata:
+        info["tags"] = dict(stream.metadata)
+
+    return info
+
+
+def inspectMediaAV(filePath:str) -> dict:
+    '''Returns FFprobe-style Format and Streams Metadata from a Single In-process PyAV Open, or {} if PyAV Fails'''
+
+    if av is None:
+        return {}
+
+    try:
+        with av.open(filePath) as container:
+            streams = []
+            for stream in container.streams:
+                try:
+                    streams.append(_getAVStreamInfo(stream))
+                except Exception as e:
+                    logger.debug(f"PyAV Unable to Read Stream {stream.index} of {filePath}:\n{e}")
+
+            formatInfo = {
+                "filename": filePath,
+                "nb_streams": len(streams),
+                "format_name": container.format.name,
+                "format_long_name": container.format.long_name,
+                "size": str(container.size),
+            }
+
+            #   Container Duration is in AV_TIME_BASE Units
+            if container.duration is not None:
+                formatInfo["duration"] = f"{container.duration / av.time_base:.6f}"
+            else:
+                durations = [float(s["duration"]) for s in streams if "duration" in s]
+                if durations:
+                    formatInfo["duration"] = f"{max(durations):.6f}"
+            if container.bit_rate:
+                formatInfo["bit_rate"] = str(container.bit_rate)
+            if container.metadata:
+                formatInfo["tags"] = dict(container.metadata)
+
+        return {"format": formatInfo, "streams": streams}
+
+    except Exception as e:
+        logger.debug(f"PyAV Inspection Failed for {filePath}:\n{e}")
+        return {}
+
+
+def inspectMedia(filePath:str) -> dict:
+    '''
+    Runs the Full Inspection of the File (Coalesced and Cached by getMediaInspection()).\n
+    Opens the File Once In-process with PyAV and Falls Back to a Single FFprobe Run.
+    The Real FFprobe Output and ExifTool Metadata are Added to the Same Record when First Needed.
+    '''
+
+    metadata = inspectMediaAV(filePath)
+    source = "av"
+
+    if not metadata:
+        metadata = getFFprobeMetadata(filePath)
+        source = "ffprobe"
+
+    return {"ffprobe": metadata, "source": source, "exif": None}
+
+
+def getMediaInspection(filePath:str, full:bool=False) -> dict:
+    '''
+    Returns the Shared Inspection of the File.\n
+    With full=True (Metadata Editor and Sidecars) a PyAV Inspection is Replaced by the Real
+    FFprobe Output (if Available) and the ExifTool Metadata is Added, Once per File
+    '''
+
+    inspection = mediaProbe.get(filePath, "inspection", inspectMedia)
+
+    #   Failed Inspections are not Kept, so the Next Request Retries
+    if not inspection["ffprobe"]:
+        mediaProbe.discard(filePath, "inspection")
+
+    if full:
+        if inspection["source"] == "av" and getFFprobePath():
+            metadata = getFFprobeMetadata(filePath)
+            if metadata:
+                inspection["ffprobe"] = metadata
+                inspection["source"] = "ffprobe"
+
+        if inspection["exif"] is None:
+            inspection["exif"] = getExifMetadata(filePath) or None
+
+    return inspection
+
+
+def getVideoStreamInfo(filePath:str) -> tuple[int, str]:
+    '''
+    Returns the Frame Count and Codec of the First Video Stream from the Shared Inspection.\n
+    Only Decodes the Stream to Count the Frames if the Header has no Frame Count (Once per File)
+    '''
+
+    inspection = getMediaInspection(filePath)
+    streams = [s for s in inspection["ffprobe"].get("streams", []) if s.get("codec_type") == "video"]
+    if not streams:
+        raise ValueError(f"No Video Stream in {filePath}")
+
+    stream = streams[0]
+    codec = str(stream.get("codec_name", "")).lower()
+
+    frames = str(stream.get("nb_frames", ""))
+    if frames.isdigit() and int(frames) > 0:
+        return int(frames), codec
+
+    if inspection.get("decodedFrames") is None:
+        with av.open(filePath) as container:
+            inspection["decodedFrames"] = sum(1 for _ in container.decode(container.streams.video[0]))
+
+    return inspection["decodedFrames"], codec
+
+
+def probeMedia(filePath:str, audio:bool=False) -> tuple | None:
+    '''Returns the Probe Tuple of the First Video (or Audio) Stream from the Shared Inspection, or None'''
+
+    return getProbeResultFromFFprobe(getMediaInspection(filePath)["ffprobe"], audio=audio)
+
+
+@lru_cache(maxsize=1)
 def getExiftool() -> str | None:
-    '''Returns File Path of exitool.exe or None if Not Found'''
+    '''Returns File Path of exitool.exe or None if Not Found (Searched Once per Session)'''
 
     exifDir = os.path.join(pluginPath, "PythonLibs", "ExifTool")
 
@@ -908,28 +1534,62 @@ def getExiftool() -> str | None:
     return None
 
 
-def getExifMetadata(filePath: str) -> dict:
-    '''Returns Dict of All Metadata from ExifTool'''
+def getExifToolPool() -> ExifToolPool | None:
+    '''Returns the Shared ExifTool Process Pool or None if ExifTool is Not Found'''
+
+    global _exifToolPool
+
+    with _exifToolPoolLock:
+        if _exifToolPool is None:
+            exifToolEXE = getExiftool()
+            if not exifToolEXE:
+                return None
+
+            _exifToolPool = ExifToolPool(exifToolEXE)
+            atexit.register(_exifToolPool.terminate)
+
+    return _exifToolPool
+
+
+def getExifMetadataBatch(filePaths:list) -> dict:
+    '''Returns Dict of filePath: All Metadata from ExifTool, Sending Files in Batches'''
 
     try:
-        exifToolEXE = getExiftool()
-        if not exifToolEXE:
-            return {}
+        pool = getExifToolPool()
+        if not pool:
+            return {f: {} for f in filePaths}
 
-        with exiftool.ExifTool(exifToolEXE) as et:
-            metadata_list = et.execute_json("-G", filePath)
+        return pool.getMetadata(filePaths, args=("-G",))
 
-        if metadata_list:
-            metadata = metadata_list[0]
-            logger.debug(f"ExifTool metadata found for {filePath}")
-            return metadata
-        
+    except Exception as e:
+        logger.warning(f"Failed to get ExifTool metadata: {e}")
+        return {f: {} for f in filePaths}
+
+
+def getExifMetadata(filePath: str) -> dict:
+    '''Returns Dict of All Metadata from ExifTool'''
+
+    metadata = getExifMetadataBatch([filePath]).get(filePath, {})
+
+    if metadata:
+        logger.debug(f"ExifTool metadata found for {filePath}")
+    else:
         logger.warning(f"No ExifTool metadata found for {filePath}")
-        return {}
 
-    except Exception as e:
-        logger.warning(f"Failed to get ExifTool metadata for {filePath}: {e}")
-        return {}
+    return metadata
+
+
+def prefetchExifMetadata(filePaths:list) -> None:
+    '''Loads ExifTool Metadata of the Files in Batches into their Shared Inspections'''
+
+    inspections = {f: getMediaInspection(f) for f in filePaths if f and os.path.isfile(f)}
+    missing = [f for f, inspection in inspections.items() if inspection["exif"] is None]
+    if not missing:
+        return
+
+    for filePath, metadata in getExifMetadataBatch(missing).items():
+        if filePath in inspections and metadata:
+            inspections[filePath]["exif"] = metadata
     
     
 def groupExifMetadata(metadata: dict) -> dict:
@@ -1031,13 +1691,15 @@ def getCombinedMetadata(filePath: str) -> dict:
 
     combined = {}
 
+    inspection = getMediaInspection(filePath, full=True)
+
     #   Get FFprobe Data
-    ffprobe_data = getFFprobeMetadata(filePath)
+    ffprobe_data = inspection["ffprobe"]
     if ffprobe_data:
         combined.update(ffprobe_data)
 
     #   Get ExifTool Data
-    exif_data = getExifMetadata(filePath)
+    exif_data = inspection["exif"]
     if exif_data:
         for k, v in exif_data.items():
             group = k.split(":")[0]
@@ -1052,13 +1714,15 @@ def getGroupedCombinedMetadata(filePath: str) -> dict:
 
     grouped = {}
 
+    inspection = getMediaInspection(filePath, full=True)
+
     #   Get FFprobe Data
-    ffprobe_data = getFFprobeMetadata(filePath)
+    ffprobe_data = inspection["ffprobe"]
     if ffprobe_data:
         grouped.update(groupFFprobeMetadata(ffprobe_data))
 
     #   Get ExifTool Data
-    exif_data = getExifMetadata(filePath)
+    exif_data = inspection["exif"]
     if exif_data:
         grouped_exif = groupExifMetadata(exif_data)
 
@@ -1125,6 +1789,13 @@ def getProjectPresetDir(core, presetType:str) -> str:
     return os.path.join(projPipelineDir, "SourceTab", "Presets", presetType.capitalize())
 
 
+def getProjectCacheDir(core) -> str:
+    '''Returns the Projects SourceTab Cache Dir'''
+
+    projPipelineDir = core.projects.getPipelineFolder()
+    return os.path.join(projPipelineDir, "SourceTab", "Cache")
+
+
 def getLocalPresetDir(presetType:str) -> str:
     '''Returns Local Preset Dir by Type'''
 
@@ -1132,6 +1803,17 @@ def getLocalPresetDir(presetType:str) -> str:
     return os.path.join(pluginPath, "Presets", presetType.capitalize())
 
 
+def getUserDataDir(core) -> str:
+    '''Returns the SourceTab Dir in the Prism User Data Location'''
+
+    try:
+        userDir = core.getUserPrefDir()
+    except Exception:
+        userDir = os.path.dirname(core.userini)
+
+    return os.path.join(userDir, "SourceTab")
+
+
 def importPreset(core, pType:str, local:bool=False) -> dict | None:
     '''Import Preset from File'''
 
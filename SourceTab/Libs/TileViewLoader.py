@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import logging
+
+
+from qtpy.QtCore import *
+from qtpy.QtGui import *
+from qtpy.QtWidgets import *
+
+
+logger = logging.getLogger(__name__)
+
+
+
+class TileViewLoader(QObject):
+    '''
+    Creates Tile Widgets only for the Rows in (or near) the Viewport of a Tile List View\n
+    Rows Scrolled out of Range are Released back to the Delegate Painting,
+    and Pinned Tiles (such as Selected Tiles) are Kept Alive, also while their Row is
+    Filtered Out or Removed (the View's Delegate must not Destroy Pinned Tiles)\n
+    Emits the UUIDs of the Visible and Near-visible Rows for Work Scheduling
+    '''
+
+    viewportChanged = Signal(list, list)
+
+    def __init__(self,
+                 view:QAbstractItemView,
+                 model:QAbstractItemModel,
+                 createTile:callable,
+                 releaseTile:callable=None,
+                 isPinned:callable=None,
+                 margin:int=10
+                 ):
+        super().__init__(view)
+
+        self.view = view
+        self.model = model
+        self.createTile = createTile
+        self.releaseTile = releaseTile
+        self.isPinned = isPinned
+        self.margin = margin
+
+        #   Live Tiles by UUID
+        self.tiles = {}
+        self.lastViewport = None
+
+        #   Coalesce Scroll / Resize / Model Updates
+        self.updateTimer = QTimer(self)
+        self.updateTimer.setSingleShot(True)
+        self.updateTimer.setInterval(0)
+        self.updateTimer.timeout.connect(self.updateTiles)
+
+        self.view.verticalScrollBar().valueChanged.connect(self.scheduleUpdate)
+        self.view.viewport().installEventFilter(self)
+
+        self.model.modelAboutToBeReset.connect(self.onModelAboutToBeReset)
+        self.model.modelReset.connect(self.scheduleUpdate)
+        self.model.rowsInserted.connect(self.scheduleUpdate)
+        self.model.rowsAboutToBeRemoved.connect(self.onRowsAboutToBeRemoved)
+        self.model.rowsRemoved.connect(self.scheduleUpdate)
+        self.model.layoutChanged.connect(self.scheduleUpdate)
+
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Resize:
+            self.scheduleUpdate()
+        return False
+
+
+    def scheduleUpdate(self, *args) -> None:
+        if not self.updateTimer.isActive():
+            self.updateTimer.start()
+
+
+    def getVisibleRows(self) -> range:
+        '''Returns the Row Range Inside the Viewport'''
+
+        count = self.model.rowCount()
+        if count == 0:
+            return range(0)
+
+        viewport = self.view.viewport()
+        first = self.view.indexAt(QPoint(1, 1)).row()
+        last = self.view.indexAt(QPoint(1, viewport.height() - 1)).row()
+
+        if first < 0:
+            first = 0
+        if last < 0:
+            last = count - 1
+
+        return range(first, last + 1)
+
+
+    def getLoadRows(self, visibleRows:range=None) -> range:
+        '''Returns the Row Range that should have Live Tiles'''
+
+        count = self.model.rowCount()
+
+        if visibleRows is None:
+            visibleRows = self.getVisibleRows()
+        if not visibleRows:
+            return range(0)
+
+        return range(max(0, visibleRows.start - self.margin), min(count, visibleRows.stop + self.margin))
+
+
+    def emitViewport(self, visibleRows:range, loadRows:range) -> None:
+        uuidAt = lambda row: self.model.index(row).data(self.model.UuidRole)
+
+        visible = [uuidAt(row) for row in visibleRows]
+        near = [uuidAt(row) for row in loadRows if row not in visibleRows]
+
+        if (visible, near) != self.lastViewport:
+            self.lastViewport = (visible, near)
+            self.viewportChanged.emit(visible, near)
+
+
+    def updateTiles(self) -> None:
+        '''Creates Tiles Entering the Load Range and Releases the Rest'''
+
+        try:
+            wanted = set()
+
+            visibleRows = self.getVisibleRows()
+            loadRows = self.getLoadRows(visibleRows)
+            self.emitViewport(visibleRows, loadRows)
+
+            for row in loadRows:
+                uuid = self.model.index(row).data(self.model.UuidRole)
+                wanted.add(uuid)
+
+                if uuid not in self.tiles:
+                    self.loadRow(row)
+
+            for uuid in list(self.tiles):
+                if uuid in wanted:
+                    continue
+                if self.isPinned and self.isPinned(self.tiles[uuid]):
+                    continue
+
+                self.releaseRow(uuid)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Update Tile Widgets:\n{e}")
+
+
+    def loadRow(self, row:int) -> QWidget:
+        '''Creates (or Returns the Existing) Tile for the Row'''
+
+        index = self.model.index(row)
+        uuid = index.data(self.model.UuidRole)
+
+        if uuid in self.tiles:
+            tile = self.tiles[uuid]
+
+            #   Pinned Tile Kept while its Row was Filtered Out
+            if self.view.indexWidget(index) is not tile:
+                self.view.setIndexWidget(index, tile)
+
+            return tile
+
+        tile = self.createTile(index.data(self.model.DataItemRole))
+        if tile is None:
+            return None
+
+        self.tiles[uuid] = tile
+        self.view.setIndexWidget(index, tile)
+
+        return tile
+
+
+    def loadRows(self, first:int, last:int) -> list:
+        '''Creates the Tiles for a Row Range (such as a Shift-Selection)'''
+
+        tiles = []
+        for row in range(max(0, first), min(self.model.rowCount(), last + 1)):
+            tile = self.loadRow(row)
+            if tile is not None:
+                tiles.append(tile)
+
+        return tiles
+
+
+    def loadUuids(self, uuids:set) -> list:
+        '''Creates the Tiles for the Rows of the UUIDs (such as the Checked Rows)'''
+
+        tiles = []
+        for row in range(self.model.rowCount()):
+            if self.model.index(row).data(self.model.UuidRole) in uuids:
+                tile = self.loadRow(row)
+                if tile is not None:
+                    tiles.append(tile)
+
+        return tiles
+
+
+    def releaseRow(self, uuid:str) -> None:
+        tile = self.tiles.pop(uuid, None)
+        if tile is None:
+            return
+
+        if self.releaseTile:
+            self.releaseTile(tile)
+
+        #   Removing the Index Widget Deletes the Tile
+        row = self.model.rowForUuid(uuid)
+        if row >= 0 and self.view.indexWidget(self.model.index(row)) is tile:
+            self.view.setIndexWidget(self.model.index(row), None)
+
+        #   Pinned Tile Kept after its Row was Removed (no Longer Owned by the View)
+        else:
+            tile.deleteLater()
+
+
+    def getTile(self, uuid:str) -> QWidget:
+        return self.tiles.get(uuid)
+
+
+    def getTiles(self) -> list:
+        '''Returns the Live Tiles in Row Order'''
+
+        rows = [(self.model.rowForUuid(uuid), tile) for uuid, tile in self.tiles.items()]
+        return [tile for row, tile in sorted(rows, key=lambda r: r[0]) if row >= 0]
+
+
+    #   The View Deletes Index Widgets on Reset / Removal
+    def onModelAboutToBeReset(self) -> None:
+        for tile in self.tiles.values():
+            if self.releaseTile:
+                self.releaseTile(tile)
+
+        self.tiles = {}
+
+
+    def onRowsAboutToBeRemoved(self, parent:QModelIndex, first:int, last:int) -> None:
+        for row in range(first, last + 1):
+            uuid = self.model.index(row).data(self.model.UuidRole)
+            tile = self.tiles.get(uuid)
+            if tile is None:
+                continue
+
+            #   Pinned Tiles (such as Active Transfers) Keep their State, and are Re-attached if the Row Returns
+            if self.isPinned and self.isPinned(tile):
+                continue
+
+            del self.tiles[uuid]
+            if self.releaseTile:
+                self.releaseTile(tile)
@@ -123,15 +123,36 @@ class BaseTileItem(QWidget):
     def thumb_semaphore(self):
         return self.browser.thumb_semaphore
     @property
-    def copy_semaphore(self):
-        return self.browser.copy_semaphore
-    @property
     def size_copyChunk(self):
         return self.browser.size_copyChunk
     @property
     def proxy_semaphore(self):
         return self.browser.proxy_semaphore
     @property
+    def copyBufferCount(self):
+        return self.browser.copyBufferCount
+    @property
+    def sequenceCopyThreads(self):
+        return self.browser.sequenceCopyThreads
+    @property
+    def useKernelCopy(self):
+        return self.browser.useKernelCopy
+    @property
+    def resumeTransfers(self):
+        return self.browser.resumeTransfers
+    @property
+    def syncTransfers(self):
+        return self.browser.syncTransfers
+    @property
+    def allowOverwrite(self):
+        return self.browser.sourceFuncts.chb_overwrite.isChecked()
+    @property
+    def hashAlgorithm(self):
+        return self.browser.hashAlgorithm
+    @property
+    def verifyReadBack(self):
+        return self.browser.verifyReadBack
+    @property
     def progUpdateInterval(self):
         return self.browser.progUpdateInterval
     @property
@@ -356,22 +377,16 @@ class BaseTileItem(QWidget):
 
     @err_catcher(name=__name__)
     def _selectRange(self):
-        #   Get all tiles in order
+        #   Get the Tiles Between the Last Clicked and this Tile (Creates Off-screen Tiles)
         if isinstance(self, SourceFileTile):
-            allTiles = self.browser.getAllSourceTiles()
+            rangeTiles = self.browser.getTileRange("source", self.browser.lastClickedTile, self)
         elif isinstance(self, DestFileTile):
-            allTiles = self.browser.getAllDestTiles()
+            rangeTiles = self.browser.getTileRange("dest", self.browser.lastClickedTile, self)
         else:
             return
-        
-        try:
-            start = allTiles.index(self.browser.lastClickedTile)
-            end = allTiles.index(self)
-        except ValueError:
-            return
 
-        if start > end:
-            start, end = end, start
+        if not rangeTiles:
+            return
 
         #   Deselect Current Selection
         for tile in self.browser.selectedTiles:
@@ -379,7 +394,7 @@ class BaseTileItem(QWidget):
         self.browser.selectedTiles.clear()
 
         #   Select the Range
-        for tile in allTiles[start:end + 1]:
+        for tile in rangeTiles:
             tile.state = "selected"
             tile.applyStyle(tile.state)
             self.browser.selectedTiles.add(tile)
@@ -406,6 +421,12 @@ class BaseTileItem(QWidget):
             self.browser.refreshTotalTransSize()
 
 
+    #   Stores the Checked State with the Browser (Tiles are Created / Released on Scroll)
+    @err_catcher(name=__name__)
+    def onCheckToggled(self, checked):
+        self.browser.setTileChecked(self, checked)
+
+
     #   Toggles the Checkbox
     @err_catcher(name=__name__)
     def toggleChecked(self):
@@ -645,29 +666,94 @@ class BaseTileItem(QWidget):
         return total_size
 
 
+    #   Returns an Estimated Proxy Size Based on a Fractional Multiplier
+    @err_catcher(name=__name__)
+    def getMultipliedProxySize(self, frame=None, total=False):
+        try:
+            #   Get Main File Size
+            mainSize = Utils.getFileSize(self.getSource_mainfilePath())
+
+            if not mainSize:
+                return 0
+
+            #   Get Presets and Multiplier from Preset
+            presetName = self.browser.proxySettings.get("proxyPreset", "")
+            pData = self.browser.proxyPresets.getPresetData(presetName)
+            mult = float(pData.get("Multiplier", 0.0))
+
+            #   Get and Apply Proxy Scaling
+            scale_str = self.browser.proxySettings.get("proxyScale", "100%")
+            scale = int(scale_str.strip('%'))
+            scaled_mult = mult * (scale / 100) ** 2
+
+            #   Get Estimated Proxy Size based on Multiplier
+            proxySize = mainSize * scaled_mult
+
+            if total:
+                #   Just Return Full Proxy Size
+                return proxySize
+            
+            else:
+                #   Get Number of Frames
+                total_frames = self.data["source_mainFile_frames"]
+
+                #   Abort if Incorrect Data
+                if total_frames <= 0 or frame is None:
+                    return 0            
+                
+                #   Clamp Frame
+                frame = max(0, min(frame, total_frames))
+                #   Calculate Proxy Size per Frame
+                per_frame = proxySize / total_frames
+
+                return per_frame * frame
+            
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Get Multiplied Proxy Size:\n{e}")
+            return 0
+
+
     #   Gets Info such as Duration and Codec
     @err_catcher(name=__name__)
     def getFileInfo(self, filePath, callback=None):
         worker_frames = FileInfoWorker(self, self.core, filePath)
         worker_frames.finished.connect(callback)
-        self.dataOps_threadpool.start(worker_frames)
+        self.startWorker(self.dataOps_threadpool, worker_frames)
     
 
-    #   Gets Custom Hash of File in Separate Thread
+    #   Launches a Worker (Source Items are Queued by Viewport Priority)
     @err_catcher(name=__name__)
-    def setFileHash(self, filePath, callback=None, mode="transfer",  mainTile=None, seqTile=None):
+    def startWorker(self, threadpool, worker, onStarted=None):
+        if self.tileType == "sourceItem":
+            self.browser.jobScheduler.submit(self.data["uuid"], threadpool, worker, onStarted)
+
+        else:
+            threadpool.start(worker)
+            if onStarted:
+                onStarted()
+
+
+    #   Gets Custom Hash (or Full Checksum if algorithm is Passed) of File in Separate Thread
+    @err_catcher(name=__name__)
+    def setFileHash(self, filePath, callback=None, mode="transfer",  mainTile=None, seqTile=None,
+                    algorithm=None, fileHashesCallback=None, uncached=False):
         #   Create Worker Instance
-        worker_hash = FileHashWorker(filePath, seqTile)
+        worker_hash = FileHashWorker(filePath, seqTile, algorithm=algorithm, uncached=uncached)
         #   Connect to Finished Callback
         worker_hash.finished.connect(callback)
-        #   Launch Worker in DataOps Treadpool
-        self.dataOps_threadpool.start(worker_hash)
+        if fileHashesCallback:
+            worker_hash.fileHashesReady.connect(fileHashesCallback)
 
-        #   Timer to Ensure Hash Generation does not Hang
-        self.hashWatchdogTimer = QTimer()
-        self.hashWatchdogTimer.setSingleShot(True)
-        self.hashWatchdogTimer.timeout.connect(lambda: self.onHashTimeout(mainTile, mode))
-        self.hashWatchdogTimer.start(30000)
+        #   Timer to Ensure Hash Generation does not Hang (Started when the Worker Starts)
+        watchdogTimer = self.hashWatchdogTimer = QTimer()
+        watchdogTimer.setSingleShot(True)
+        watchdogTimer.timeout.connect(lambda: self.onHashTimeout(mainTile, mode))
+
+        #   Full Checksums Read the Whole File so are not Time Limited
+        onStarted = None if algorithm else lambda: watchdogTimer.start(30000)
+
+        #   Launch Worker in DataOps Treadpool
+        self.startWorker(self.dataOps_threadpool, worker_hash, onStarted=onStarted)
 
 
     @err_catcher(name=__name__)
@@ -740,7 +826,7 @@ class BaseTileItem(QWidget):
 
             worker_thumb.setAutoDelete(True)
             worker_thumb.result.connect(self.onThumbComplete)
-            self.thumb_threadpool.start(worker_thumb)
+            self.startWorker(self.thumb_threadpool, worker_thumb)
 
             logger.debug("Refreshing Thumbnail")
         
@@ -1174,14 +1260,18 @@ class SourceFileItem(BaseTileItem):
         icon = self.getIconByType(filePath)
         self.data["icon"] = icon
 
-        #   Date
-        date_data = Utils.getFileDate(filePath)
+        #   Date (Use the Scanned Stat Data if Passed)
+        date_data = self.data.get("source_mainFile_date_raw")
+        if date_data is None:
+            date_data = Utils.getFileDate(filePath)
         self.data["source_mainFile_date_raw"] = date_data
         date_str = self.core.getFormattedDate(date_data)
         self.data["source_mainFile_date"] = date_str
 
-        #   Size
-        mainSize_data = Utils.getFileSize(filePath)
+        #   Size (Use the Scanned Stat Data if Passed)
+        mainSize_data = self.data.get("source_mainFile_size_raw")
+        if mainSize_data is None:
+            mainSize_data = Utils.getFileSize(filePath)
         self.data["source_mainFile_size_raw"] = mainSize_data
         mainSize_str = Utils.getFileSizeStr(mainSize_data)
         self.data["source_mainFile_size"] = mainSize_str
@@ -1204,6 +1294,18 @@ class SourceFileItem(BaseTileItem):
                 self.updateCallbacks[field].append(tile.updateField)
 
 
+    #   Detach a Released FileTile
+    @err_catcher(name=__name__)
+    def unregisterTile(self, tile: "SourceFileTile"):
+        for callbacks in self.updateCallbacks.values():
+            if tile.updateField in callbacks:
+                callbacks.remove(tile.updateField)
+
+        if self.tile is tile:
+            self.tile = None
+            self.data.pop("sourceTile", None)
+
+
     #   Process Callbacks when Ready
     @err_catcher(name=__name__)
     def _notify(self, field):
@@ -1211,6 +1313,9 @@ class SourceFileItem(BaseTileItem):
             callback(field)
 
         self.updateCallbacks[field].clear()
+
+        #   Repaint the Row if it has no Live Tile
+        self.browser.refreshSourceRow(self.data.get("uuid"))
     
     
     #   Sets Info when ready from Thread
@@ -1434,6 +1539,7 @@ class SourceFileTile(BaseTileItem):
         #   Selected CheckBox
         self.chb_selected = QCheckBox()
         self.chb_selected.toggled.connect(self.setSelected)
+        self.chb_selected.toggled.connect(self.onCheckToggled)
         #   Filename Label
         self.l_fileName = QLabel()
 
@@ -1659,15 +1765,41 @@ class DestFileItem(BaseTileItem):
         self.data = passedData if passedData else data
 
         self.fileType = self.data["fileType"]
+        self.isSequence = bool(self.fileType == "Image Sequence")
 
         logger.debug("Loaded DestFileItem")
 
 
+    #   Checked State Stored with the Browser (the Row may not have a Live Tile)
+    @err_catcher(name=__name__)
+    def isChecked(self):
+        return self.getUid() in self.browser.checkedTileUids["dest"]
+
+
+    @err_catcher(name=__name__)
+    def getModifiedName(self, orig_name):
+        if self.browser.sourceFuncts.chb_ovr_fileNaming.isChecked():
+            return self.browser.applyMods(orig_name)
+        else:
+            return orig_name
+
+
     @err_catcher(name=__name__)
     def registerTile(self, tile: "SourceFileTile"):
         self.tile = tile
         self.data["destTile"] = tile
-        self.data["sourceTile"].data["destTile"] = tile
+
+        sourceTile = self.data.get("sourceTile")
+        if sourceTile:
+            sourceTile.data["destTile"] = tile
+
+
+    #   Detach a Released FileTile
+    @err_catcher(name=__name__)
+    def unregisterTile(self, tile: "DestFileTile"):
+        if self.tile is tile:
+            self.tile = None
+            self.data.pop("destTile", None)
 
 
 
@@ -1693,6 +1825,7 @@ class DestFileTile(BaseTileItem):
 
         self.setupUi()
         self.refreshUi()
+        self.restoreTransferState()
         self.item.registerTile(self)
 
         logger.debug("Loaded DestFileTile")
@@ -1742,6 +1875,7 @@ class DestFileTile(BaseTileItem):
         #   Selected CheckBox
         self.chb_selected = QCheckBox()
         self.chb_selected.toggled.connect(self.setSelected)
+        self.chb_selected.toggled.connect(self.onCheckToggled)
         #   Filename Label
         self.l_fileName = QLabel()
         #   Status Label
@@ -1846,6 +1980,18 @@ class DestFileTile(BaseTileItem):
             logger.warning(f"ERROR:  Failed to Load Destination FileTile UI:\n{e}")
 
 
+    #   Restores the Progress and Status of a Tile Released after its Transfer
+    @err_catcher(name=__name__)
+    def restoreTransferState(self):
+        for progBar, progWidget in (("transfer", self.transferProgBar), ("proxy", self.proxyProgBar)):
+            savedStatus = self.data.get(f"{progBar}_status")
+            if not savedStatus:
+                continue
+
+            progWidget.setValue(self.data.get(f"{progBar}_progress") or 0)
+            self.setTransferStatus(progBar=progBar, status=savedStatus[0], tooltip=savedStatus[1])
+
+
     #   Displays Proxy Progbar if Applicable
     @err_catcher(name=__name__)
     def toggleProxyProgbar(self):
@@ -1904,6 +2050,19 @@ class DestFileTile(BaseTileItem):
         return os.path.normpath(self.browser.destDir)
 
 
+    #   Returns the Backup Destination Directories
+    @err_catcher(name=__name__)
+    def getBackupDestPaths(self):
+        return [os.path.normpath(backupDir) for backupDir in self.browser.backupDestDirs]
+
+
+    #   Returns the Destination Directories with Preallocation Enabled
+    @err_catcher(name=__name__)
+    def getPreallocateDirs(self):
+        destDirs = [self.getDestPath()] + self.getBackupDestPaths()
+        return [destDir for destDir in destDirs if self.browser.isPreallocateEnabled(destDir)]
+
+
     #   Returns the Destination Mainfile Path
     @err_catcher(name=__name__)
     def getDestMainPath(self):
@@ -1970,51 +2129,6 @@ class DestFileTile(BaseTileItem):
             return None
     
 
-    #   Returns an Estimated Proxy Size Based on a Fractional Multiplier
-    @err_catcher(name=__name__)
-    def getMultipliedProxySize(self, frame=None, total=False):
-        try:
-            #   Get Main File Size
-            mainSize = Utils.getFileSize(self.getSource_mainfilePath())
-
-            if not mainSize:
-                return 0
-
-            #   Get Presets and Multiplier from Preset
-            presetName = self.browser.proxySettings.get("proxyPreset", "")
-            pData = self.browser.proxyPresets.getPresetData(presetName)
-            mult = float(pData.get("Multiplier", 0.0))
-
-            #   Get and Apply Proxy Scaling
-            scale_str = self.browser.proxySettings.get("proxyScale", "100%")
-            scale = int(scale_str.strip('%'))
-            scaled_mult = mult * (scale / 100) ** 2
-
-            #   Get Estimated Proxy Size based on Multiplier
-            proxySize = mainSize * scaled_mult
-
-            if total:
-                #   Just Return Full Proxy Size
-                return proxySize
-            
-            else:
-                #   Get Number of Frames
-                total_frames = self.data["source_mainFile_frames"]
-
-                #   Abort if Incorrect Data
-                if total_frames <= 0 or frame is None:
-                    return 0            
-                
-                #   Clamp Frame
-                frame = max(0, min(frame, total_frames))
-                #   Calculate Proxy Size per Frame
-                per_frame = proxySize / total_frames
-
-                return per_frame * frame
-            
-        except Exception as e:
-            logger.warning(f"ERROR:  Failed to Get Multiplied Proxy Size:\n{e}")
-            return 0
         
     
     #   Gets Generated Proxy Size and Updates Presets Multiplier
@@ -2049,6 +2163,9 @@ class DestFileTile(BaseTileItem):
     def setTransferStatus(self, progBar, status, tooltip=None):
         try:
             self.transferState = status
+            #   Kept with the Data to Restore a Released Tile
+            if status != "Idle":
+                self.data[f"{progBar}_status"] = (status, tooltip)
             if progBar == "transfer":
                 progWdget = self.transferProgBar
             elif progBar == "proxy":
@@ -2345,27 +2462,23 @@ class DestFileTile(BaseTileItem):
         self.proxyMode = proxyMode
 
         #   Get Main Paths
-        sourcePath = self.getSource_mainfilePath()
-        destPath = self.getDestMainPath()
-        self.data["dest_mainFile_path"] = destPath
-
-        if self.isSequence:
-            transferList = []
-            for file in self.getSequenceFiles():
-                basename = Utils.getBasename(file)
-                name = self.getModifiedName(basename)
-                destPath = os.path.join(self.getDestPath(), name)
+        self.data["dest_mainFile_path"] = self.getDestMainPath()
 
-                transferList.append({"sourcePath": file,
-                                     "destPath": destPath})
+        sourceFiles, destFiles = self.getMainTransferPaths()
+        transferList = [{"sourcePath": sourcePath, "destPath": destPath}
+                        for sourcePath, destPath in zip(sourceFiles, destFiles)]
 
-        else:
-            transferList = [{"sourcePath": sourcePath,
-                            "destPath": destPath}]
+        #   Backup Destinations are Written from the Same Source Read
+        backupDirs = self.getBackupDestPaths()
+        for backupDir in backupDirs:
+            _, backupFiles = self.getMainTransferPaths(backupDir)
+            for transItem, backupPath in zip(transferList, backupFiles):
+                transItem.setdefault("backupPaths", []).append(backupPath)
 
         #   Create Transfer Dict
         self.transferData = {"proxyEnabled": proxyEnabled,
-                             "proxyAction": None}
+                             "proxyAction": None,
+                             "backupDirs": backupDirs}
 
         ##  IF PROXY IS ENABLED ##
         if proxyEnabled and self.isVideo() and self.isCodecSupported():
@@ -2403,13 +2516,14 @@ class DestFileTile(BaseTileItem):
 
         logger.debug(f"Starting MainFile Transfer: {transferList[0]}")
 
-        #   Call the Transfer Worker Thread for Main File
-        self.main_transfer_worker = FileCopyWorker(self, "transfer", transferList)
+        #   Create the Transfer Job for Main File
+        self.main_transfer_worker = FileCopyWorker(self, "transfer", transferList, hashAlgorithm=self.getInlineHashAlgorithm())
         #   Connect the Progress Signals
+        self.main_transfer_worker.started.connect(self._onTransferStart)
         self.main_transfer_worker.progress.connect(self.update_main_transferProgress)
         self.main_transfer_worker.finished.connect(self.main_transfer_complete)
-        #   Execute Transfer
-        self.main_transfer_worker.start()
+        #   Queue in the Transfer Scheduler
+        self.browser.transferScheduler.submit(self.main_transfer_worker)
 
 
     #   Gets called when Transfer Thread Starts in Queue
@@ -2477,6 +2591,7 @@ class DestFileTile(BaseTileItem):
             self.transferProgBar.setValue(value)
             self.l_amountCopied.setText(Utils.getFileSizeStr(copied_size))
             self.main_copiedSize = copied_size
+            self.data["transfer_progress"] = value
 
 
     #   Updates the UI During the Transfer
@@ -2486,6 +2601,7 @@ class DestFileTile(BaseTileItem):
             self.setTransferStatus(progBar="proxy", status="Transferring Proxy")
 
             self.proxyProgBar.setValue(value)
+            self.data["proxy_progress"] = value
             self.l_amountCopied.setText(Utils.getFileSizeStr(copied_size))
             self.proxy_copiedSize = copied_size
 
@@ -2496,6 +2612,7 @@ class DestFileTile(BaseTileItem):
         if self.transferState != "Cancelled":
             self.setTransferStatus(progBar="proxy", status="Generating Proxy")
             self.proxyProgBar.setValue(value)
+            self.data["proxy_progress"] = value
             self.l_amountCopied.setText(str(frame))
             self.proxy_copiedSize = self.getMultipliedProxySize(frame=frame)
 
@@ -2538,6 +2655,7 @@ class DestFileTile(BaseTileItem):
 
         if success:
             self.transferProgBar.setValue(100)
+            self.data["transfer_progress"] = 100
 
             #   Check if all the Transferred Files Exist in Destination
             if self.checkFilesExist("main"):
@@ -2564,65 +2682,185 @@ class DestFileTile(BaseTileItem):
             self.setTransferStatus(progBar="transfer", status="Error", tooltip=errMsg)
 
 
-    #   Called After Hash Generation for UI Feedback
+    #   Algorithm for Hashing while Copying (None when the Kernel Copies the Data)
     @err_catcher(name=__name__)
-    def generateDestHashs(self):
-        self._pending_tiles = set()
-        self._hash_results = {}
-        dummy_tile = QObject()
+    def getInlineHashAlgorithm(self):
+        if self.useKernelCopy and Utils.hasKernelCopy():
+            return None
+
+        return self.hashAlgorithm
+
+
+    #   Returns the Source and Destination Paths of the Main Transfer in Matching Order
+    #   (destDir Gives the Paths in a Backup Destination)
+    @err_catcher(name=__name__)
+    def getMainTransferPaths(self, destDir=None):
+        primaryDir = self.getDestPath()
+        destDir = destDir or primaryDir
 
         if self.isSequence:
+            sourceFiles = self.getSequenceFiles()
             destFiles = []
-            for file in self.getSequenceFiles():
+            for file in sourceFiles:
                 basename = Utils.getBasename(file)
                 name = self.getModifiedName(basename)
-                destPath = os.path.join(self.getDestPath(), name)
+                destPath = os.path.join(destDir, name)
                 destFiles.append(destPath)
 
-            self.setFileHash(destFiles, self.onDestHashReady, mainTile=dummy_tile)
-
         else:
-            self._pending_tiles.add(dummy_tile)
-            self.setFileHash(self.getDestMainPath(), self.onDestHashReady, mainTile=dummy_tile)
+            sourceFiles = [self.getSource_mainfilePath()]
+            destFiles = [os.path.join(destDir, os.path.relpath(self.getDestMainPath(), primaryDir))]
 
+        return sourceFiles, destFiles
 
+
+    #   Returns True if the Journal Records Every File of the Main Transfer as Complete
     @err_catcher(name=__name__)
-    def setDestHash(self, dest_hash, tile):
-        tile.hashWatchdogTimer.stop()
+    def isTransferJournaled(self, destDir=None):
+        journal = FileCopyWorker.transferJournal
+        #   With Overwrite the Journal only Resumes Partial Files
+        if not (self.resumeTransfers and journal) or self.allowOverwrite:
+            return False
 
-        tile.data["dest_mainFile_hash"] = dest_hash
-        orig_hash = tile.data.get("source_mainFile_hash", None)
+        sourceFiles, destFiles = self.getMainTransferPaths(destDir)
+        return all(journal.isComplete(source, dest) for source, dest in zip(sourceFiles, destFiles))
 
-        #   If Transfer Hash Check is Good
-        if dest_hash == orig_hash:
-            self.seqHashes = True
 
-        #   Transfer Hash is Not Correct
+    #   Returns the Weakest Match Kind if Every File of the Main Transfer Already Matches the Source (Sync Mode)
+    @err_catcher(name=__name__)
+    def isDestInSync(self, destDir=None):
+        algorithm = Utils.getResolvedHashAlgorithm(self.hashAlgorithm)
+        sourceFiles, destFiles = self.getMainTransferPaths(destDir)
+        return FileCopyWorker.getWeakestMatch(FileCopyWorker.isDestInSync(source, dest, algorithm)
+                                              for source, dest in zip(sourceFiles, destFiles))
+
+
+    #   Result of a Main Transfer (Skipped Files are only Verified by a Checksum Match or the Read-back)
+    @err_catcher(name=__name__)
+    def getTransferSuccessMsg(self, readBack=False):
+        skippedFiles = self.main_transfer_worker.skippedFiles
+        skipped = len(skippedFiles)
+        if not skipped:
+            return "Transfer Successful"
+
+        if readBack:
+            unverified = 0
         else:
-            self.seqHashes = False
+            unverified = sum(1 for match in skippedFiles.values() if match != FileCopyWorker.MATCH_CHECKSUM)
 
-        if self.seqHashes:
-            statusMsg = "Transfer Successful"
-            tile.data["mainFile_result"] = statusMsg
+        if skipped == len(self.main_transfer_worker.transferList):
+            return "Already Verified" if not unverified else "Already Transferred (Not Verified)"
 
-            self.setTransferStatus(progBar="transfer", status="Complete")
-            self.setQuantityUI("complete")
+        if not unverified:
+            return f"Transfer Successful ({skipped} Files Already Verified)"
+
+        return f"Transfer Successful ({skipped} Files Skipped, {unverified} Not Verified)"
+
+
+    #   Records the Source Checksums from the Copy and Reads Back the Destination
+    @err_catcher(name=__name__)
+    def generateDestHashs(self):
+        algorithm = Utils.getResolvedHashAlgorithm(self.hashAlgorithm)
+        sourceHashes = self.main_transfer_worker.fileHashes
+        self.data["hashAlgorithm"] = algorithm
+
+        #   Kernel Copy does not Hash Inline, so Read the Source for its Checksums
+        if not sourceHashes:
+            if not self.verifyReadBack:
+                self.data["source_fileHashes"] = {}
+                self.data["source_mainFile_hash"] = "Not Hashed"
+                self.verifyMainTransfer()
+                return
 
-            logger.status(f"Main Transfer complete: {tile.data['dest_mainFile_path']}")
+            sourceFiles, _ = self.getMainTransferPaths()
+            self.setFileHash(sourceFiles, self.onSourceHashReady, mainTile=QObject(), algorithm=algorithm,
+                             fileHashesCallback=self.onSourceFileHashesReady)
+            return
+
+        #   Source Checksums were Computed Inline by the Transfer Worker
+        self.data["source_fileHashes"] = dict(sourceHashes)
 
+        if len(sourceHashes) == 1:
+            self.data["source_mainFile_hash"] = next(iter(sourceHashes.values()))
         else:
-            statusMsg = "ERROR:  Transferred Hash Incorrect"
-            self.addTransferWarning(self.data["displayName"], "Transferred Hash Incorrect")
-            tile.data["mainFile_result"] = statusMsg
+            #   Frames Finish in any Order when Copied in Parallel, so Order them as the Read-back
+            _, destFiles = self.getMainTransferPaths()
+            orderedHashes = [sourceHashes[destPath] for destPath in destFiles if destPath in sourceHashes]
+            self.data["source_mainFile_hash"] = Utils.getMerkleRoot(orderedHashes, algorithm)
 
-            status = "Warning"
-            logger.warning(f"Transferred Hash Incorrect: {tile.getSource_mainfilePath()}")
+        self.verifyMainTransfer()
+
+
+    #   Stores the Per-file Source Checksums Keyed by their Destination Path
+    @err_catcher(name=__name__)
+    def onSourceFileHashesReady(self, fileHashes):
+        sourceFiles, destFiles = self.getMainTransferPaths()
+        self.data["source_fileHashes"] = {destPath: fileHashes[sourcePath][2]
+                                          for sourcePath, destPath in zip(sourceFiles, destFiles)
+                                          if sourcePath in fileHashes}
+
+
+    #   Called After the Source Checksum is Read when the Kernel Copied the Data
+    @err_catcher(name=__name__)
+    def onSourceHashReady(self, source_hash, tile):
+        self.hashWatchdogTimer.stop()
+
+        self.data["source_mainFile_hash"] = source_hash
+        self.verifyMainTransfer()
+
+
+    #   Reads Back the Destination and Compares it to the Source Checksum
+    @err_catcher(name=__name__)
+    def verifyMainTransfer(self):
+        dummy_tile = QObject()
+        algorithm = self.data["hashAlgorithm"]
+
+        #   Each Backup Destination is Verified Separately
+        self.mainVerification = None
+        self.pendingBackupChecks = set()
+        self.data["backup_results"] = {}
+
+        for idx, backupDir in enumerate(self.transferData.get("backupDirs", []), start=1):
+            error = self.main_transfer_worker.failedDests.get(idx)
+
+            if error:
+                self.data["backup_results"][backupDir] = f"ERROR:  Transfer Failed ({error})"
+                self.addTransferWarning(self.data["displayName"], f"Backup Transfer Failed: {backupDir}")
+
+            elif not self.verifyReadBack:
+                self.data["backup_results"][backupDir] = "Not Read Back"
+
+            else:
+                self.pendingBackupChecks.add(backupDir)
+                _, backupFiles = self.getMainTransferPaths(backupDir)
+                self.setFileHash(backupFiles,
+                                 lambda dest_hash, tile, backupDir=backupDir: self.onBackupHashReady(backupDir, dest_hash),
+                                 mainTile=QObject(), algorithm=algorithm, uncached=True)
+
+        #   Skip Reading the Destination Again
+        if not self.verifyReadBack:
+            self.data["dest_mainFile_hash"] = "Not Read Back"
+            statusMsg = self.getTransferSuccessMsg()
+            self.data["mainFile_result"] = statusMsg
 
             hashMsg = (f"Status: {statusMsg}\n\n"
-                       f"Source Hash:   {orig_hash}\n"
-                       f"Transfer Hash: {dest_hash}")
+                       f"Source Hash ({algorithm}):   {self.data['source_mainFile_hash']}\n"
+                       f"Transfer Hash: Not Read Back")
 
-            self.setTransferStatus(progBar="transfer", status=status, tooltip=hashMsg)
+            self.finishMainVerification("Complete", hashMsg)
+            return
+
+        _, destFiles = self.getMainTransferPaths()
+
+        #   Read Back what is on Disk (not the Just-written Pages Still in RAM)
+        self.setFileHash(destFiles, self.onDestHashReady, mainTile=dummy_tile, algorithm=algorithm,
+                         fileHashesCallback=self.onDestFileHashesReady, uncached=True)
+
+
+    #   Stores the Per-file Destination Checksums from the Hash Worker
+    @err_catcher(name=__name__)
+    def onDestFileHashesReady(self, fileHashes):
+        self.data["dest_fileHashes"] = fileHashes
 
 
     #   Called After Hash Generation for UI Feedback
@@ -2635,37 +2873,18 @@ class DestFileTile(BaseTileItem):
 
         #   If Transfer Hash Check is Good
         if dest_hash == orig_hash:
-            statusMsg = "Transfer Successful"
+            statusMsg = self.getTransferSuccessMsg(readBack=True)
             self.data["mainFile_result"] = statusMsg
 
-            self.setQuantityUI("complete")
-
             hashMsg = (f"Status: {statusMsg}\n\n"
                        f"Source Hash:   {orig_hash}\n"
                        f"Transfer Hash: {dest_hash}")
             
-            self.setTransferStatus(progBar="transfer", status="Complete", tooltip=hashMsg)
-
-            #   Proxy Enabled
-            if self.useProxy:
-                self.setTransferStatus(progBar="proxy", status="Queued")
-
-                #   Copy Proxy if Applicable
-                if self.transferData["proxyAction"] == "copy":
-                    self.setQuantityUI("copyProxy")
-                    self.transferProxy()
-
-                #   Generate Proxy if Enabled
-                if self.transferData["proxyAction"] == "generate":
-                    self.setQuantityUI("generate")
-                    self.generateProxy()
-
-            logger.status(f"Main Transfer complete: {self.data['dest_mainFile_path']}")
+            self.finishMainVerification("Complete", hashMsg)
             
         #   Transfer Hash is Not Correct
         else:
             statusMsg = "ERROR:  Transferred Hash Incorrect"
-            self.addTransferWarning(self.data["displayName"], "Transferred Hash Incorrect")
             self.data["mainFile_result"] = statusMsg
 
             status = "Warning"
@@ -2674,23 +2893,119 @@ class DestFileTile(BaseTileItem):
             hashMsg = (f"Status: {statusMsg}\n\n"
                     f"Source Hash:   {orig_hash}\n"
                     f"Transfer Hash: {dest_hash}")
+
+            #   Report Exactly which Frames Differ
+            if self.isSequence:
+                destHashes = {f: r[2] for f, r in self.data.get("dest_fileHashes", {}).items()}
+                mismatched = Utils.getMismatchedFiles(self.data.get("source_fileHashes", {}), destHashes)
+                self.data["dest_mismatchedFiles"] = mismatched
+
+                self.addTransferWarning(self.data["displayName"],
+                                        f"Transferred Hash Incorrect ({len(mismatched)} Frames)")
+                self.clearTransferJournal(mismatched)
+
+                frameNames = [Utils.getBasename(f) for f in mismatched]
+                hashMsg += f"\n\nMismatched Frames ({len(mismatched)}):\n" + "\n".join(frameNames[:20])
+                if len(frameNames) > 20:
+                    hashMsg += f"\n... and {len(frameNames) - 20} more"
+
+            else:
+                self.addTransferWarning(self.data["displayName"], "Transferred Hash Incorrect")
+                self.clearTransferJournal(self.getMainTransferPaths()[1])
             
+            self.finishMainVerification(status, hashMsg)
+
+
+    #   Called After a Backup Destination is Read Back
+    @err_catcher(name=__name__)
+    def onBackupHashReady(self, backupDir, dest_hash):
+        if dest_hash == self.data.get("source_mainFile_hash", None):
+            result = "Transfer Successful"
+        else:
+            result = "ERROR:  Transferred Hash Incorrect"
+            logger.warning(f"Transferred Hash Incorrect: {self.getMainTransferPaths(backupDir)[1][0]}")
+            self.addTransferWarning(self.data["displayName"], f"Backup Hash Incorrect: {backupDir}")
+            self.clearTransferJournal(self.getMainTransferPaths(backupDir)[1])
+
+        self.data["backup_results"][backupDir] = result
+        self.pendingBackupChecks.discard(backupDir)
+
+        self.finishMainVerification()
+
+
+    #   Forgets Destinations that Failed Verification so a Resumed or Synced Transfer Copies them Again
+    @err_catcher(name=__name__)
+    def clearTransferJournal(self, destFiles):
+        journal = FileCopyWorker.transferJournal
+        if journal:
+            for destFile in destFiles:
+                journal.clear(destFile)
+
+
+    #   Sets the Final Status Once the Primary and all Backup Destinations are Verified
+    @err_catcher(name=__name__)
+    def finishMainVerification(self, status=None, hashMsg=None):
+        if status:
+            self.mainVerification = (status, hashMsg)
+
+        if self.pendingBackupChecks or not self.mainVerification:
+            return
+
+        status, hashMsg = self.mainVerification
+
+        #   Per-destination Results
+        backupResults = self.data.get("backup_results", {})
+        if backupResults:
+            hashMsg += "\n\nBackup Destinations:\n" + "\n".join(f"{backupDir}:   {result}"
+                                                            for backupDir, result in backupResults.items())
+
+        if status == "Complete":
+            #   The Primary is Good so the Proxy Still Runs
+            if any(result.startswith("ERROR") for result in backupResults.values()):
+                status = "Warning"
+            self.onMainTransferVerified(hashMsg, status=status)
+
+        else:
             self.setTransferStatus(progBar="transfer", status=status, tooltip=hashMsg)
 
 
+    #   Completes the Main Transfer and Starts the Proxy Transfer
+    @err_catcher(name=__name__)
+    def onMainTransferVerified(self, hashMsg, status="Complete"):
+        self.setQuantityUI("complete")
+        self.setTransferStatus(progBar="transfer", status=status, tooltip=hashMsg)
+
+        #   Proxy Enabled
+        if self.useProxy:
+            self.setTransferStatus(progBar="proxy", status="Queued")
+
+            #   Copy Proxy if Applicable
+            if self.transferData["proxyAction"] == "copy":
+                self.setQuantityUI("copyProxy")
+                self.transferProxy()
+
+            #   Generate Proxy if Enabled
+            if self.transferData["proxyAction"] == "generate":
+                self.setQuantityUI("generate")
+                self.generateProxy()
+
+        logger.status(f"Main Transfer complete: {self.data['dest_mainFile_path']}")
+
+
     #   Generates Proxy with FFmpeg in a Worker Thread
     @err_catcher(name=__name__)
     def transferProxy(self):
         transferList = [{"sourcePath": self.transferData["sourceProxy"],
                         "destPath": self.transferData["destProxy"]}]
 
-        #   Call the Transfer Worker Thread for Main File
-        self.proxy_transfer_worker = FileCopyWorker(self, "proxy", transferList)
+        #   Create the Transfer Job for Proxy File
+        self.proxy_transfer_worker = FileCopyWorker(self, "proxy", transferList, hashAlgorithm=self.getInlineHashAlgorithm())
         #   Connect the Progress Signals
+        self.proxy_transfer_worker.started.connect(self._onTransferStart)
         self.proxy_transfer_worker.progress.connect(self.update_proxyCopyProgress)
         self.proxy_transfer_worker.finished.connect(self.proxyCopy_complete)
-        #   Execute Transfer
-        self.proxy_transfer_worker.start()
+        #   Queued Ahead of Main Files so Started Tiles Complete First
+        self.browser.transferScheduler.submit(self.proxy_transfer_worker, priority=1)
 
 
     #   Generates Proxy with FFmpeg in a Worker Thread
@@ -2718,16 +3033,31 @@ class DestFileTile(BaseTileItem):
     def proxyCopy_complete(self, success):
         if success:
             self.proxyProgBar.setValue(100)
+            self.data["proxy_progress"] = 100
             if self.checkFilesExist("proxy"):
                 proxySize = Utils.getFileSize(self.data["dest_proxyFile_path"])
                 self.data["dest_proxyFile_size"] = Utils.getFileSizeStr(proxySize)
 
-                status = "Generating Hash"
                 tip = "Proxy Transferred"
                 self.setQuantityUI("complete")
                 logger.status(f"Proxy Transfer Complete: {self.data['dest_proxyFile_path']}")
 
-                self.setFileHash(self.data["dest_proxyFile_path"], self.onDestProxyHashReady, mode="proxy", mainTile=self)
+                #   Source Checksum was Computed Inline by the Transfer Worker (Not with Kernel Copy)
+                sourceHashes = self.proxy_transfer_worker.fileHashes
+                self.data["source_proxyFile_hash"] = next(iter(sourceHashes.values()), "Not Hashed")
+
+                if self.verifyReadBack:
+                    status = "Generating Hash"
+                    if sourceHashes:
+                        self.verifyProxyTransfer()
+                    else:
+                        algorithm = Utils.getResolvedHashAlgorithm(self.hashAlgorithm)
+                        self.setFileHash(self.transferData["sourceProxy"], self.onSourceProxyHashReady,
+                                         mode="proxy", mainTile=self, algorithm=algorithm)
+                else:
+                    status = "Complete"
+                    self.data["dest_proxyFile_hash"] = "Not Read Back"
+                    self.data["proxyFile_result"] = "Proxy Transfer Successful"
 
             else:
                 errMsg = "Transferred Proxy Does Not Exist"
@@ -2746,6 +3076,23 @@ class DestFileTile(BaseTileItem):
         self.setTransferStatus(progBar="proxy", status=status, tooltip=tip)
 
 
+    #   Called After the Source Proxy Checksum is Read when the Kernel Copied the Data
+    @err_catcher(name=__name__)
+    def onSourceProxyHashReady(self, source_hash, tile):
+        self.hashWatchdogTimer.stop()
+
+        self.data["source_proxyFile_hash"] = source_hash
+        self.verifyProxyTransfer()
+
+
+    #   Reads Back the Destination Proxy for Comparison to the Source Checksum
+    @err_catcher(name=__name__)
+    def verifyProxyTransfer(self):
+        algorithm = Utils.getResolvedHashAlgorithm(self.hashAlgorithm)
+        self.setFileHash(self.data["dest_proxyFile_path"], self.onDestProxyHashReady,
+                         mode="proxy", mainTile=self, algorithm=algorithm, uncached=True)
+
+
     #   Called After Hash Generation
     @err_catcher(name=__name__)
     def onDestProxyHashReady(self, dest_hash, tile):
@@ -2772,6 +3119,7 @@ class DestFileTile(BaseTileItem):
     @err_catcher(name=__name__)
     def proxyGenerate_complete(self, result):
         self.proxyProgBar.setValue(100)
+        self.data["proxy_progress"] = 100
        
         if result == "success":
             if self.checkFilesExist("proxy"):
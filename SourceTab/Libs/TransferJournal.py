@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import os
+import time
+import sqlite3
+import threading
+import logging
+
+
+logger = logging.getLogger(__name__)
+
+
+PART_EXT = ".part"
+
+
+
+def getPartPath(destPath:str) -> str:
+    '''Returns the In-progress Path that is Renamed to destPath when Complete'''
+    return destPath + PART_EXT
+
+
+
+class TransferJournal:
+    '''
+    SQLite Journal of Per-file Transfer Progress Keyed by Destination Path\n
+    Records the Source Identity (Size and Mtime) with the Last Durable Byte Offset of the
+    .part File, so an Interrupted Transfer can Skip Completed Files and Continue Partial Ones
+    '''
+
+    VERSION = 1
+    DB_NAME = "TransferJournal.db"
+
+    STATE_PARTIAL = "partial"
+    STATE_COMPLETE = "complete"
+
+    #   Entries are Evicted when Older than this or Beyond the Newest MAX_ENTRIES
+    MAX_AGE_DAYS = 90
+    MAX_ENTRIES = 250000
+
+    #   Copies Keep the Source Mtime, which must Match within this Window (FAT / exFAT Store 2 Second Times)
+    MTIME_WINDOW = 2.0
+
+    def __init__(self, journalDir:str):
+        self.journalDir = journalDir
+        self.dbPath = os.path.join(journalDir, self.DB_NAME)
+        self.enabled = True
+
+        #   Sqlite Connections cannot be Shared Between Threads
+        self._local = threading.local()
+
+        try:
+            os.makedirs(self.journalDir, exist_ok=True)
+            self._getConnection()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Open Transfer Journal at {self.dbPath}:\n{e}")
+            self.enabled = False
+            return
+
+        #   Evict Old Entries in the Background so the DB does not Grow without Bound
+        threading.Thread(target=self.prune, daemon=True).start()
+
+
+    def _getConnection(self) -> sqlite3.Connection:
+        '''Returns the Connection for the Current Thread'''
+
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.dbPath, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS transfers ("
+                "destPath TEXT PRIMARY KEY, "
+                "sourcePath TEXT NOT NULL, "
+                "size INTEGER NOT NULL, "
+                "mtime INTEGER NOT NULL, "
+                "version INTEGER NOT NULL, "
+                "offset INTEGER NOT NULL, "
+                "state TEXT NOT NULL, "
+                "updated REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS transfers_updated ON transfers (updated)")
+            conn.commit()
+            self._local.conn = conn
+
+        return conn
+
+
+    @staticmethod
+    def _normPath(filePath:str) -> str:
+        return os.path.normcase(os.path.normpath(filePath))
+
+
+    def _getEntry(self, sourcePath:str, destPath:str, stat:os.stat_result) -> tuple | None:
+        '''Returns (offset, state) if the Entry is for the Same Unchanged Source'''
+
+        row = self._getConnection().execute(
+            "SELECT sourcePath, size, mtime, version, offset, state FROM transfers WHERE destPath = ?",
+            (self._normPath(destPath),)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        if row[:4] != (self._normPath(sourcePath), stat.st_size, stat.st_mtime_ns, self.VERSION):
+            return None
+
+        return row[4], row[5]
+
+
+    def _write(self, sourcePath:str, destPath:str, stat:os.stat_result, offset:int, state:str) -> None:
+        conn = self._getConnection()
+        conn.execute(
+            "INSERT OR REPLACE INTO transfers (destPath, sourcePath, size, mtime, version, offset, state, updated) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (self._normPath(destPath), self._normPath(sourcePath), stat.st_size, stat.st_mtime_ns,
+             self.VERSION, offset, state, time.time())
+        )
+        conn.commit()
+
+
+    def isComplete(self, sourcePath:str, destPath:str, stat:os.stat_result=None) -> bool:
+        '''
+        True if the Unchanged Source was Fully Transferred and the Destination is Still There
+        with the Source Size and Mtime (so a Rewritten Destination is not Skipped)
+        '''
+
+        if not self.enabled:
+            return False
+
+        try:
+            stat = stat or os.stat(sourcePath)
+            entry = self._getEntry(sourcePath, destPath, stat)
+            if entry is None or entry[1] != self.STATE_COMPLETE:
+                return False
+
+            destStat = os.stat(destPath)
+
+            return (destStat.st_size == stat.st_size
+                    and abs(destStat.st_mtime - stat.st_mtime) <= self.MTIME_WINDOW)
+
+        except FileNotFoundError:
+            return False
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Read Transfer Journal for {destPath}:\n{e}")
+            return False
+
+
+    def getResumeOffset(self, sourcePath:str, destPath:str, stat:os.stat_result) -> int:
+        '''Returns the Durable Offset of the Partial .part File to Continue From (0 to Start Over)'''
+
+        if not self.enabled:
+            return 0
+
+        try:
+            entry = self._getEntry(sourcePath, destPath, stat)
+            if entry is None or entry[1] != self.STATE_PARTIAL:
+                return 0
+
+            offset = entry[0]
+            partPath = getPartPath(destPath)
+
+            #   The .part File must Still Hold the Journaled Bytes
+            if not os.path.isfile(partPath) or os.path.getsize(partPath) < offset:
+                return 0
+
+            return offset
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Read Transfer Journal for {destPath}:\n{e}")
+            return 0
+
+
+    def setOffset(self, sourcePath:str, destPath:str, stat:os.stat_result, offset:int) -> None:
+        '''Records the Offset up to which the .part File is Flushed to Disk'''
+
+        if not self.enabled:
+            return
+
+        try:
+            self._write(sourcePath, destPath, stat, offset, self.STATE_PARTIAL)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Write Transfer Journal for {destPath}:\n{e}")
+
+
+    def setComplete(self, sourcePath:str, destPath:str, stat:os.stat_result) -> None:
+        if not self.enabled:
+            return
+
+        try:
+            self._write(sourcePath, destPath, stat, stat.st_size, self.STATE_COMPLETE)
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Write Transfer Journal for {destPath}:\n{e}")
+
+
+    def clear(self, destPath:str) -> None:
+        '''Removes the Entry of a Destination (such as one that Failed Verification)'''
+
+        if not self.enabled:
+            return
+
+        try:
+            conn = self._getConnection()
+            conn.execute("DELETE FROM transfers WHERE destPath = ?", (self._normPath(destPath),))
+            conn.commit()
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Write Transfer Journal for {destPath}:\n{e}")
+
+
+    def prune(self) -> int:
+        '''
+        Removes Entries Older than MAX_AGE_DAYS and all but the Newest MAX_ENTRIES.\n
+        Only Uses the Updated Times, so Files on Offline Drives are not Touched.
+        Returns the Number of Removed Entries
+        '''
+
+        if not self.enabled:
+            return 0
+
+        try:
+            conn = self._getConnection()
+            cutoff = time.time() - self.MAX_AGE_DAYS * 86400
+
+            removed = conn.execute("DELETE FROM transfers WHERE updated < ?", (cutoff,)).rowcount
+            removed += conn.execute(
+                "DELETE FROM transfers WHERE rowid IN "
+                "(SELECT rowid FROM transfers ORDER BY updated DESC LIMIT -1 OFFSET ?)",
+                (self.MAX_ENTRIES,)
+            ).rowcount
+            conn.commit()
+
+            if removed:
+                logger.debug(f"Pruned {removed} Entries from the Transfer Journal")
+
+            return removed
+
+        except Exception as e:
+            logger.warning(f"ERROR:  Failed to Prune Transfer Journal:\n{e}")
+            return 0
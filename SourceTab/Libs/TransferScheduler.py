@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+#
+####################################################
+#
+# PRISM - Pipeline for animation and VFX projects
+#
+# www.prism-pipeline.com
+#
+# contact: contact@prism-pipeline.com
+#
+####################################################
+#
+#
+# Copyright (C) 2016-2023 Richard Frangenberg
+# Copyright (C) 2023 Prism Software GmbH
+#
+# Licensed under GNU LGPL-3.0-or-later
+#
+# This file is part of Prism.
+#
+# Prism is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Prism is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Prism.  If not, see <https://www.gnu.org/licenses/>.
+####################################################
+#
+#                SOURCE TAB PLUGIN
+#
+#                 Joshua Breckeen
+#                    Alta Arts
+#                josh@alta-arts.com
+#
+#   This PlugIn adds an additional Main Tab to the
+#   Prism Standalone Project Browser.
+#
+#   This adds functionality to Ingest Media such as Camera clips,
+#   as well as handling Proxy's and Metadata.
+#
+#
+####################################################
+
+
+
+import heapq
+import itertools
+import threading
+import logging
+from collections import Counter
+
+
+logger = logging.getLogger(__name__)
+
+
+
+###     Transfer Scheduler    ###
+
+class TransferScheduler:
+    '''
+    Runs Transfer Jobs on a Fixed Pool of Worker Threads\n
+    Jobs are Queued by Priority (Higher First) then in Submit Order (FIFO).
+    Paused Jobs Stay Queued, and Resume / Cancel Wake the Workers through wake(),
+    so Thread Count does not Grow with the Job Count.
+    Jobs Keep their Own Condition, so Scheduler Notifies never Reach a Paused or Throttled Job.\n
+    Jobs also Hold a Slot on each Device they Read or Write (job.devices = {Device Key: Device Type}),
+    so a Device Runs at most its Type's Limit of Jobs while Independent Devices Run in Parallel
+    '''
+
+    def __init__(self, maxWorkers:int=6, deviceLimits:dict=None):
+        self.maxWorkers = max(1, maxWorkers)
+
+        #   {Device Type: Max Jobs per Device} (Unlisted Types are only Limited by maxWorkers)
+        self.deviceLimits = deviceLimits or {}
+
+        self._cond = threading.Condition()
+        self._queue = []
+        self._counter = itertools.count()
+        self._threads = []
+        self._running = set()
+        self._deviceJobs = Counter()
+        self._shutdown = False
+
+
+    def submit(self, job, priority:int=0) -> None:
+        '''Queues a Job (Needs run(), cancel(), pause_flag and cancel_flag, and Calls wake() on Resume / Cancel)'''
+
+        with self._cond:
+            job.scheduler = self
+            heapq.heappush(self._queue, (-priority, next(self._counter), job))
+
+            #   Start Workers Lazily up to the Max
+            if len(self._threads) < self.maxWorkers and len(self._threads) < len(self._queue) + len(self._running):
+                thread = threading.Thread(target=self._workerLoop,
+                                          name=f"Transfer-{len(self._threads) + 1}",
+                                          daemon=True)
+                self._threads.append(thread)
+                thread.start()
+
+            self._cond.notify()
+
+
+    def wake(self) -> None:
+        '''Wakes the Idle Workers to Re-check the Queue (such as after a Job is Resumed or Cancelled)'''
+
+        with self._cond:
+            self._cond.notify_all()
+
+
+    def getDeviceLimit(self, deviceType:str) -> int:
+        return max(1, self.deviceLimits.get(deviceType, self.maxWorkers))
+
+
+    def _isRunnable(self, job) -> bool:
+        '''Cancelled Jobs are Returned to Finish, Otherwise the Job must not be Paused and have Free Device Slots'''
+
+        if job.cancel_flag:
+            return True
+        if job.pause_flag:
+            return False
+
+        return all(self._deviceJobs[key] < self.getDeviceLimit(deviceType)
+                   for key, deviceType in getattr(job, "devices", {}).items())
+
+
+    def _takeNextJob(self):
+        '''Removes and Returns the First Runnable Job'''
+
+        head = self._queue[0][2]
+        if self._isRunnable(head):
+            return heapq.heappop(self._queue)[2]
+
+        for entry in sorted(self._queue):
+            job = entry[2]
+            if self._isRunnable(job):
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+                return job
+
+        return None
+
+
+    def _workerLoop(self) -> None:
+        while True:
+            with self._cond:
+                job = None
+                while not self._shutdown:
+                    job = self._takeNextJob() if self._queue else None
+                    if job:
+                        break
+                    self._cond.wait()
+
+                if self._shutdown:
+                    return
+
+                self._running.add(job)
+                self._deviceJobs.update(getattr(job, "devices", {}).keys())
+
+            try:
+                job.run()
+
+            except Exception as e:
+                logger.warning(f"ERROR:  Transfer Job Failed:\n{e}")
+
+            finally:
+                with self._cond:
+                    self._running.discard(job)
+                    self._deviceJobs.subtract(getattr(job, "devices", {}).keys())
+
+                    #   Jobs Waiting on this Job's Devices may Run Now
+                    self._cond.notify_all()
+
+
+    def getQueuedCount(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+
+    def getRunningCount(self) -> int:
+        with self._cond:
+            return len(self._running)
+
+
+    def shutdown(self) -> None:
+        '''Cancels all Jobs and Stops the Workers'''
+
+        with self._cond:
+            jobs = [job for _, _, job in self._queue] + list(self._running)
+
+            self._queue.clear()
+            self._shutdown = True
+            self._cond.notify_all()
+
+        #   Cancelled Outside the Lock so Paused or Throttled Jobs Wake on their Own Condition
+        for job in jobs:
+            job.cancel()
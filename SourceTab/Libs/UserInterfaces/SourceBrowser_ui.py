@@ -163,7 +163,7 @@ class Ui_w_sourceBrowser(object):
 
         self.verticalLayout_8.addWidget(self.gb_sourceHeader)
 
-        self.lw_source = QListWidget(self.w_source)
+        self.lw_source = QListView(self.w_source)
         self.lw_source.setObjectName(u"lw_source")
         self.lw_source.setContextMenuPolicy(Qt.NoContextMenu)
         self.lw_source.setSelectionMode(QAbstractItemView.NoSelection)
@@ -290,7 +290,7 @@ class Ui_w_sourceBrowser(object):
 
         self.verticalLayout_11.addWidget(self.gb_destHeader)
 
-        self.lw_destination = QListWidget(self.w_destination)
+        self.lw_destination = QListView(self.w_destination)
         self.lw_destination.setObjectName(u"lw_destination")
         self.lw_destination.setMaximumSize(QSize(16777215, 16777215))
         self.lw_destination.setContextMenuPolicy(Qt.NoContextMenu)
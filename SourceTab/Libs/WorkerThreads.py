@@ -59,6 +59,9 @@ import psutil
 import signal
 import platform
 import shlex
+import threading
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 
 
 from qtpy.QtCore import *
@@ -80,6 +83,8 @@ sys.path.append(uiPath)
 
 
 import SourceTab_Utils as Utils
+from CopyPipeline import CopyPipeline
+from TransferJournal import getPartPath
 
 logger = logging.getLogger(__name__)
 
@@ -173,8 +178,14 @@ class ThumbnailWorker(QObject, QRunnable):
 ###     Hash Worker Thread    ###
 class FileHashWorker(QObject, QRunnable):
     finished = Signal(str, QObject)
+    fileHashesReady = Signal(dict)
 
-    def __init__(self, filePaths, tile=None):
+    #   Shared HashCache (Set by the SourceBrowser)
+    hashCache = None
+
+    QUICK_HASH = "Quick"
+
+    def __init__(self, filePaths, tile=None, algorithm=None, uncached=False):
         QObject.__init__(self)
         QRunnable.__init__(self)
 
@@ -185,6 +196,27 @@ class FileHashWorker(QObject, QRunnable):
             self.filePaths = filePaths
 
         self.tile = tile
+        #   Full-content Checksum Algorithm (None uses the Quick Hash)
+        self.algorithm = algorithm
+        #   Read from Disk Instead of the Page Cache (Destination Verification)
+        self.uncached = uncached
+
+
+    def getChecksum(self) -> str:
+        '''Full-content Checksum (Sequences use the Merkle Root of the Per-frame Checksums)'''
+
+        fileHashes = Utils.getFileChecksums(self.filePaths,
+                                            self.algorithm,
+                                            hashCache=FileHashWorker.hashCache,
+                                            uncached=self.uncached)
+        self.fileHashesReady.emit(fileHashes)
+
+        checksums = [fileHashes[f][2] for f in self.filePaths]
+
+        if len(checksums) == 1:
+            return checksums[0]
+        else:
+            return Utils.getMerkleRoot(checksums, self.algorithm)
 
 
     @Slot()
@@ -194,13 +226,28 @@ class FileHashWorker(QObject, QRunnable):
         Uses Hash of first chunk, last chunk, and file size
         '''
         try:
+            if self.algorithm:
+                result_hash = self.getChecksum()
+                logger.debug(f"[FileHashWorker] Checksum Generated for {self.filePaths}")
+                self.finished.emit(result_hash, self.tile)
+                return
+
             chunk_size = 8192
             hash_func = hashlib.sha256()
+            hashCache = FileHashWorker.hashCache
 
             #   Single Filepath
             if len(self.filePaths) == 1:
                 filePath = self.filePaths[0]
-                file_size = os.path.getsize(filePath)
+                stat = os.stat(filePath)
+                file_size = stat.st_size
+
+                #   Unchanged Files Only Cost a Stat
+                if hashCache:
+                    cached = hashCache.get(filePath, self.QUICK_HASH, stat=stat)
+                    if cached:
+                        self.finished.emit(cached, self.tile)
+                        return
 
                 #   Get First and Last Chunks
                 with open(filePath, "rb") as f:
@@ -214,6 +261,9 @@ class FileHashWorker(QObject, QRunnable):
                 #   Include Filesize
                 hash_func.update(str(file_size).encode())
 
+                if hashCache:
+                    hashCache.put(filePath, self.QUICK_HASH, hash_func.hexdigest(), stat=stat)
+
             #   List of Paths (Image Seq)
             else:
                 #   Total Filesize
@@ -249,6 +299,9 @@ class FileHashWorker(QObject, QRunnable):
 class FileInfoWorker(QObject, QRunnable):
     finished = Signal(int, float, float, str, dict, int, int)
 
+    #   Shared ProbeCache (Set by the SourceBrowser)
+    probeCache = None
+
     def __init__(self, origin, core, filePath):
         QObject.__init__(self)
         QRunnable.__init__(self)
@@ -259,20 +312,73 @@ class FileInfoWorker(QObject, QRunnable):
 
 
     @staticmethod
-    def probeFile(filePath:str, origin:object, core) -> tuple:
-        '''Extracts Metadata from the File Using FFprobe or OIIO'''
+    def getProbeType(fileType:str) -> str | None:
+        '''Returns the ProbeCache Type for the File Type (None if not Probed)'''
+
+        if fileType == "Videos":
+            return "video"
+        elif fileType == "Audio":
+            return "audio"
+        elif fileType in ("Images", "Image Sequence"):
+            return "image"
+        return None
+
+
+    @staticmethod
+    def getCachedProbe(filePath:str, fileType:str) -> tuple | None:
+        '''Returns the Probe from Memory or the ProbeCache without Opening the File (None on a Miss)'''
+
+        probeType = FileInfoWorker.getProbeType(fileType)
+        if probeType is None:
+            return None
 
-        if origin.fileType in ("Videos", "Audio"):
-            return FileInfoWorker.probeVideo(filePath, origin, core)
-        elif origin.fileType in ("Images", "Image Sequence"):
-            return FileInfoWorker.probeImage(filePath, origin, core)
+        if probeType == "image":
+            result = Utils.mediaProbe.peek(filePath, "probe_image")
         else:
+            inspection = Utils.mediaProbe.peek(filePath, "inspection")
+            result = Utils.getProbeResultFromFFprobe(inspection["ffprobe"], audio=probeType == "audio") if inspection else None
+
+        if result is None and FileInfoWorker.probeCache:
+            result = FileInfoWorker.probeCache.get(filePath, probeType)
+
+        return result
+
+
+    @staticmethod
+    def probeFile(filePath:str, origin:object, core) -> tuple:
+        '''Extracts Metadata from the File Using the ProbeCache, FFprobe or OIIO'''
+
+        probeType = FileInfoWorker.getProbeType(origin.fileType)
+        if probeType is None:
             return 1, 0.0, 0.0, None, {}, 0, 0
 
+        probeFunct = FileInfoWorker.probeImage if probeType == "image" else FileInfoWorker.probeVideo
+
+        def _probe(filePath):
+            probeCache = FileInfoWorker.probeCache
+            if probeCache:
+                cached = probeCache.get(filePath, probeType)
+                if cached is not None:
+                    return cached
+
+            result = probeFunct(filePath, origin, core)
+
+            #   Only Cache Successful Probes so Failures are Retried
+            if probeCache and result[3] is not None:
+                probeCache.put(filePath, probeType, result)
+
+            return result
+
+        #   Images are Coalesced per File, Video and Audio are Derived from the Shared Inspection
+        if probeType == "image":
+            return Utils.mediaProbe.get(filePath, "probe_image", _probe)
+
+        return _probe(filePath)
+
 
     @staticmethod
     def probeVideo(filePath:str, origin:object, core) -> tuple:
-        '''Run FFprobe and Return Metadata.'''
+        '''Returns the Metadata of the Shared PyAV (In-process) or FFprobe Inspection.'''
 
         frames = 1
         fps = 0.0
@@ -289,81 +395,21 @@ class FileInfoWorker(QObject, QRunnable):
 
         fileType = origin.fileType
 
-        if fileType in ("Videos", "Images", "Image Sequence", "Audio"):
-            ffprobePath = Utils.getFFprobePath()
-
-            kwargs = {
-                "stdout": subprocess.PIPE,
-                "stderr": subprocess.PIPE,
-                "text": True,
-            }
-            if sys.platform == "win32":
-                kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW
-
-            #   Stream Type
-            if fileType in ("Videos", "Images", "Image Sequence"):
-                stream_type = "v:0"
-            elif fileType == "Audio":
-                stream_type = "a:0"
-            else:
-                return frames, fps, secs, codec, metadata, width, height
-
-            result = subprocess.run(
-                [
-                    ffprobePath,
-                    "-v", "error",
-                    "-select_streams", stream_type,
-                    "-show_entries",
-                    "stream=nb_frames,r_frame_rate,codec_name,profile,codec_tag_string,codec_long_name,width,height:format=duration",
-                    "-of", "default=noprint_wrappers=1",
-                    filePath
-                ],
-                **kwargs
-            )
-
-            if result.returncode != 0:
-                return frames, fps, secs, codec, metadata, width, height
-
-            #   Parse Output
-            output_lines = result.stdout.strip().splitlines()
-            values = {}
-            for line in output_lines:
-                if '=' in line:
-                    k, v = line.strip().split('=', 1)
-                    values[k] = v
-            metadata = values
-
-            frames_str = values.get("nb_frames", "1")
-            fps_str = values.get("r_frame_rate", "0/1")
-            sec_str = values.get("duration", "0")
-            codec = values.get("codec_name")
-            width_str = values.get("width", "0")
-            height_str = values.get("height", "0")
-
-            try:
-                width = int(width_str)
-                height = int(height_str)
-            except Exception:
-                pass
-
-            if '/' in fps_str:
-                try:
-                    num, denom = map(int, fps_str.split('/'))
-                    fps = num / denom if denom else 0.0
-                except Exception:
-                    fps = 0.0
+        #   Stream Type
+        if fileType in ("Videos", "Images", "Image Sequence"):
+            audio = False
+        elif fileType == "Audio":
+            audio = True
+        else:
+            return frames, fps, secs, codec, metadata, width, height
 
-            try:
-                secs = float(sec_str)
-            except Exception:
-                secs = 0.0
+        #   Derived from the Shared Inspection (also Used by the Metadata Editor and Preview Player)
+        result = Utils.probeMedia(filePath, audio=audio)
 
-            if frames_str == 'N/A' or not frames_str.isdigit():
-                frames = int(round(secs * fps)) if fps > 0 and secs > 0 else 1
-            else:
-                frames = int(frames_str)
+        if result is None:
+            return frames, fps, secs, codec, metadata, width, height
 
-        return frames, fps, secs, codec, metadata, width, height
+        return result
 
 
     @staticmethod
@@ -420,104 +466,795 @@ class FileInfoWorker(QObject, QRunnable):
 
 
 
-###     Transfer Worker Thread     ###
-class FileCopyWorker(QThread):
+###     Directory Scan Worker Thread    ###
+class DirScanWorker(QObject, QRunnable):
+    batchReady = Signal(int, list)
+    finished = Signal(int, int)
+
+    def __init__(self, origin, dirPath, scanId, batchSize=200):
+        QObject.__init__(self)
+        QRunnable.__init__(self)
+
+        self.origin = origin
+        self.core = origin.core
+        self.dirPath = dirPath
+        self.scanId = scanId
+        self.batchSize = batchSize
+
+        #   Copy Format Lists so the Thread does not Touch the UI Objects
+        self.supportedFormats = set(self.core.media.supportedFormats)
+        self.videoFormats = set(self.core.media.videoFormats)
+        self.audioFormats = set(origin.audioFormats)
+
+        self.cancel_flag = False
+
+
+    def cancel(self):
+        self.cancel_flag = True
+
+
+    def getFileType(self, fileName:str) -> str:
+        '''Returns the File Type from the Extension without Touching the Disk'''
+
+        extension = os.path.splitext(fileName)[1].lower()
+
+        if extension in self.videoFormats:
+            return "Videos"
+        elif extension in self.supportedFormats:
+            return "Images"
+        elif extension in self.audioFormats:
+            return "Audio"
+        else:
+            return "Other"
+
+
+    @Slot()
+    def run(self):
+        '''
+        Scans the Directory with os.scandir\n
+        Uses the DirEntry Cached Type and a Single stat() per File,
+        and Emits the Entries in Batches as they are Found
+        '''
+        count = 0
+        batch = []
+
+        try:
+            with os.scandir(self.dirPath) as it:
+                for entry in it:
+                    if self.cancel_flag:
+                        logger.debug(f"[DirScanWorker] Scan Cancelled: {self.dirPath}")
+                        return
+
+                    try:
+                        isDir = entry.is_dir()
+                        if isDir:
+                            fileType = "Folders"
+                            size = 0
+                            mtime = 0.0
+                        else:
+                            fileType = self.getFileType(entry.name)
+                            stat = entry.stat()
+                            size = stat.st_size
+                            mtime = stat.st_mtime
+
+                    except OSError as e:
+                        logger.warning(f"[DirScanWorker] ERROR: Unable to Read {entry.path} - {e}")
+                        continue
+
+                    batch.append({
+                        "entry": entry.name,
+                        "displayName": entry.name,
+                        "fullPath": os.path.join(self.dirPath, entry.name),
+                        "fileType": fileType,
+                        "seqFiles": None,
+                        "seqSize": None,
+                        "size": size,
+                        "mtime": mtime
+                    })
+                    count += 1
+
+                    if len(batch) >= self.batchSize:
+                        self.batchReady.emit(self.scanId, batch)
+                        batch = []
+
+            if batch and not self.cancel_flag:
+                self.batchReady.emit(self.scanId, batch)
+
+        except Exception as e:
+            logger.warning(f"[DirScanWorker] ERROR: Failed to Scan {self.dirPath} - {e}")
+
+        finally:
+            if not self.cancel_flag:
+                self.finished.emit(self.scanId, count)
+
+
+
+###     Transfer Worker (Run by the TransferScheduler)     ###
+class FileCopyWorker(QObject):
+    started = Signal(str, str)
     progress = Signal(int, float)
     finished = Signal(bool)
 
-    def __init__(self, origin, transType, transferList):
+    #   Shared TransferJournal and TransferThrottle (Set by the SourceBrowser)
+    transferJournal = None
+    transferThrottle = None
+
+    #   Bytes Between Durable Journal Checkpoints of a Partial File
+    JOURNAL_INTERVAL = 256 * 1024 * 1024
+
+    #   Sync Modification Times Match within this Window (FAT / exFAT Store 2 Second Times)
+    SYNC_MTIME_WINDOW = 2.0
+
+    #   How a Destination Matched its Source (Weakest First, only a Checksum Match is Verified)
+    MATCH_MTIME = "mtime"
+    MATCH_JOURNAL = "journal"
+    MATCH_CHECKSUM = "checksum"
+    MATCH_ORDER = (MATCH_MTIME, MATCH_JOURNAL, MATCH_CHECKSUM)
+
+    #   Smaller Files (Sequence Frames) are not Worth a Preallocation Call
+    PREALLOCATE_MIN_SIZE = 64 * 1024 * 1024
+
+    #   Ring Size of each Sequence Frame Thread (the Concurrent Frames Keep the Disks Busy)
+    SEQUENCE_BUFFERS = 2
+
+    def __init__(self, origin, transType, transferList, hashAlgorithm=None):
         super().__init__()
         
         self.origin = origin
         self.transType = transType
         self.transferList = transferList
 
+        #   Read Settings Here so the Worker Thread does not Touch the Tile
+        self.buffer_size = 1024 * 1024 * origin.size_copyChunk
+        self.buffer_count = origin.copyBufferCount
+        self.updateInterval = origin.progUpdateInterval
+
+        #   Kernel Copy is Done in Large Ranges Between Pause / Cancel Checks
+        self.useKernelCopy = origin.useKernelCopy and Utils.hasKernelCopy()
+        self.range_size = max(self.buffer_size, 64 * 1024 * 1024)
+
+        #   Source Checksums Computed from the Copied Chunks (destPath: checksum)
+        self.hashAlgorithm = hashAlgorithm
+        self.fileHashes = {}
+
+        #   Destinations that Failed (0 = destPath, 1+ = backupPaths: Error)
+        self.failedDests = {}
+
+        #   Journal for Resuming Interrupted Transfers
+        self.journal = FileCopyWorker.transferJournal if origin.resumeTransfers else None
+
+        #   With Overwrite the Journal only Resumes Partial Files (Completed Files are Copied Again)
+        self.overwrite = origin.allowOverwrite
+
+        #   Sync Mode Skips Files Already at the Destination (destPath: Match Kind)
+        self.syncMode = origin.syncTransfers
+        self.syncAlgorithm = Utils.getResolvedHashAlgorithm(origin.hashAlgorithm)
+        self.skippedFiles = {}
+
+        #   Source and Destination Devices the Scheduler Limits Concurrency On
+        self.devices = self.getDevices()
+
+        #   Destination Mount Points for the Per-destination Bandwidth Cap
+        self.destMounts = self.getDestMounts()
+
+        #   Destination Roots with Preallocation Enabled (destDir: Supported, Cached per Job)
+        self.preallocateRoots = origin.getPreallocateDirs()
+        self.preallocateDirs = {}
+
+        #   Concurrent Frame Copies for Image Sequences
+        self.frameWorkers = max(1, origin.sequenceCopyThreads)
+        self.createdDirs = set()
+
         self.running = True
         self.pause_flag = False
         self.cancel_flag = False
         self.last_emit_time = 0
+        self.total_size_all = 0
+        self.copied_size_all = 0
+        self.progressLock = threading.Lock()
+
+        #   Pause / Cancel / Throttle Waits of this Job (the Scheduler is Woken Separately)
+        self.condition = threading.Condition()
+        self.scheduler = None
+
+
+    def getDevices(self) -> dict:
+        '''Returns {Device Key: Device Type} of Every Source and Destination'''
+
+        filePaths = []
+        for transItem in self.transferList:
+            filePaths.append(transItem["sourcePath"])
+            filePaths.append(transItem["destPath"])
+            filePaths.extend(transItem.get("backupPaths", []))
+
+        try:
+            return Utils.getTransferDevices(filePaths)
+
+        except Exception as e:
+            logger.warning(f"[FileCopyWorker] ERROR: Could not get Transfer Devices: {e}")
+            return {}
+
+
+    def getDestMounts(self) -> list:
+        destDirs = set()
+        for transItem in self.transferList:
+            for destPath in [transItem["destPath"]] + transItem.get("backupPaths", []):
+                destDirs.add(os.path.dirname(destPath))
+
+        try:
+            return list({Utils.getMountPoint(destDir) for destDir in destDirs})
+
+        except Exception as e:
+            logger.warning(f"[FileCopyWorker] ERROR: Could not get Destination Mount Points: {e}")
+            return []
 
 
     def pause(self):
-        self.pause_flag = True
+        with self.condition:
+            self.pause_flag = True
 
 
     def resume(self):
-        self.pause_flag = False
+        with self.condition:
+            self.pause_flag = False
+            self.condition.notify_all()
+
+        #   A Queued Job may be Runnable Now
+        if self.scheduler:
+            self.scheduler.wake()
 
 
     def cancel(self):
-        self.cancel_flag = True
+        with self.condition:
+            self.cancel_flag = True
+            self.condition.notify_all()
 
+        if self.scheduler:
+            self.scheduler.wake()
+
+
+    def waitIfPaused(self) -> bool:
+        '''Blocks while Paused and Returns False if Cancelled'''
+
+        with self.condition:
+            while self.pause_flag and not self.cancel_flag:
+                self.condition.wait()
+
+            return not self.cancel_flag
+
+
+    def waitThrottle(self, timeout:float) -> bool:
+        '''Waits for the Throttle (Woken Early by Cancel) and Returns False if Cancelled'''
+
+        with self.condition:
+            if not self.cancel_flag:
+                self.condition.wait(timeout)
+
+            return not self.cancel_flag
+
+
+    def throttleCopied(self, copiedSize:int):
+        '''Holds Back the Copy to Keep it Under the Bandwidth Caps'''
+
+        if self.transferThrottle:
+            self.transferThrottle.throttle(copiedSize, self.destMounts, self.waitThrottle)
+
+
+    def addProgress(self, copiedSize:int):
+        #   Sequence Frames Report from Several Threads, Emitted in Batches per updateInterval
+        with self.progressLock:
+            self.copied_size_all += copiedSize
+
+            progress_percent = int((self.copied_size_all / self.total_size_all) * 100) if self.total_size_all else 100
+
+            now = time.time()
+            if now - self.last_emit_time < self.updateInterval and progress_percent != 100:
+                return
+
+            self.last_emit_time = now
+            copied_size_all = self.copied_size_all
+
+        self.progress.emit(progress_percent, copied_size_all)
+
+
+    def copyFileKernel(self, fdSrc:int, fdDst:int, onCopied, offset:int=0) -> bool | None:
+        '''
+        Copies the File Inside the Kernel in Large Ranges from offset.\n
+        Returns False if Cancelled, or None if Unsupported Before Anything was Copied
+        '''
+
+        methods = list(Utils.KERNEL_COPY_METHODS)
+        startOffset = offset
+
+        while True:
+            if not self.waitIfPaused():
+                return False
+
+            try:
+                copied = Utils.copyFileRange(fdSrc, fdDst, offset, self.range_size, methods[0])
+
+            except OSError as e:
+                if e.errno not in Utils.KERNEL_COPY_UNSUPPORTED:
+                    raise
+
+                #   Try the Next Method (sendfile), then Fall Back to the Buffered Copy
+                logger.debug(f"[FileCopyWorker] {methods[0]} Unsupported: {e}")
+                methods.pop(0)
+                if not methods:
+                    if offset > startOffset:
+                        raise
+                    return None
+                continue
+
+            if not copied:
+                return True
+
+            offset += copied
+            onCopied(copied)
+
+
+    def copyFile(self, pipeline:CopyPipeline, sourcePath:str, destPath:str, hashObject,
+                 sourceStat:os.stat_result) -> bool:
+        '''
+        Copies to a Single Destination through its .part File, which is Renamed when Complete.\n
+        With the Journal, a Partial File Continues from its Last Durable Offset and is
+        Kept if Cancelled. Returns False if Cancelled
+        '''
+
+        partPath = getPartPath(destPath)
+        self.makeDestDir(destPath)
+
+        offset = self.journal.getResumeOffset(sourcePath, destPath, sourceStat) if self.journal else 0
+        written = checkpoint = offset
+
+        with open(sourcePath, 'rb') as fsrc, open(partPath, 'r+b' if offset else 'wb') as fdst:
+            def _checkpoint():
+                nonlocal checkpoint
+                fdst.flush()
+                os.fsync(fdst.fileno())
+                self.journal.setOffset(sourcePath, destPath, sourceStat, written)
+                checkpoint = written
+
+            def _onCopied(size):
+                nonlocal written
+                self.addProgress(size)
+                self.throttleCopied(size)
+                written += size
+                if self.journal and written - checkpoint >= self.JOURNAL_INTERVAL:
+                    _checkpoint()
+
+            if offset:
+                logger.status(f"[FileCopyWorker] Resuming {destPath} at {Utils.getFileSizeStr(offset)}")
+
+                #   Bytes after the Last Checkpoint may not have Reached the Disk
+                fdst.truncate(offset)
+                fdst.seek(offset)
+
+                #   The Source Checksum Covers the Whole File, so Hash the Already Copied Bytes
+                if hashObject:
+                    self.hashSourceRange(fsrc, offset, hashObject)
+                fsrc.seek(offset)
+
+                self.addProgress(offset)
+
+            #   Reserve the Whole File so it is Laid Out in Few Extents
+            preallocated = (self.shouldPreallocate(destPath, sourceStat.st_size)
+                            and Utils.preallocateFile(fdst.fileno(), sourceStat.st_size))
+            Utils.adviseSequential(fsrc.fileno())
+            Utils.adviseSequential(fdst.fileno())
+
+            try:
+                #   Inline Hashing Needs the Bytes, so Only Unhashed Copies Use the Kernel
+                result = None
+                if self.useKernelCopy and not hashObject:
+                    result = self.copyFileKernel(fsrc.fileno(), fdst.fileno(), _onCopied, offset=offset)
+
+                #   Overlapped Read / Write through the Ring Buffers
+                if result is None:
+                    result = pipeline.copy(fsrc, fdst, self.waitIfPaused, _onCopied,
+                                           hashObject=hashObject, fileSize=sourceStat.st_size - offset)
+
+            finally:
+                #   Drop the Reserved Space Past the Copied Bytes (Cancel, Failure or a Shrunk Source)
+                if preallocated:
+                    fdst.truncate(written)
+
+            if result:
+                fdst.flush()
+                if os.fstat(fdst.fileno()).st_size != sourceStat.st_size:
+                    raise OSError(f"Size Mismatch after Copy: {partPath}")
+
+                #   Make the Data Durable Before the Rename Records it as Complete
+                if self.journal:
+                    os.fsync(fdst.fileno())
+
+            #   Keep the Partial File to Resume
+            elif self.journal:
+                _checkpoint()
+
+        if result:
+            os.replace(partPath, destPath)
+            self.preserveMtime(destPath, sourceStat)
+            if self.journal:
+                self.journal.setComplete(sourcePath, destPath, sourceStat)
+
+        elif not self.journal:
+            self.removePartialFile(partPath)
+
+        return result
+
+
+    def shouldPreallocate(self, destPath:str, fileSize:int) -> bool:
+        '''Large Files on Destinations with Preallocation Enabled, where the Filesystem Supports it'''
+
+        if fileSize < self.PREALLOCATE_MIN_SIZE:
+            return False
+
+        destDir = os.path.dirname(destPath)
+        if destDir not in self.preallocateDirs:
+            enabled = any(Utils.isSubPath(destDir, root) for root in self.preallocateRoots)
+            self.preallocateDirs[destDir] = enabled and Utils.canPreallocate(destDir)
+
+        return self.preallocateDirs[destDir]
+
+
+    def hashSourceRange(self, fsrc, size:int, hashObject) -> None:
+        '''Hashes the First size Bytes of the Source (Already Copied by an Earlier Transfer)'''
+
+        fsrc.seek(0)
+        remaining = size
+
+        while remaining:
+            chunk = fsrc.read(min(self.buffer_size, remaining))
+            if not chunk:
+                raise OSError("Source is Shorter than the Journaled Offset")
+
+            hashObject.update(chunk)
+            remaining -= len(chunk)
+
+
+    def isAlreadyTransferred(self, sourcePath:str, destPaths:list, sourceStat:os.stat_result) -> str | None:
+        '''Returns the Weakest Match Kind if Every Destination Already has the Source, Otherwise None'''
+
+        if (self.journal and not self.overwrite
+                and all(self.journal.isComplete(sourcePath, path, sourceStat) for path in destPaths)):
+            return self.MATCH_JOURNAL
+
+        if not self.syncMode:
+            return None
+
+        return self.getWeakestMatch(self.isDestInSync(sourcePath, path, self.syncAlgorithm, sourceStat)
+                                    for path in destPaths)
+
+
+    @staticmethod
+    def getWeakestMatch(matches) -> str | None:
+        '''Returns the Weakest of the Match Kinds, or None if any is None'''
+
+        weakest = None
+        for match in matches:
+            if not match:
+                return None
+            if weakest is None or FileCopyWorker.MATCH_ORDER.index(match) < FileCopyWorker.MATCH_ORDER.index(weakest):
+                weakest = match
+
+        return weakest
+
+
+    @staticmethod
+    def isDestInSync(sourcePath:str, destPath:str, algorithm:str, sourceStat:os.stat_result=None) -> str | None:
+        '''
+        Sync Comparison (like rsync's Quick Check): the Destination must Match the Source Size, then
+        a Completed Journal Entry or Matching Cached Checksums Decide, Otherwise the Modification Times
+        must be Equal within SYNC_MTIME_WINDOW (Copies Keep the Source Mtime).\n
+        Returns the Match Kind (MATCH_JOURNAL, MATCH_CHECKSUM or MATCH_MTIME), or None if Out of Sync
+        '''
 
-    def run(self):
         try:
-            self.origin.copy_semaphore.acquire()
+            sourceStat = sourceStat or os.stat(sourcePath)
+            destStat = os.stat(destPath)
+        except OSError:
+            return None
 
-            # Step 1: Get total size of all transfers
-            total_size_all = 0
-            for transItem in self.transferList:
-                try:
-                    total_size_all += os.path.getsize(transItem["sourcePath"])
-                except Exception as e:
-                    logger.warning(f"[FileCopyWorker] ERROR: Could not get size for: {transItem['sourcePath']} - {e}")
+        if destStat.st_size != sourceStat.st_size:
+            return None
 
-            copied_size_all = 0
+        journal = FileCopyWorker.transferJournal
+        if journal and journal.isComplete(sourcePath, destPath, sourceStat):
+            return FileCopyWorker.MATCH_JOURNAL
 
-            # Step 2: Loop through all items
-            for transItem in self.transferList:
-                sourcePath = transItem["sourcePath"]
-                destPath = transItem["destPath"]
+        hashCache = FileHashWorker.hashCache
+        if hashCache:
+            sourceDigest = hashCache.get(sourcePath, algorithm, stat=sourceStat)
+            destDigest = hashCache.get(destPath, algorithm, stat=destStat)
+            if sourceDigest and destDigest:
+                return FileCopyWorker.MATCH_CHECKSUM if sourceDigest == destDigest else None
 
-                try:
-                    total_size = os.path.getsize(sourcePath)
-                except Exception as e:
-                    logger.warning(f"[FileCopyWorker] ERROR: Could not get size of {sourcePath}: {e}")
-                    continue
+        if abs(destStat.st_mtime - sourceStat.st_mtime) <= FileCopyWorker.SYNC_MTIME_WINDOW:
+            return FileCopyWorker.MATCH_MTIME
 
-                copied_size_file = 0
-                buffer_size = 1024 * 1024 * self.origin.size_copyChunk
+        return None
 
-                os.makedirs(os.path.dirname(destPath), exist_ok=True)
 
-                #   Signal Main Code for UI
-                self.origin._onTransferStart(self.transType, sourcePath)
+    @staticmethod
+    def preserveMtime(destPath:str, sourceStat:os.stat_result) -> None:
+        '''Gives the Destination the Source Times, so a Later Sync can Compare the Mtimes'''
 
-                with open(sourcePath, 'rb') as fsrc, open(destPath, 'wb') as fdst:
-                    while True:
-                        if self.cancel_flag:
-                            self.finished.emit(False)
-                            fdst.close()
-                            os.remove(destPath)
-                            return
+        try:
+            os.utime(destPath, ns=(sourceStat.st_atime_ns, sourceStat.st_mtime_ns))
+        except OSError as e:
+            logger.debug(f"[FileCopyWorker] Could not Set the Modification Time of {destPath}: {e}")
+
+
+    def getSourceChecksum(self, sourcePath:str, sourceStat:os.stat_result) -> str:
+        '''Checksum of a Source Skipped as Already Transferred (Cached Since its Copy)'''
+
+        algorithm = Utils.getResolvedHashAlgorithm(self.hashAlgorithm)
+        hashCache = FileHashWorker.hashCache
+
+        digest = hashCache.get(sourcePath, algorithm, stat=sourceStat) if hashCache else None
+        if not digest:
+            digest = Utils.getFileChecksum(sourcePath, algorithm)
+            if hashCache:
+                hashCache.put(sourcePath, algorithm, digest, stat=sourceStat)
 
-                        if self.pause_flag:
-                            time.sleep(0.1)
+        return digest
+
+
+    def removePartialFile(self, filePath:str) -> None:
+        try:
+            os.remove(filePath)
+        except OSError as e:
+            logger.warning(f"[FileCopyWorker] ERROR: Could not remove Partial File {filePath}: {e}")
+
+
+    def copyFanOut(self, pipeline:CopyPipeline, fsrc, destPaths:list, hashObject, sourceStat:os.stat_result) -> bool:
+        '''
+        Copies to the Primary and Backup Destinations from a Single Read of the Source.\n
+        Failed Destinations are Recorded and Skipped for the Remaining Files.
+        Returns False if Cancelled
+        '''
+
+        fdsts = {}
+        try:
+            with ExitStack() as stack:
+                preallocated = []
+                for idx, destPath in enumerate(destPaths):
+                    if idx in self.failedDests:
+                        continue
+
+                    try:
+                        self.makeDestDir(destPath)
+                        fdsts[idx] = stack.enter_context(open(getPartPath(destPath), 'wb'))
+
+                    except OSError as e:
+                        logger.warning(f"[FileCopyWorker] ERROR: Could not open Destination {destPath}: {e}")
+                        self.failedDests[idx] = str(e)
+                        continue
+
+                    if (self.shouldPreallocate(destPath, sourceStat.st_size)
+                            and Utils.preallocateFile(fdsts[idx].fileno(), sourceStat.st_size)):
+                        preallocated.append(fdsts[idx])
+                    Utils.adviseSequential(fdsts[idx].fileno())
+
+                if not fdsts:
+                    return True
+
+                Utils.adviseSequential(fsrc.fileno())
+
+                errors = pipeline.copyFanOut(fsrc, list(fdsts.values()), self.waitIfPaused, self.addProgress,
+                                             isPaused=lambda: self.pause_flag, hashObject=hashObject,
+                                             throttle=self.throttleCopied)
+
+                #   Drop the Reserved Space Past each Destination's Written Bytes
+                for fdst in preallocated:
+                    try:
+                        fdst.truncate(fdst.tell())
+                    except OSError as e:
+                        logger.debug(f"[FileCopyWorker] Could not Trim Preallocated File {fdst.name}: {e}")
+
+                #   Check and Sync each Written Destination as copyFile does
+                if errors is not None:
+                    for num, fdst in enumerate(fdsts.values()):
+                        if errors[num]:
                             continue
 
-                        chunk = fsrc.read(buffer_size)
-                        if not chunk:
-                            break
+                        try:
+                            fdst.flush()
+                            if os.fstat(fdst.fileno()).st_size != sourceStat.st_size:
+                                raise OSError(f"Size Mismatch after Copy: {fdst.name}")
+
+                            #   Make the Data Durable Before the Rename Records it as Complete
+                            if self.journal:
+                                os.fsync(fdst.fileno())
+
+                        except OSError as e:
+                            errors[num] = e
+
+        #   Fan-out does not Resume, so Leave no Partial Files Behind
+        except Exception:
+            for idx in fdsts:
+                self.removePartialFile(getPartPath(destPaths[idx]))
+            raise
+
+        #   Cancelled: Remove the Partial Files (Fan-out Resumes per File, not per Offset)
+        if errors is None:
+            for idx in fdsts:
+                self.removePartialFile(getPartPath(destPaths[idx]))
+            return False
+
+        for idx, error in zip(fdsts, errors):
+            if error:
+                logger.warning(f"[FileCopyWorker] ERROR: Could not copy to {destPaths[idx]}: {error}")
+                self.failedDests[idx] = str(error)
+                self.removePartialFile(getPartPath(destPaths[idx]))
+                continue
+
+            os.replace(getPartPath(destPaths[idx]), destPaths[idx])
+            self.preserveMtime(destPaths[idx], sourceStat)
+            if self.journal:
+                self.journal.setComplete(fsrc.name, destPaths[idx], sourceStat)
+
+        return True
+
+
+    def makeDestDir(self, destPath:str) -> None:
+        '''Creates the Destination Directory Once per Job'''
+
+        destDir = os.path.dirname(destPath)
+        if destDir not in self.createdDirs:
+            os.makedirs(destDir, exist_ok=True)
+            self.createdDirs.add(destDir)
+
+
+    def getSourceStats(self, maxWorkers:int=1) -> dict:
+        '''Stats every Source Once (sourcePath: stat, or None if Unreadable)'''
+
+        def _stat(sourcePath):
+            try:
+                return os.stat(sourcePath)
+            except Exception as e:
+                logger.warning(f"[FileCopyWorker] ERROR: Could not get size for: {sourcePath} - {e}")
+                return None
+
+        sourcePaths = [transItem["sourcePath"] for transItem in self.transferList]
+
+        if maxWorkers > 1:
+            with ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+                return dict(zip(sourcePaths, executor.map(_stat, sourcePaths)))
+
+        return {sourcePath: _stat(sourcePath) for sourcePath in sourcePaths}
+
+
+    def copyItem(self, pipeline:CopyPipeline, transItem:dict, sourceStat:os.stat_result) -> bool:
+        '''Copies one Transfer Item to its Destinations (Returns False if Cancelled or Every Destination Failed)'''
+
+        sourcePath = transItem["sourcePath"]
+        destPath = transItem["destPath"]
+        backupPaths = transItem.get("backupPaths", [])
+
+        hashObject = Utils.getHashObject(self.hashAlgorithm) if self.hashAlgorithm else None
+
+        #   Resumed or Synced Transfer: Skip Files Already at Every Destination
+        match = self.isAlreadyTransferred(sourcePath, [destPath] + backupPaths, sourceStat)
+        if match:
+            logger.debug(f"[FileCopyWorker] Already Transferred ({match} Match): {destPath}")
+            self.skippedFiles[destPath] = match
+            if hashObject:
+                self.fileHashes[destPath] = self.getSourceChecksum(sourcePath, sourceStat)
+            self.addProgress(sourceStat.st_size)
+            return True
+
+        #   Multi-destination: Read the Source Once for Every Destination
+        if backupPaths:
+            with open(sourcePath, 'rb') as fsrc:
+                result = self.copyFanOut(pipeline, fsrc, [destPath] + backupPaths, hashObject, sourceStat)
+
+            #   Cancelled or Every Destination Failed
+            if not result or len(self.failedDests) > len(backupPaths):
+                return False
 
-                        fdst.write(chunk)
-                        copied_size_file += len(chunk)
-                        copied_size_all += len(chunk)
+        elif not self.copyFile(pipeline, sourcePath, destPath, hashObject, sourceStat):
+            return False
 
-                        progress_percent = int((copied_size_all / total_size_all) * 100)
+        if hashObject:
+            self.fileHashes[destPath] = hashObject.hexdigest()
 
-                        now = time.time()
-                        if now - self.last_emit_time >= self.origin.progUpdateInterval or progress_percent == 100:
-                            self.progress.emit(progress_percent, copied_size_all)
-                            self.last_emit_time = now
+            #   Cache the Source Checksum so Re-verifying the Source does not Read it Again
+            hashCache = FileHashWorker.hashCache
+            if hashCache:
+                algorithm = Utils.getResolvedHashAlgorithm(self.hashAlgorithm)
+                hashCache.put(sourcePath, algorithm, self.fileHashes[destPath], stat=sourceStat)
+
+        return True
+
+
+    def copySequence(self, sourceStats:dict) -> bool:
+        '''
+        Copies the Frames of a Sequence Concurrently on a Bounded Pool.\n
+        Each Thread has its Own Pipeline with a Ring of SEQUENCE_BUFFERS, which is only Allocated
+        Past the First Buffer when a Frame Larger than a Buffer (or a Fan-out) Needs it, so Large
+        Frames Copy in Parallel while the Buffer Memory Stays Small.
+        Returns False if Cancelled or a Frame Failed
+        '''
+
+        local = threading.local()
+        stop = threading.Event()
+        pipelines = []
+        bufferCount = min(self.buffer_count, self.SEQUENCE_BUFFERS)
+
+        def _copyFrame(transItem):
+            if stop.is_set():
+                return
+
+            pipeline = getattr(local, "pipeline", None)
+            if pipeline is None:
+                pipeline = local.pipeline = CopyPipeline(bufferCount, self.buffer_size)
+                pipelines.append(pipeline)
+
+            try:
+                if not self.copyItem(pipeline, transItem, sourceStats[transItem["sourcePath"]]):
+                    stop.set()
+
+            except Exception as e:
+                logger.warning(f"[FileCopyWorker] ERROR: Could not copy {transItem['sourcePath']}: {e}")
+                stop.set()
+
+        with ThreadPoolExecutor(max_workers=self.frameWorkers, thread_name_prefix="SequenceCopy") as executor:
+            for transItem in self.transferList:
+                if sourceStats[transItem["sourcePath"]] is not None:
+                    executor.submit(_copyFrame, transItem)
+
+        #   Stop the Reader Threads of the Pipelines
+        for pipeline in pipelines:
+            pipeline.close()
+
+        return not stop.is_set()
+
+
+    def run(self):
+        try:
+            #   Cancelled while Queued
+            if self.cancel_flag:
+                self.finished.emit(False)
+                return
+
+            #   Sequences Copy Frames in Parallel, Except from / to a Spinning Disk
+            frameWorkers = self.frameWorkers if len(self.transferList) > 1 and "hdd" not in self.devices.values() else 1
+
+            # Step 1: Get total size of all transfers
+            sourceStats = self.getSourceStats(frameWorkers)
+            self.total_size_all = sum(stat.st_size for stat in sourceStats.values() if stat)
+
+            #   Signal Main Code for UI
+            self.started.emit(self.transType, self.transferList[0]["sourcePath"])
+
+            # Step 2: Copy the Sequence Frames Concurrently, or Loop through all items
+            if frameWorkers > 1:
+                if not self.copySequence(sourceStats):
+                    self.finished.emit(False)
+                    return
+
+            else:
+                #   Ring Buffers are Allocated when the Job Runs (not while Queued)
+                with CopyPipeline(self.buffer_count, self.buffer_size) as pipeline:
+                    for transItem in self.transferList:
+                        sourceStat = sourceStats[transItem["sourcePath"]]
+                        if sourceStat is None:
+                            continue
+
+                        if not self.copyItem(pipeline, transItem, sourceStat):
+                            self.finished.emit(False)
+                            return
 
-            self.finished.emit(True)
+            #   A Failed Primary Destination Fails the Transfer (Backups are Reported by the Tile)
+            self.finished.emit(0 not in self.failedDests)
 
         except Exception as e:
             logger.warning(f"[FileCopyWorker] ERROR: Could not copy file: {e}")
             self.finished.emit(False)
 
         finally:
-            self.origin.copy_semaphore.release()
             self.running = False
 
 
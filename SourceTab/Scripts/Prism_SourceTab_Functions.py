@@ -249,6 +249,61 @@ class Prism_SourceTab_Functions(object):
         projectSettings.lo_copyThreads.addWidget(projectSettings.sb_copyThreads)
         projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_copyThreads)
 
+        #   Parallel Transfers per Hard Disk (HDD)
+        projectSettings.lo_deviceThreadsHDD = QHBoxLayout()
+        projectSettings.lo_deviceThreadsHDD.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_deviceThreadsHDD = QLabel("Parallel Transfers per Hard Disk (HDD)", projectSettings.w_config)
+        projectSettings.sb_deviceThreadsHDD = QSpinBox(projectSettings.w_config)
+        projectSettings.sb_deviceThreadsHDD.setMinimum(1)
+        projectSettings.lo_deviceThreadsHDD.addWidget(projectSettings.l_deviceThreadsHDD)
+        projectSettings.lo_deviceThreadsHDD.addStretch()
+        projectSettings.lo_deviceThreadsHDD.addWidget(projectSettings.sb_deviceThreadsHDD)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_deviceThreadsHDD)
+
+        #   Parallel Transfers per SATA / USB SSD
+        projectSettings.lo_deviceThreadsSSD = QHBoxLayout()
+        projectSettings.lo_deviceThreadsSSD.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_deviceThreadsSSD = QLabel("Parallel Transfers per SATA / USB SSD", projectSettings.w_config)
+        projectSettings.sb_deviceThreadsSSD = QSpinBox(projectSettings.w_config)
+        projectSettings.sb_deviceThreadsSSD.setMinimum(1)
+        projectSettings.lo_deviceThreadsSSD.addWidget(projectSettings.l_deviceThreadsSSD)
+        projectSettings.lo_deviceThreadsSSD.addStretch()
+        projectSettings.lo_deviceThreadsSSD.addWidget(projectSettings.sb_deviceThreadsSSD)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_deviceThreadsSSD)
+
+        #   Parallel Transfers per NVMe Drive
+        projectSettings.lo_deviceThreadsNVMe = QHBoxLayout()
+        projectSettings.lo_deviceThreadsNVMe.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_deviceThreadsNVMe = QLabel("Parallel Transfers per NVMe Drive", projectSettings.w_config)
+        projectSettings.sb_deviceThreadsNVMe = QSpinBox(projectSettings.w_config)
+        projectSettings.sb_deviceThreadsNVMe.setMinimum(1)
+        projectSettings.lo_deviceThreadsNVMe.addWidget(projectSettings.l_deviceThreadsNVMe)
+        projectSettings.lo_deviceThreadsNVMe.addStretch()
+        projectSettings.lo_deviceThreadsNVMe.addWidget(projectSettings.sb_deviceThreadsNVMe)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_deviceThreadsNVMe)
+
+        #   Parallel Transfers per Network Share
+        projectSettings.lo_deviceThreadsNetwork = QHBoxLayout()
+        projectSettings.lo_deviceThreadsNetwork.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_deviceThreadsNetwork = QLabel("Parallel Transfers per Network Share", projectSettings.w_config)
+        projectSettings.sb_deviceThreadsNetwork = QSpinBox(projectSettings.w_config)
+        projectSettings.sb_deviceThreadsNetwork.setMinimum(1)
+        projectSettings.lo_deviceThreadsNetwork.addWidget(projectSettings.l_deviceThreadsNetwork)
+        projectSettings.lo_deviceThreadsNetwork.addStretch()
+        projectSettings.lo_deviceThreadsNetwork.addWidget(projectSettings.sb_deviceThreadsNetwork)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_deviceThreadsNetwork)
+
+        #   Parallel Frame Copies
+        projectSettings.lo_sequenceThreads = QHBoxLayout()
+        projectSettings.lo_sequenceThreads.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_sequenceThreads = QLabel("Parallel Frame Copies per Image Sequence", projectSettings.w_config)
+        projectSettings.sb_sequenceThreads = QSpinBox(projectSettings.w_config)
+        projectSettings.sb_sequenceThreads.setRange(1, 64)
+        projectSettings.lo_sequenceThreads.addWidget(projectSettings.l_sequenceThreads)
+        projectSettings.lo_sequenceThreads.addStretch()
+        projectSettings.lo_sequenceThreads.addWidget(projectSettings.sb_sequenceThreads)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_sequenceThreads)
+
         #   Transfer Chunk Size
         projectSettings.lo_copyChunks = QHBoxLayout()
         projectSettings.lo_copyChunks.setContentsMargins(50, 0, 20, 0)
@@ -260,6 +315,50 @@ class Prism_SourceTab_Functions(object):
         projectSettings.lo_copyChunks.addWidget(projectSettings.sb_copyChunks)
         projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_copyChunks)
 
+        #   Transfer Buffer Count
+        projectSettings.lo_copyBuffers = QHBoxLayout()
+        projectSettings.lo_copyBuffers.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_copyBuffers = QLabel("Transfer Buffer Count", projectSettings.w_config)
+        projectSettings.sb_copyBuffers = QSpinBox(projectSettings.w_config)
+        projectSettings.sb_copyBuffers.setRange(2, 32)
+        projectSettings.lo_copyBuffers.addWidget(projectSettings.l_copyBuffers)
+        projectSettings.lo_copyBuffers.addStretch()
+        projectSettings.lo_copyBuffers.addWidget(projectSettings.sb_copyBuffers)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_copyBuffers)
+
+        #   Kernel Copy
+        projectSettings.lo_kernelCopy = QHBoxLayout()
+        projectSettings.lo_kernelCopy.setContentsMargins(50, 0, 20, 0)
+        projectSettings.chb_kernelCopy = QCheckBox("Use Kernel Copy (Linux)", projectSettings.w_config)
+        projectSettings.lo_kernelCopy.addWidget(projectSettings.chb_kernelCopy)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_kernelCopy)
+
+        #   Resume Transfers
+        projectSettings.lo_resumeTransfers = QHBoxLayout()
+        projectSettings.lo_resumeTransfers.setContentsMargins(50, 0, 20, 0)
+        projectSettings.chb_resumeTransfers = QCheckBox("Resume Interrupted Transfers", projectSettings.w_config)
+        projectSettings.lo_resumeTransfers.addWidget(projectSettings.chb_resumeTransfers)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_resumeTransfers)
+
+        #   Preallocate Destination
+        projectSettings.lo_preallocateDest = QHBoxLayout()
+        projectSettings.lo_preallocateDest.setContentsMargins(50, 0, 20, 0)
+        projectSettings.chb_preallocateDest = QCheckBox("Preallocate Destination Files (Linux)", projectSettings.w_config)
+        projectSettings.lo_preallocateDest.addWidget(projectSettings.chb_preallocateDest)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_preallocateDest)
+
+        #   Transfer Limit Hours
+        projectSettings.lo_throttleHours = QHBoxLayout()
+        projectSettings.lo_throttleHours.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_throttleHours = QLabel("Transfer Limit Hours", projectSettings.w_config)
+        projectSettings.le_throttleHours = QLineEdit(projectSettings.w_config)
+        projectSettings.le_throttleHours.setPlaceholderText("Always  (or HH:MM-HH:MM)")
+        projectSettings.le_throttleHours.setFixedWidth(180)
+        projectSettings.lo_throttleHours.addWidget(projectSettings.l_throttleHours)
+        projectSettings.lo_throttleHours.addStretch()
+        projectSettings.lo_throttleHours.addWidget(projectSettings.le_throttleHours)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_throttleHours)
+
         #   Maximum Proxy Generation Threads
         projectSettings.lo_proxyThreads = QHBoxLayout()
         projectSettings.lo_proxyThreads.setContentsMargins(50, 0, 20, 0)
@@ -271,6 +370,26 @@ class Prism_SourceTab_Functions(object):
         projectSettings.lo_proxyThreads.addWidget(projectSettings.sb_proxyThreads)
         projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_proxyThreads)
 
+        projectSettings.lo_sourceTabOptions.addWidget(separatorLine("Transfer Verification"))
+
+        #   Checksum Algorithm
+        projectSettings.lo_hashAlgorithm = QHBoxLayout()
+        projectSettings.lo_hashAlgorithm.setContentsMargins(50, 0, 20, 0)
+        projectSettings.l_hashAlgorithm = QLabel("Transfer Checksum Algorithm", projectSettings.w_config)
+        projectSettings.cb_hashAlgorithm = QComboBox(projectSettings.w_config)
+        projectSettings.cb_hashAlgorithm.addItems(Utils.HASH_ALGORITHMS)
+        projectSettings.lo_hashAlgorithm.addWidget(projectSettings.l_hashAlgorithm)
+        projectSettings.lo_hashAlgorithm.addStretch()
+        projectSettings.lo_hashAlgorithm.addWidget(projectSettings.cb_hashAlgorithm)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_hashAlgorithm)
+
+        #   Destination Read-back
+        projectSettings.lo_verifyReadBack = QHBoxLayout()
+        projectSettings.lo_verifyReadBack.setContentsMargins(50, 0, 20, 0)
+        projectSettings.chb_verifyReadBack = QCheckBox("Verify Transfers by Reading Back the Destination", projectSettings.w_config)
+        projectSettings.lo_verifyReadBack.addWidget(projectSettings.chb_verifyReadBack)
+        projectSettings.lo_sourceTabOptions.addLayout(projectSettings.lo_verifyReadBack)
+
         projectSettings.lo_sourceTabOptions.addWidget(separatorLine("Progress Bar"))
 
         #   Progress Bars Update Rate
@@ -376,12 +495,105 @@ class Prism_SourceTab_Functions(object):
         projectSettings.l_copyThreads.setToolTip(tip)
         projectSettings.sb_copyThreads.setToolTip(tip)
 
+        tip = ("Maximum Transfers that Read or Write the same Hard Disk (HDD) at once.\n"
+               "Transfers on separate Devices run in parallel (up to the Maximum\n"
+               "Parallel Transfer Processes), while a single Device is not made\n"
+               "to switch between too many Files.\n\n"
+               "Devices that cannot be identified (Windows / Mac local drives)\n"
+               "are only limited by the Maximum Parallel Transfer Processes.\n\n"
+               "    (default = 1)")
+        projectSettings.l_deviceThreadsHDD.setToolTip(tip)
+        projectSettings.sb_deviceThreadsHDD.setToolTip(tip)
+
+        tip = ("Maximum Transfers that Read or Write the same SATA / USB SSD at once.\n"
+               "Transfers on separate Devices run in parallel (up to the Maximum\n"
+               "Parallel Transfer Processes), while a single Device is not made\n"
+               "to switch between too many Files.\n\n"
+               "Devices that cannot be identified (Windows / Mac local drives)\n"
+               "are only limited by the Maximum Parallel Transfer Processes.\n\n"
+               "    (default = 4)")
+        projectSettings.l_deviceThreadsSSD.setToolTip(tip)
+        projectSettings.sb_deviceThreadsSSD.setToolTip(tip)
+
+        tip = ("Maximum Transfers that Read or Write the same NVMe Drive at once.\n"
+               "Transfers on separate Devices run in parallel (up to the Maximum\n"
+               "Parallel Transfer Processes), while a single Device is not made\n"
+               "to switch between too many Files.\n\n"
+               "Devices that cannot be identified (Windows / Mac local drives)\n"
+               "are only limited by the Maximum Parallel Transfer Processes.\n\n"
+               "    (default = 6)")
+        projectSettings.l_deviceThreadsNVMe.setToolTip(tip)
+        projectSettings.sb_deviceThreadsNVMe.setToolTip(tip)
+
+        tip = ("Maximum Transfers that Read or Write the same Network Share at once.\n"
+               "Transfers on separate Devices run in parallel (up to the Maximum\n"
+               "Parallel Transfer Processes), while a single Device is not made\n"
+               "to switch between too many Files.\n\n"
+               "Devices that cannot be identified (Windows / Mac local drives)\n"
+               "are only limited by the Maximum Parallel Transfer Processes.\n\n"
+               "    (default = 4)")
+        projectSettings.l_deviceThreadsNetwork.setToolTip(tip)
+        projectSettings.sb_deviceThreadsNetwork.setToolTip(tip)
+
+        tip = ("Number of Frames of an Image Sequence copied at the same time.\n"
+               "Many small Frames (DPX / EXR) spend most of their time opening and\n"
+               "closing Files, especially on a Network Share, so copying several at\n"
+               "once keeps the Transfer moving.\n\n"
+               "Sequences read from or written to a Hard Disk (HDD) are copied\n"
+               "one Frame at a time.\n\n"
+               "    (default = 8)")
+        projectSettings.l_sequenceThreads.setToolTip(tip)
+        projectSettings.sb_sequenceThreads.setToolTip(tip)
+
         tip = ("Size of each Packet used in the Transfer.\n"
                "The system's optimum setting will depend on processor/ram/disk/network speeds.\n\n"
                "    (default = 2)")
         projectSettings.l_copyChunks.setToolTip(tip)
         projectSettings.sb_copyChunks.setToolTip(tip)
 
+        tip = ("Number of Chunk-sized Buffers in each Transfer's Read / Write Ring.\n"
+               "The Source is read into free Buffers while the filled ones are\n"
+               "written, so the card and the destination are busy at the same time.\n\n"
+               "Memory used per Transfer = Buffer Count x Chunk Size.\n\n"
+               "    (default = 4)")
+        projectSettings.l_copyBuffers.setToolTip(tip)
+        projectSettings.sb_copyBuffers.setToolTip(tip)
+
+        tip = ("Copies the File data inside the Kernel (copy_file_range / sendfile)\n"
+               "instead of reading and writing it through Python.\n"
+               "Same-filesystem and network copies may be offloaded entirely.\n\n"
+               "The Source Checksum can then not be computed while copying,\n"
+               "so the Source is read again for Verification (unchanged Source\n"
+               "Files use the Checksum Cache).\n\n"
+               "Has no effect on Windows / Mac.\n\n"
+               "    (default = disabled)")
+        projectSettings.chb_kernelCopy.setToolTip(tip)
+
+        tip = ("Files are written to a temporary '.part' File and renamed when complete,\n"
+               "and the progress of each File is recorded in a Journal.\n\n"
+               "Starting a cancelled or interrupted Transfer again skips the Files that\n"
+               "were already transferred and continues partial Files from their last\n"
+               "saved position (Files with Backup Destinations restart).\n\n"
+               "A changed Source File always restarts.\n\n"
+               "    (default = enabled)")
+        projectSettings.chb_resumeTransfers.setToolTip(tip)
+
+        tip = ("Reserves the full size of each large File on the Destination before copying,\n"
+               "so it is written in few contiguous Extents instead of many fragments\n"
+               "(mostly when several Transfers write to the same Drive at once).\n\n"
+               "Only used on local Linux Filesystems that support it (ext4, XFS, Btrfs, ...).\n"
+               "Can be turned off for each Destination in the Destination right-click Menu.\n\n"
+               "    (default = enabled)")
+        projectSettings.chb_preallocateDest.setToolTip(tip)
+
+        tip = ("Time of Day the Transfer Speed Limits (set in the Functions Panel) apply,\n"
+               "such as working hours on shared Storage:   09:00-18:00\n\n"
+               "Outside these Hours Transfers run at full speed.\n"
+               "Hours past midnight wrap around (22:00-06:00).\n\n"
+               "    (default = empty: always)")
+        projectSettings.l_throttleHours.setToolTip(tip)
+        projectSettings.le_throttleHours.setToolTip(tip)
+
         tip = ("Maximum Separate Processes for Proxy Generation.\n"
                "This plugin uses ffmpeg for Proxy Generation and ffmpeg is multi-threaded by default.\n"
                "This means each process should be using all available processor cores,\n"
@@ -390,6 +602,24 @@ class Prism_SourceTab_Functions(object):
         projectSettings.l_proxyThreads.setToolTip(tip)
         projectSettings.sb_proxyThreads.setToolTip(tip)
 
+        tip = ("Algorithm used for the full-content Transfer Checksums.\n"
+               "The Source Checksum is computed from the data as it is copied.\n\n"
+               "   xxHash64:  fastest (only listed if xxhash is installed)\n"
+               "   BLAKE2b:   fast cryptographic hash\n"
+               "   MD5:       widely used by other tools\n"
+               "   SHA-256:   slowest\n\n"
+               "    (default = BLAKE2b)")
+        projectSettings.l_hashAlgorithm.setToolTip(tip)
+        projectSettings.cb_hashAlgorithm.setToolTip(tip)
+
+        tip = ("Re-reads each Transferred File from the Destination and compares\n"
+               "its Checksum to the Source Checksum (end-to-end verification).\n\n"
+               "On Linux the Destination is flushed and read from disk, bypassing the OS cache.\n\n"
+               "If disabled, the Source Checksum is still recorded but the\n"
+               "Destination is not read again.\n\n"
+               "    (default = enabled)")
+        projectSettings.chb_verifyReadBack.setToolTip(tip)
+
         tip = ("Time in seconds for each UI progress update.\n"
                "Too low a rate (high frequency) may slow the UI.\n\n"
                "    (default = 1.0)")
@@ -477,12 +707,50 @@ class Prism_SourceTab_Functions(object):
                 if "max_copyThreads" in sData:
                     projectSettings.sb_copyThreads.setValue(sData["max_copyThreads"])
 
+                if "deviceThreads_hdd" in sData:
+                    projectSettings.sb_deviceThreadsHDD.setValue(sData["deviceThreads_hdd"])
+
+                if "deviceThreads_ssd" in sData:
+                    projectSettings.sb_deviceThreadsSSD.setValue(sData["deviceThreads_ssd"])
+
+                if "deviceThreads_nvme" in sData:
+                    projectSettings.sb_deviceThreadsNVMe.setValue(sData["deviceThreads_nvme"])
+
+                if "deviceThreads_network" in sData:
+                    projectSettings.sb_deviceThreadsNetwork.setValue(sData["deviceThreads_network"])
+
+                if "sequenceCopyThreads" in sData:
+                    projectSettings.sb_sequenceThreads.setValue(sData["sequenceCopyThreads"])
+
                 if "size_copyChunk" in sData:
                     projectSettings.sb_copyChunks.setValue(sData["size_copyChunk"])	
 
+                if "copyBufferCount" in sData:
+                    projectSettings.sb_copyBuffers.setValue(sData["copyBufferCount"])
+
+                if "useKernelCopy" in sData:
+                    projectSettings.chb_kernelCopy.setChecked(sData["useKernelCopy"])
+
+                if "resumeTransfers" in sData:
+                    projectSettings.chb_resumeTransfers.setChecked(sData["resumeTransfers"])
+
+                if "preallocateDest" in sData:
+                    projectSettings.chb_preallocateDest.setChecked(sData["preallocateDest"])
+
+                if "throttleHours" in sData:
+                    projectSettings.le_throttleHours.setText(sData["throttleHours"])
+
                 if "max_proxyThreads" in sData:
                     projectSettings.sb_proxyThreads.setValue(sData["max_proxyThreads"])
 
+                if "hashAlgorithm" in sData:
+                    idx = projectSettings.cb_hashAlgorithm.findText(sData["hashAlgorithm"])
+                    if idx != -1:
+                        projectSettings.cb_hashAlgorithm.setCurrentIndex(idx)
+
+                if "verifyReadBack" in sData:
+                    projectSettings.chb_verifyReadBack.setChecked(sData["verifyReadBack"])
+
                 if "updateInterval" in sData:
                     projectSettings.sp_progUpdateRate.setValue(sData["updateInterval"])
 
@@ -536,8 +804,20 @@ class Prism_SourceTab_Functions(object):
             sData = {
                 "max_thumbThreads": origin.sb_thumbThreads.value(),
                 "max_copyThreads": origin.sb_copyThreads.value(),
+                "deviceThreads_hdd": origin.sb_deviceThreadsHDD.value(),
+                "deviceThreads_ssd": origin.sb_deviceThreadsSSD.value(),
+                "deviceThreads_nvme": origin.sb_deviceThreadsNVMe.value(),
+                "deviceThreads_network": origin.sb_deviceThreadsNetwork.value(),
+                "sequenceCopyThreads": origin.sb_sequenceThreads.value(),
                 "size_copyChunk": origin.sb_copyChunks.value(),
+                "copyBufferCount": origin.sb_copyBuffers.value(),
+                "useKernelCopy": origin.chb_kernelCopy.isChecked(),
+                "resumeTransfers": origin.chb_resumeTransfers.isChecked(),
+                "preallocateDest": origin.chb_preallocateDest.isChecked(),
+                "throttleHours": origin.le_throttleHours.text().strip(),
                 "max_proxyThreads": origin.sb_proxyThreads.value(),
+                "hashAlgorithm": origin.cb_hashAlgorithm.currentText(),
+                "verifyReadBack": origin.chb_verifyReadBack.isChecked(),
                 "updateInterval": origin.sp_progUpdateRate.value(),
                 "useCompletePopup": origin.chb_showPopup.isChecked(),
                 "useCompleteSound": origin.chb_playSound.isChecked(),
@@ -568,6 +848,7 @@ class Prism_SourceTab_Functions(object):
                 tData["enable_frames"] = self.sourceBrowser.b_source_sorting_duration.isChecked()
                 tData["source_combineSeq"] = self.sourceBrowser.b_source_sorting_combineSeqs.isChecked()
                 tData["dest_combineSeq"] = self.sourceBrowser.b_dest_sorting_combineSeqs.isChecked()
+                tData["source_watchDir"] = self.sourceBrowser.watchSourceDir
                 tData["enable_frames"] = self.sourceBrowser.b_source_sorting_duration.isChecked()
                 tData["playerEnabled"] = self.sourceBrowser.b_enablePlayer.isChecked()
                 tData["preferProxies"] = self.sourceBrowser.b_preferProxies.isChecked()
@@ -580,6 +861,9 @@ class Prism_SourceTab_Functions(object):
                 tData["enable_fileNaming"] = functs.chb_ovr_fileNaming.isChecked()
                 tData["enable_metadata"] = functs.chb_ovr_metadata.isChecked()
                 tData["enable_overwrite"] = functs.chb_overwrite.isChecked()
+                tData["enable_sync"] = functs.chb_sync.isChecked()
+                tData["throttleRate"] = functs.sb_throttleRate.value()
+                tData["throttleDestRate"] = functs.sb_throttleDestRate.value()
 
                 self.core.setConfig(cat="sourceTab", param="tabSettings", val=tData, config="project")
 
@@ -658,8 +942,20 @@ class Prism_SourceTab_Functions(object):
                 "globals": {
                     "max_thumbThreads": 6,
                     "max_copyThreads": 6,
+                    "deviceThreads_hdd": 1,
+                    "deviceThreads_ssd": 4,
+                    "deviceThreads_nvme": 6,
+                    "deviceThreads_network": 4,
+                    "sequenceCopyThreads": 8,
                     "size_copyChunk": 2,
+                    "copyBufferCount": 4,
+                    "useKernelCopy": False,
+                    "resumeTransfers": True,
+                    "preallocateDest": True,
+                    "throttleHours": "",
                     "max_proxyThreads": 2,
+                    "hashAlgorithm": "BLAKE2b",
+                    "verifyReadBack": True,
                     "updateInterval": 1,
                     "useCompletePopup": True,
                     "useCompleteSound": True,
@@ -675,6 +971,7 @@ class Prism_SourceTab_Functions(object):
                     "enable_frames": False,
                     "source_combineSeq": True,
                     "dest_combineSeq": True,
+                    "source_watchDir": False,
                     "playerEnabled": True,
                     "preferProxies": True,
                     "enable_proxy": False,
@@ -683,7 +980,10 @@ class Prism_SourceTab_Functions(object):
                     "proxyMode": "None",
                     "enable_fileNaming": False,
                     "enable_metadata": False,
-                    "enable_overwrite": False
+                    "enable_overwrite": False,
+                    "enable_sync": False,
+                    "throttleRate": 0,
+                    "throttleDestRate": 0
                 },
                 "sortOptions": {
                     "source": {